@@ -0,0 +1,324 @@
+# benchmarks/bench_parsers.py
+"""
+HTML 파서 벤치마크
+- 대상: GameDetector.parse_game_board, GameBoardParser.parse_game_results,
+        HTMLParser.get_balance, CasinoParser (단일 순회 / 필드 마스크 / 이전 bs4 다중 순회 비교 기준)
+- 픽스처별 파싱 시간(ms), 피크 메모리, 호출 후 남은 할당(블록/바이트)을 측정
+- 결과는 JSON으로 출력하며, --baseline으로 이전 결과와 비교하여 성능 저하를 검출
+
+사용법:
+    python benchmarks/bench_parsers.py --output bench.json
+    python benchmarks/bench_parsers.py --baseline bench.json --threshold 0.25
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.fixtures import load_board_fixtures, load_lobby_fixtures
+
+
+def _game_detector_cold():
+    """매 폴링마다 새 보드를 처음 파싱하는 경우 (방 입장 직후)"""
+    from modules.game_detector import GameDetector
+
+    def run(html):
+        return GameDetector().parse_game_board(html)["game_count"]
+    return run
+
+
+def _game_detector_cached():
+    """같은 보드를 반복 폴링하는 경우 (결과 변화 없는 틱)"""
+    from modules.game_detector import GameDetector
+    detector = GameDetector()
+
+    def run(html):
+        return detector.parse_game_board(html)["game_count"]
+    return run
+
+
+def _game_board_parser():
+    from modules.game_board_parser import GameBoardParser
+
+    def run(html):
+        return len(GameBoardParser(html).parse_game_results())
+    return run
+
+
+def _html_parser_balance():
+    from utils.parser import HTMLParser
+
+    def run(html):
+        return HTMLParser(html).get_balance()
+    return run
+
+
+def _casino_parser():
+    """한 번의 순회로 모든 필드 추출"""
+    from utils.parser import CasinoParser
+
+    def run(html):
+        return CasinoParser(html).parse()
+    return run
+
+
+def _casino_parser_room_name():
+    """필드 마스크로 방 이름만 추출 (찾으면 순회 조기 종료)"""
+    from utils.parser import CasinoParser, CasinoField
+
+    def run(html):
+        return CasinoParser(html, fields=CasinoField.ROOM_NAME).parse()
+    return run
+
+
+def _casino_parser_multipass():
+    """
+    비교 기준: 이전 CasinoParser 구현 (BeautifulSoup 트리 + 필드마다 find/find_all 순회)
+    """
+    import re
+    from bs4 import BeautifulSoup
+
+    def run(html):
+        soup = BeautifulSoup(html, "html.parser")
+
+        room_element = soup.find(class_="room-name")
+        if room_element:
+            room_name = room_element.text.strip()
+        else:
+            room_name = "알 수 없는 방"
+            title_element = soup.find("title")
+            if title_element:
+                match = re.search(r"(.+?)(?:\s*-\s*|$)", title_element.text.strip())
+                if match:
+                    room_name = match.group(1).strip()
+
+        status_element = soup.find(class_="game-status")
+        game_status = status_element.text.strip() if status_element else None
+
+        betting_options = [
+            element.get("data-name", element.text.strip())
+            for element in soup.find_all(class_="betting-option")
+        ]
+
+        last_results = []
+        for element in soup.find_all(class_="game-result"):
+            result_class = element.get("class", [])
+            if "player-win" in result_class:
+                last_results.append("P")
+            elif "banker-win" in result_class:
+                last_results.append("B")
+            elif "tie" in result_class:
+                last_results.append("T")
+            else:
+                last_results.append(element.text.strip())
+
+        bet_amounts = {}
+        for element in soup.find_all(class_="bet-amount"):
+            amount = re.sub(r"[^\d]", "", element.text.strip())
+            if amount.isdigit():
+                bet_amounts[element.get("data-option", "unknown")] = int(amount)
+
+        return {
+            "room_name": room_name,
+            "game_status": game_status,
+            "betting_options": betting_options,
+            "last_results": last_results,
+            "bet_amounts": bet_amounts,
+        }
+    return run
+
+
+# (벤치마크 이름, 픽스처 종류, 실행 함수 생성기)
+BENCHMARKS = (
+    ("GameDetector.parse_game_board[cold]", "board", _game_detector_cold),
+    ("GameDetector.parse_game_board[cached]", "board", _game_detector_cached),
+    ("GameBoardParser.parse_game_results", "board", _game_board_parser),
+    ("HTMLParser.get_balance", "lobby", _html_parser_balance),
+    ("CasinoParser[single-pass]", "lobby", _casino_parser),
+    ("CasinoParser[single-pass,room_name]", "lobby", _casino_parser_room_name),
+    ("CasinoParser[multi-pass bs4 baseline]", "lobby", _casino_parser_multipass),
+)
+
+
+def measure(run, html, repeat=50, warmup=3):
+    """
+    파서 1개를 픽스처 1개로 측정
+
+    Args:
+        run (callable): HTML을 받아 파싱하는 함수
+        html (str): 픽스처 HTML
+        repeat (int): 시간 측정 반복 횟수
+        warmup (int): 측정 전 예열 횟수
+
+    Returns:
+        dict: 측정 결과
+    """
+    result = None
+    for _ in range(warmup):
+        result = run(html)
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run(html)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    # 메모리는 시간 측정과 분리하여 1회만 추적 (tracemalloc 오버헤드 제외)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        base_current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        run(html)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    diff = [stat for stat in after.compare_to(before, "filename") if stat.size_diff > 0]
+
+    return {
+        "result": result if isinstance(result, (int, str, type(None))) else repr(result)[:200],
+        "time_ms": {
+            "min": round(min(timings), 4),
+            "median": round(statistics.median(timings), 4),
+            "mean": round(statistics.fmean(timings), 4),
+            "max": round(max(timings), 4),
+        },
+        "peak_bytes": peak - base_current,
+        "retained_bytes": sum(stat.size_diff for stat in diff),
+        "retained_blocks": sum(stat.count_diff for stat in diff),
+    }
+
+
+def run_benchmarks(fixtures_dir=None, repeat=50, only=None):
+    """
+    전체 벤치마크 실행
+
+    Args:
+        fixtures_dir (str, optional): 캡처한 픽스처 HTML 디렉터리
+        repeat (int): 반복 횟수
+        only (str, optional): 이름에 이 문자열이 포함된 벤치마크만 실행
+
+    Returns:
+        dict: JSON으로 저장할 결과
+    """
+    fixtures = {
+        "board": load_board_fixtures(fixtures_dir),
+        "lobby": load_lobby_fixtures(fixtures_dir),
+    }
+
+    results = []
+    skipped = []
+    for name, kind, factory in BENCHMARKS:
+        if only and only not in name:
+            continue
+
+        try:
+            run = factory()
+        except ImportError as e:
+            # 의존성(bs4 등)이 없는 환경에서는 해당 파서만 건너뜀
+            skipped.append({"parser": name, "reason": str(e)})
+            continue
+
+        for fixture_name, html in fixtures[kind].items():
+            try:
+                measurement = measure(run, html, repeat=repeat)
+            except Exception as e:
+                skipped.append({"parser": name, "fixture": fixture_name, "reason": f"{type(e).__name__}: {e}"})
+                continue
+
+            results.append({
+                "parser": name,
+                "fixture": fixture_name,
+                "html_bytes": len(html.encode("utf-8")),
+                **measurement,
+            })
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def find_regressions(report, baseline, threshold=0.25):
+    """
+    이전 결과 대비 중앙값이 threshold 비율 이상 느려진 항목 찾기
+
+    Returns:
+        list: [{'parser', 'fixture', 'baseline_ms', 'current_ms', 'ratio'}, ...]
+    """
+    previous = {
+        (item["parser"], item["fixture"]): item["time_ms"]["median"]
+        for item in baseline.get("results", [])
+    }
+
+    regressions = []
+    for item in report["results"]:
+        base_ms = previous.get((item["parser"], item["fixture"]))
+        if not base_ms:
+            continue
+        current_ms = item["time_ms"]["median"]
+        ratio = current_ms / base_ms
+        if ratio > 1 + threshold:
+            regressions.append({
+                "parser": item["parser"],
+                "fixture": item["fixture"],
+                "baseline_ms": base_ms,
+                "current_ms": current_ms,
+                "ratio": round(ratio, 3),
+            })
+    return regressions
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="HTML 파서 벤치마크")
+    arg_parser.add_argument("--fixtures", help="캡처한 픽스처 HTML 디렉터리 (board_<셀 수>.html, lobby_<이름>.html)")
+    arg_parser.add_argument("--repeat", type=int, default=50, help="측정 반복 횟수")
+    arg_parser.add_argument("--only", help="이름에 이 문자열이 포함된 파서만 실행")
+    arg_parser.add_argument("--output", help="결과 JSON 저장 경로 (없으면 표준 출력)")
+    arg_parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    arg_parser.add_argument("--threshold", type=float, default=0.25, help="성능 저하 판정 비율 (0.25 = 25%%)")
+    args = arg_parser.parse_args(argv)
+
+    report = run_benchmarks(args.fixtures, repeat=args.repeat, only=args.only)
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        report["regressions"] = find_regressions(report, baseline, args.threshold)
+        if report["regressions"]:
+            exit_code = 1
+            for item in report["regressions"]:
+                print(f"[REGRESSION] {item['parser']} / {item['fixture']}: "
+                      f"{item['baseline_ms']}ms -> {item['current_ms']}ms (x{item['ratio']})", file=sys.stderr)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+# benchmarks/fixtures.py
+"""
+파서 벤치마크용 HTML 픽스처
+- 실제 게임 iframe / 로비 페이지에서 캡처한 구조를 익명화하여 재구성한 HTML
+- 보드 크기: 빈 보드, 10, 36, 60, 72셀 (+ 슈 끝 무렵 84셀)
+- 캡처한 HTML 파일이 있으면 디렉터리에서 그대로 읽어 사용 (board_<셀 수>.html, lobby_<이름>.html)
+"""
+import os
+import random
+
+BOARD_SIZES = (0, 10, 36, 60, 72, 84)
+Y_MAX = 6
+
+# 실제 iframe과 비슷한 크기를 만들기 위한 반복 마크업 (채팅, 통계, 베팅 영역 등)
+_FILLER_BLOCK = (
+    '<div class="Chat--a1b2c"><span class="Typography--d2c9a" data-role="chat-line">'
+    'user***: good luck</span></div>'
+    '<div class="Stats--e3f4" data-role="statistics"><span>P 45%</span><span>B 47%</span>'
+    '<span>T 8%</span></div>'
+    '<svg class="Icon--x9y8" viewBox="0 0 24 24"><path d="M12 2L2 7l10 5 10-5-10-5z"/></svg>'
+)
+
+_CELL_NAMES = {"P": "Player", "B": "Banker", "T": "Tie"}
+_CELL_COLORS = {"P": "#2e64fe", "B": "#e02020", "T": "#1c8c3c"}
+
+
+def _filler(count):
+    """반복 마크업 생성"""
+    return _FILLER_BLOCK * count
+
+
+def make_results(count, seed=20240301):
+    """
+    재현 가능한 P/B/T 결과 시퀀스 생성
+
+    Args:
+        count (int): 결과 개수
+        seed (int): 난수 시드
+
+    Returns:
+        list: 'P', 'B', 'T' 목록
+    """
+    rng = random.Random(seed)
+    return rng.choices(["P", "B", "T"], weights=[45, 46, 9], k=count)
+
+
+def _cell_html(index, result_type):
+    """Bead-road 좌표 셀 1개"""
+    x, y = divmod(index, Y_MAX)
+    name = _CELL_NAMES[result_type]
+    return (
+        f'<svg data-type="coordinates" data-x="{x}" data-y="{y}" class="{name.lower()}" '
+        f'x="{x * 22}" y="{y * 22}" width="22" height="22">'
+        f'<svg data-type="roadItem" name="{name} BeadRoadItem" viewBox="0 0 22 22">'
+        f'<circle cx="11" cy="11" r="10" fill="{_CELL_COLORS[result_type]}"></circle>'
+        f'<text x="11" y="15" text-anchor="middle" fill="#fff">{result_type}</text>'
+        f'</svg></svg>'
+    )
+
+
+def make_board_html(cell_count, filler=120):
+    """
+    게임 iframe HTML 생성 (Bead-road 포함)
+
+    Args:
+        cell_count (int): 보드 셀 개수 (0이면 빈 보드)
+        filler (int): 보드 앞뒤에 붙일 반복 마크업 개수
+
+    Returns:
+        str: HTML
+    """
+    cells = "".join(_cell_html(i, r) for i, r in enumerate(make_results(cell_count)))
+    return (
+        '<!DOCTYPE html><html><head><title>Speed Baccarat A - Live Casino</title></head><body>'
+        '<div id="root"><div class="GameContainer--f5a6">'
+        + _filler(filler // 2)
+        + '<div class="RoadContainer--c7d8"><svg data-role="Bead-road" viewBox="0 0 308 132">'
+        + '<rect width="308" height="132" fill="#fff"></rect>'
+        + cells
+        + '</svg></div>'
+        + _filler(filler - filler // 2)
+        + '</div></div></body></html>'
+    )
+
+
+def make_lobby_html(variant, filler=200):
+    """
+    로비/사이트 페이지 HTML 생성
+
+    Args:
+        variant (str): 'balance_span' (클래스 기반 잔액), 'site1_nav' (1번 사이트 "캐쉬 :" 링크),
+                       'text_only' (텍스트 패턴만 있는 페이지), 'casino' (CasinoParser 대상 게임 페이지)
+        filler (int): 반복 마크업 개수
+
+    Returns:
+        str: HTML
+    """
+    if variant == "balance_span":
+        body = '<header><span class="username">tester01</span><span class="balance">1,234,500원</span></header>'
+    elif variant == "site1_nav":
+        body = (
+            '<nav><strong>tester01</strong> 회원님 환영합니다!'
+            '<a class="nav-link" href="#ModalDeposit">캐쉬 : <strong class="fontcolor_yellow">987,000</strong></a></nav>'
+        )
+    elif variant == "text_only":
+        body = '<div class="footer-info"><p>보유 캐쉬 : 45,000 원</p></div>'
+    elif variant == "casino":
+        options = "".join(
+            f'<div class="betting-option" data-name="{name}">{name}</div>'
+            for name in ("Player", "Banker", "Tie")
+        )
+        results = "".join(
+            f'<span class="game-result {"player-win" if r == "P" else "banker-win" if r == "B" else "tie"}">{r}</span>'
+            for r in make_results(10)
+        )
+        amounts = "".join(
+            f'<span class="bet-amount" data-option="{name}">{amount:,}</span>'
+            for name, amount in (("Player", 5000), ("Banker", 0), ("Tie", 1000))
+        )
+        body = (
+            '<div class="room-name">Speed Baccarat A</div>'
+            '<div class="game-status">BETTING</div>'
+            f'{options}{results}{amounts}'
+        )
+    else:
+        raise ValueError(f"알 수 없는 로비 픽스처: {variant}")
+
+    return (
+        '<!DOCTYPE html><html><head><title>Speed Baccarat A - Live Casino</title></head><body>'
+        + _filler(filler // 2) + body + _filler(filler - filler // 2)
+        + '</body></html>'
+    )
+
+
+LOBBY_VARIANTS = ("balance_span", "site1_nav", "text_only", "casino")
+
+
+def _read_captured(fixtures_dir, prefix):
+    """캡처한 픽스처 파일 읽기 {이름: HTML}"""
+    captured = {}
+    if not fixtures_dir or not os.path.isdir(fixtures_dir):
+        return captured
+
+    for file_name in sorted(os.listdir(fixtures_dir)):
+        if file_name.startswith(prefix) and file_name.endswith(".html"):
+            with open(os.path.join(fixtures_dir, file_name), encoding="utf-8") as f:
+                captured[file_name[:-len(".html")]] = f.read()
+    return captured
+
+
+def load_board_fixtures(fixtures_dir=None):
+    """
+    보드 픽스처 로드 (캡처 파일 우선, 없으면 생성)
+
+    Returns:
+        dict: {'board_<셀 수>': HTML}
+    """
+    fixtures = {f"board_{size}": make_board_html(size) for size in BOARD_SIZES}
+    fixtures.update(_read_captured(fixtures_dir, "board_"))
+    return fixtures
+
+
+def load_lobby_fixtures(fixtures_dir=None):
+    """
+    로비 픽스처 로드 (캡처 파일 우선, 없으면 생성)
+
+    Returns:
+        dict: {'lobby_<이름>': HTML}
+    """
+    fixtures = {f"lobby_{variant}": make_lobby_html(variant) for variant in LOBBY_VARIANTS}
+    fixtures.update(_read_captured(fixtures_dir, "lobby_"))
+    return fixtures
@@ -57,6 +57,7 @@ hidden_imports = [
     'numpy',
     'psutil',
     'websockets',
+    'qasync',
     'urllib3',
     'json',
     're',
@@ -3,6 +3,7 @@ import os
 from PyQt6.QtWidgets import QApplication, QMessageBox
 from ui.login_window import LoginWindow
 from ui.main_window import MainWindow
+from utils.async_bridge import run_app
 import urllib3
 import logging
 
@@ -117,7 +118,8 @@ if __name__ == "__main__":
         # 애플리케이션 시작
         logging.info("애플리케이션 시작")
         app = MainApp(sys.argv)
-        sys.exit(app.exec())
+        # Qt 루프에 asyncio 루프를 연결하여 실행 (매매 엔진 코루틴)
+        sys.exit(run_app(app))
         
     except Exception as e:
         logging.critical(f"애플리케이션 실행 중 치명적 오류: {e}", exc_info=True)
@@ -0,0 +1,126 @@
+# modules/balance_script.py
+"""
+페이지 안에서 한 번에 실행하는 로비 잔액 추출 스크립트
+
+LOBBY_BALANCE_SCRIPT
+- BalanceService의 잔액 찾기 방법 7가지를 페이지 안에서 모두 실행하여 후보를 한 번에 수집
+  (span 전체 순회, 통화 기호 XPath, 소스 정규식도 요소마다 WebDriver 왕복 없이 처리)
+- 넘겨받은 방법 순서(사이트별 마지막 성공 방법 우선)대로 후보를 정렬하여 반환
+- 로비 iframe으로 전환한 뒤 Selenium execute_script로 실행
+
+arguments:
+    [0] 방법 이름 순서 (LOBBY_BALANCE_STRATEGIES 중)
+
+반환값:
+    {candidates: [{strategy, value}, ...], elapsed_ms}
+"""
+
+# 잔액 찾기 방법 (원래 우선순위 순, BalanceService._lobby_balance_strategies와 같은 이름)
+LOBBY_BALANCE_STRATEGIES = (
+    "balance-label-value",
+    "header-balance",
+    "Typography header-balance",
+    "Typography",
+    "span 태그",
+    "XPath",
+    "정규식",
+)
+
+LOBBY_BALANCE_SCRIPT = r"""
+var order = arguments[0];
+var started = Date.now();
+var CURRENCY = /[₩원]/;
+
+function shown(el) {
+    return el.getClientRects().length > 0;
+}
+function textOf(el) {
+    return (el.innerText || el.textContent || '').trim();
+}
+function digits(text) {
+    var d = (text || '').replace(/[^\d]/g, '');
+    return d ? parseInt(d, 10) : null;
+}
+function largest(text) {
+    var numbers = (text || '').replace(/[,.]/g, '').match(/\d+/g);
+    if (!numbers) { return null; }
+    var value = Math.max.apply(null, numbers.map(Number));
+    return value > 100 ? value : null;
+}
+function bySelector(selector) {
+    var el = document.querySelector(selector);
+    return el && shown(el) ? digits(textOf(el)) : null;
+}
+
+var strategies = {
+    'balance-label-value': function () {
+        return bySelector("span[data-role='balance-label-value']");
+    },
+    'header-balance': function () {
+        return bySelector("[data-role='header-balance']");
+    },
+    'Typography header-balance': function () {
+        return bySelector("span.Typography--d2c9a[data-role='header-balance']");
+    },
+    'Typography': function () {
+        var found = document.querySelectorAll('.Typography--d2c9a');
+        for (var i = 0; i < found.length; i++) {
+            var text = textOf(found[i]);
+            if (shown(found[i]) && CURRENCY.test(text)) { return digits(text); }
+        }
+        return null;
+    },
+    'span 태그': function () {
+        var spans = document.getElementsByTagName('span');
+        for (var i = 0; i < spans.length; i++) {
+            var text = textOf(spans[i]);
+            if (!/\d/.test(text) || !shown(spans[i])) { continue; }
+            if (CURRENCY.test(text) || (text.match(/\d/g) || []).length >= 3) {
+                var value = digits(text);
+                if (value > 100) { return value; }
+            }
+        }
+        return null;
+    },
+    'XPath': function () {
+        var found = document.evaluate(
+            "//*[contains(text(), '₩') or contains(text(), '원')]",
+            document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        for (var i = 0; i < found.snapshotLength; i++) {
+            var el = found.snapshotItem(i);
+            if (!shown(el)) { continue; }
+            var value = largest(textOf(el));
+            if (value) { return value; }
+        }
+        return null;
+    },
+    '정규식': function () {
+        var html = document.documentElement.outerHTML;
+        var patterns = [
+            [/₩\s*[\d,]+/g, 0],
+            [/₩⁩([\d,]+)/g, 1],
+            [/header-balance[^>]*>([^<]*\d[^<]*)/g, 1],
+            [/balance[^>]*>([^<]*\d[^<]*)/g, 1]
+        ];
+        for (var i = 0; i < patterns.length; i++) {
+            var match;
+            while ((match = patterns[i][0].exec(html)) !== null) {
+                var value = largest(match[patterns[i][1]]);
+                if (value) { return value; }
+            }
+        }
+        return null;
+    }
+};
+
+var candidates = [];
+for (var i = 0; i < order.length; i++) {
+    var strategy = strategies[order[i]];
+    if (!strategy) { continue; }
+    var value = null;
+    try { value = strategy(); } catch (e) { value = null; }
+    if (value) { candidates.push({strategy: order[i], value: value}); }
+}
+return {candidates: candidates, elapsed_ms: Date.now() - started};
+"""
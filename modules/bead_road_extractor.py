@@ -0,0 +1,285 @@
+# modules/bead_road_extractor.py
+"""
+Bead-road(게임 결과 보드) 전용 고속 추출 모듈
+- BeautifulSoup 트리를 만들지 않고 C 기반 정규식 스캐너로 HTML을 한 번만 훑습니다.
+- svg 태그 깊이를 추적하여 Bead-road 영역과 각 좌표 셀의 범위를 찾습니다.
+"""
+import re
+
+# Y축 길이 (한 열에 몇 개의 결과가 들어가는지)
+Y_MAX = 6
+
+_BEAD_ROAD_RE = re.compile(r'<svg\b[^>]*?\bdata-role\s*=\s*["\']Bead-road["\'][^>]*>', re.IGNORECASE)
+_SVG_TAG_RE = re.compile(r'<(/?)svg\b[^>]*>', re.IGNORECASE)
+_COORD_TYPE_RE = re.compile(r'\bdata-type\s*=\s*["\']coordinates["\']', re.IGNORECASE)
+_DATA_X_RE = re.compile(r'\bdata-x\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+_DATA_Y_RE = re.compile(r'\bdata-y\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+_TEXT_RE = re.compile(r'<text[^>]*>([^<]+)</text>')
+_NAME_RE = re.compile(r'name="([^"]+)"')
+
+
+def find_bead_road(html_content):
+    """
+    Bead-road svg 영역의 범위를 찾습니다.
+
+    Args:
+        html_content (str): HTML 소스 코드
+
+    Returns:
+        tuple: (시작 위치, 끝 위치) 또는 None (보드가 없는 경우)
+    """
+    if not html_content:
+        return None
+
+    match = _BEAD_ROAD_RE.search(html_content)
+    if not match:
+        return None
+
+    start = match.start()
+    if match.group(0).endswith("/>"):
+        return start, match.end()
+
+    depth = 1
+    for tag in _SVG_TAG_RE.finditer(html_content, match.end()):
+        if tag.group(1):
+            depth -= 1
+            if depth == 0:
+                return start, tag.end()
+        elif not tag.group(0).endswith("/>"):
+            depth += 1
+
+    # 닫는 태그가 없으면 문서 끝까지를 보드로 간주
+    return start, len(html_content)
+
+
+def iter_cells(html_content, board_span):
+    """
+    Bead-road 영역 안의 좌표 셀을 순서대로 돌려줍니다.
+
+    Args:
+        html_content (str): HTML 소스 코드
+        board_span (tuple): find_bead_road()가 반환한 (시작, 끝) 위치
+
+    Yields:
+        tuple: (x, y, 셀 시작 위치, 셀 끝 위치)
+    """
+    for x, y, start, end, _ in iter_cells_from(html_content, board_span):
+        yield x, y, start, end
+
+
+def iter_cells_from(html_content, board_span, start=None, depth=0):
+    """
+    Bead-road 영역의 start 위치부터 좌표 셀을 돌려줍니다. (이전 폴링 이후 추가된 셀만 읽을 때 사용)
+
+    Args:
+        html_content (str): HTML 소스 코드
+        board_span (tuple): find_bead_road()가 반환한 (시작, 끝) 위치
+        start (int, optional): 읽기 시작 위치 (없으면 보드 시작)
+        depth (int): start 위치의 svg 태그 깊이
+
+    Yields:
+        tuple: (x, y, 셀 시작 위치, 셀 끝 위치, 셀 끝 위치의 svg 태그 깊이)
+    """
+    board_start, board_end = board_span
+    cell = None  # (x, y, 시작 위치, 셀이 열린 깊이)
+
+    for tag in _SVG_TAG_RE.finditer(html_content, board_start if start is None else start, board_end):
+        tag_text = tag.group(0)
+
+        if tag.group(1):
+            depth -= 1
+            if cell and depth == cell[3]:
+                yield cell[0], cell[1], cell[2], tag.end(), depth
+                cell = None
+            continue
+
+        self_closing = tag_text.endswith("/>")
+
+        if cell is None and _COORD_TYPE_RE.search(tag_text):
+            try:
+                x_match = _DATA_X_RE.search(tag_text)
+                y_match = _DATA_Y_RE.search(tag_text)
+                x = int(x_match.group(1)) if x_match else 0
+                y = int(y_match.group(1)) if y_match else 0
+            except ValueError as e:
+                print(f"결과 파싱 중 오류: {e}")
+            else:
+                if self_closing:
+                    yield x, y, tag.start(), tag.end(), depth
+                else:
+                    cell = (x, y, tag.start(), depth)
+
+        if not self_closing:
+            depth += 1
+
+    # 닫히지 않은 셀은 보드 끝까지로 처리
+    if cell:
+        yield cell[0], cell[1], cell[2], board_end, cell[3]
+
+
+def decode_cell(html_content, start=0, end=None):
+    """
+    좌표 셀 HTML 조각에서 결과 유형을 판별합니다.
+    문자열을 잘라 복사하지 않도록 시작/끝 위치 안에서만 검색합니다.
+
+    Args:
+        html_content (str): HTML 소스 코드 (또는 셀 조각)
+        start (int): 셀 시작 위치
+        end (int, optional): 셀 끝 위치 (없으면 문자열 끝)
+
+    Returns:
+        str: 'P', 'B', 'T' 또는 'unknown'
+    """
+    if end is None:
+        end = len(html_content)
+
+    # <text> 태그 내용 직접 사용
+    text_match = _TEXT_RE.search(html_content, start, end)
+    if text_match:
+        text_content = text_match.group(1).strip()
+        if text_content in ("P", "B", "T"):
+            return text_content
+        return "unknown"
+
+    # <text> 태그를 찾지 못한 경우 name 속성으로 백업
+    name_match = _NAME_RE.search(html_content, start, end)
+    if name_match:
+        item_name = name_match.group(1).lower()
+        if "tie" in item_name:
+            return "T"
+        elif "player" in item_name:
+            return "P"
+        elif "banker" in item_name:
+            return "B"
+
+    return "unknown"
+
+
+def game_number(x, y):
+    """좌표를 게임 번호로 변환 (y축으로 먼저 채우고, 다음 x축으로 이동)"""
+    return x * Y_MAX + y + 1
+
+
+def extract_cells(html_content):
+    """
+    HTML에서 Bead-road 셀을 모두 추출합니다.
+
+    Args:
+        html_content (str): HTML 소스 코드
+
+    Returns:
+        list: [(x, y, result_type, game_number), ...] 게임 번호 순으로 정렬된 목록
+    """
+    board_span = find_bead_road(html_content)
+    if not board_span:
+        return []
+
+    results = [
+        (x, y, decode_cell(html_content, start, end), game_number(x, y))
+        for x, y, start, end in iter_cells(html_content, board_span)
+    ]
+    results.sort(key=lambda r: r[3])
+    return results
+
+
+# 브라우저(게임 iframe) 안에서 실행하는 Bead-road 추출 스크립트
+# - page_source 전체를 전송하지 않고 "x,y,R;x,y,R;..." 형태의 압축 문자열만 반환
+# - R은 P/B/T 또는 U(알 수 없음), 보드가 없으면 null 반환
+# - 판별 규칙은 decode_cell()과 동일 (<text> 내용 우선, 없으면 name 속성)
+BEAD_ROAD_SCRIPT = """
+var board = document.querySelector('svg[data-role="Bead-road" i]');
+if (!board) { return null; }
+var cells = board.querySelectorAll('svg[data-type="coordinates" i]');
+var out = [];
+for (var i = 0; i < cells.length; i++) {
+    var cell = cells[i];
+    if (cell.parentElement && cell.parentElement.closest('svg[data-type="coordinates" i]')) { continue; }
+    var result = 'U';
+    var text = cell.querySelector('text');
+    if (text) {
+        var value = (text.textContent || '').trim();
+        if (value === 'P' || value === 'B' || value === 'T') { result = value; }
+    } else {
+        var named = cell.hasAttribute('name') ? cell : cell.querySelector('[name]');
+        if (named) {
+            var name = named.getAttribute('name').toLowerCase();
+            if (name.indexOf('tie') >= 0) { result = 'T'; }
+            else if (name.indexOf('player') >= 0) { result = 'P'; }
+            else if (name.indexOf('banker') >= 0) { result = 'B'; }
+        }
+    }
+    out.push((parseInt(cell.getAttribute('data-x'), 10) || 0) + ',' +
+             (parseInt(cell.getAttribute('data-y'), 10) || 0) + ',' + result);
+}
+return out.join(';');
+"""
+
+_PACKED_RESULTS = {"P": "P", "B": "B", "T": "T"}
+
+
+def iter_packed_cells(packed):
+    """
+    BEAD_ROAD_SCRIPT가 반환한 압축 문자열을 셀 단위로 풉니다.
+
+    Args:
+        packed (str): "x,y,R;x,y,R;..." 형태의 문자열
+
+    Yields:
+        tuple: (x, y, result_type)
+    """
+    if not packed:
+        return
+
+    for item in packed.split(";"):
+        try:
+            x, y, result = item.split(",")
+            yield int(x), int(y), _PACKED_RESULTS.get(result, "unknown")
+        except ValueError as e:
+            print(f"결과 파싱 중 오류: {e}")
+
+
+# Bead-road에 새 셀이 추가될 때마다 결과를 밀어주는 MutationObserver 설치 스크립트
+# - arguments[0]: CDP 바인딩 이름 (Runtime.addBinding으로 등록된 함수)
+# - 바인딩이 없으면 console.debug("<바인딩 이름>:<payload>")로 대체 전송
+# - payload: "셀 개수|x,y,R" (마지막 셀), 이미 설치되어 있으면 다시 설치
+# - 보드가 없으면 false 반환
+BEAD_ROAD_OBSERVER_SCRIPT = """
+var bindingName = arguments[0];
+var board = document.querySelector('svg[data-role="Bead-road" i]');
+if (!board) { return false; }
+if (window.__beadRoadObserver) { window.__beadRoadObserver.disconnect(); }
+var selector = 'svg[data-type="coordinates" i]';
+var lastCount = board.querySelectorAll(selector).length;
+function decode(cell) {
+    var text = cell.querySelector('text');
+    if (text) {
+        var value = (text.textContent || '').trim();
+        return (value === 'P' || value === 'B' || value === 'T') ? value : 'U';
+    }
+    var named = cell.hasAttribute('name') ? cell : cell.querySelector('[name]');
+    if (!named) { return 'U'; }
+    var name = named.getAttribute('name').toLowerCase();
+    if (name.indexOf('tie') >= 0) { return 'T'; }
+    if (name.indexOf('player') >= 0) { return 'P'; }
+    if (name.indexOf('banker') >= 0) { return 'B'; }
+    return 'U';
+}
+function push(payload) {
+    if (typeof window[bindingName] === 'function') { window[bindingName](payload); }
+    else { console.debug(bindingName + ':' + payload); }
+}
+window.__beadRoadObserver = new MutationObserver(function () {
+    var cells = board.querySelectorAll(selector);
+    if (cells.length === lastCount) { return; }
+    lastCount = cells.length;
+    var latest = null, latestNumber = -1;
+    for (var i = 0; i < cells.length; i++) {
+        var x = parseInt(cells[i].getAttribute('data-x'), 10) || 0;
+        var y = parseInt(cells[i].getAttribute('data-y'), 10) || 0;
+        if (x * 6 + y > latestNumber) { latestNumber = x * 6 + y; latest = [x, y, cells[i]]; }
+    }
+    push(cells.length + '|' + (latest ? latest[0] + ',' + latest[1] + ',' + decode(latest[2]) : ''));
+});
+window.__beadRoadObserver.observe(board, {childList: true, subtree: true, characterData: true});
+return true;
+"""
@@ -0,0 +1,178 @@
+# modules/bet_plan_script.py
+"""
+페이지 안에서 한 번에 실행하는 베팅 스크립트
+
+BET_PLAN_SCRIPT
+- 베팅 영역/칩 요소 확인 → 칩 활성 상태 검증 → 칩/영역 클릭 계획 실행 → 베팅 금액 확인까지 스크립트 1회로 처리
+- 칩이 하나라도 없거나 비활성화되어 있으면 아무것도 클릭하지 않고 실패를 반환 (부분 베팅 방지)
+- 고정 대기 대신 총 베팅 금액 표시가 바뀌는 즉시 확인 후 반환 (Promise 반환)
+- Selenium execute_script와 CDP Runtime.evaluate(awaitPromise) 모두에서 같은 스크립트 사용
+
+arguments:
+    [0] 베팅 영역 선택자 목록
+    [1] 클릭 계획 [[칩 금액, [칩 선택자, ...], 영역 클릭 횟수], ...]
+    [2] 총 베팅 금액 선택자 목록
+    [3] 예상 베팅 금액
+    [4] 금액 확인 최대 대기 시간 (ms)
+    [5] 클릭 사이 간격 (ms, 사이트가 칩 선택을 반영할 시간)
+
+반환값:
+    {ok, error, amount, before, expected, confirmed, clicks, elapsed_ms, click_ms, confirm_ms}
+    error: 'area_not_found', 'chip_not_found', 'chip_disabled', 'not_confirmed' 또는 null
+    click_ms/confirm_ms: 칩/영역 클릭에 걸린 시간, 클릭 후 금액 확인까지 걸린 시간 (클릭 전에 실패하면 null)
+"""
+
+BET_PLAN_SCRIPT = """
+var areaSelectors = arguments[0], plan = arguments[1], amountSelectors = arguments[2];
+var expected = arguments[3], confirmTimeout = arguments[4], stepDelay = arguments[5];
+var started = Date.now();
+
+function visible(el) {
+    if (!el || el.getClientRects().length === 0) { return false; }
+    var style = el.ownerDocument.defaultView.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+}
+function first(selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var found;
+        try { found = document.querySelectorAll(selectors[i]); } catch (e) { continue; }
+        for (var j = 0; j < found.length; j++) {
+            if (visible(found[j])) { return found[j]; }
+        }
+    }
+    return null;
+}
+function readAmount() {
+    for (var i = 0; i < amountSelectors.length; i++) {
+        var el = document.querySelector(amountSelectors[i]);
+        if (el) { return parseInt((el.textContent || '').replace(/[^0-9]/g, ''), 10) || 0; }
+    }
+    return 0;
+}
+function disabled(el) {
+    var className = (typeof el.className === 'string' ? el.className : el.getAttribute('class')) || '';
+    return className.indexOf('disabled') !== -1 || !!el.disabled || el.getAttribute('aria-disabled') === 'true';
+}
+function sleep(ms) { return new Promise(function (resolve) { setTimeout(resolve, ms); }); }
+function result(ok, error, extra) {
+    var out = {ok: ok, error: error, amount: 0, before: 0, expected: expected, confirmed: false,
+               clicks: 0, elapsed_ms: 0, click_ms: null, confirm_ms: null};
+    for (var key in extra) { out[key] = extra[key]; }
+    out.elapsed_ms = Date.now() - started;
+    return out;
+}
+
+return (async function () {
+    var area = first(areaSelectors);
+    if (!area) { return result(false, 'area_not_found', {}); }
+
+    // 클릭 전에 모든 칩을 확인 (하나라도 문제가 있으면 아무것도 클릭하지 않음)
+    var steps = [];
+    for (var i = 0; i < plan.length; i++) {
+        var chip = first(plan[i][1]);
+        if (!chip) { return result(false, 'chip_not_found', {chip: plan[i][0]}); }
+        if (disabled(chip)) { return result(false, 'chip_disabled', {chip: plan[i][0]}); }
+        steps.push([chip, plan[i][2]]);
+    }
+
+    var before = readAmount();
+    var clicks = 0;
+    var clickStarted = Date.now();
+    area.scrollIntoView({block: 'center'});
+    for (var s = 0; s < steps.length; s++) {
+        steps[s][0].click();
+        await sleep(stepDelay);
+        for (var n = 0; n < steps[s][1]; n++) {
+            area.click();
+            clicks++;
+            await sleep(stepDelay);
+        }
+    }
+
+    // 사이트가 베팅을 반영하면 바로 반환 (최대 confirmTimeout)
+    var clicked = Date.now();
+    var amount = readAmount();
+    while (amount < before + expected && Date.now() - clicked < confirmTimeout) {
+        await sleep(50);
+        amount = readAmount();
+    }
+    var confirmed = amount >= before + expected;
+    var placed = amount > before;
+    return result(placed, placed ? null : 'not_confirmed',
+                  {amount: amount, before: before, confirmed: confirmed, clicks: clicks,
+                   click_ms: clicked - clickStarted, confirm_ms: Date.now() - clicked});
+})();
+"""
+
+
+"""
+BETTING_OPEN_SCRIPT
+- 칩이 보이고 disabled 상태가 풀리는 순간(베팅 창 열림)에 바로 완료되는 Promise
+- MutationObserver로 DOM/클래스 변경을 감지하고, 놓친 변경은 짧은 주기 확인으로 보완
+- 열렸을 때 베팅 창 남은 시간(카운트다운 표시)을 함께 반환
+
+arguments:
+    [0] 칩 선택자 목록
+    [1] 카운트다운 선택자 목록
+    [2] 최대 대기 시간 (ms)
+
+반환값:
+    {open, waited_ms, remaining, timer}
+    remaining: 남은 시간 (초, 카운트다운을 찾지 못하면 null)
+"""
+
+BETTING_OPEN_SCRIPT = """
+var chipSelectors = arguments[0], timerSelectors = arguments[1], timeout = arguments[2];
+var started = Date.now();
+
+function chipOpen() {
+    for (var i = 0; i < chipSelectors.length; i++) {
+        var found;
+        try { found = document.querySelectorAll(chipSelectors[i]); } catch (e) { continue; }
+        for (var j = 0; j < found.length; j++) {
+            var el = found[j];
+            if (el.getClientRects().length === 0) { continue; }
+            var className = (typeof el.className === 'string' ? el.className : el.getAttribute('class')) || '';
+            if (className.indexOf('disabled') === -1 && !el.disabled && el.getAttribute('aria-disabled') !== 'true') {
+                return true;
+            }
+        }
+    }
+    return false;
+}
+function remaining() {
+    for (var i = 0; i < timerSelectors.length; i++) {
+        var el;
+        try { el = document.querySelector(timerSelectors[i]); } catch (e) { continue; }
+        if (!el) { continue; }
+        var match = (el.textContent || '').match(/\\d+/);
+        if (match) { return {seconds: parseInt(match[0], 10), selector: timerSelectors[i]}; }
+    }
+    return {seconds: null, selector: null};
+}
+function result(open) {
+    var timer = open ? remaining() : {seconds: null, selector: null};
+    return {open: open, waited_ms: Date.now() - started, remaining: timer.seconds, timer: timer.selector};
+}
+
+if (chipOpen()) { return result(true); }
+
+return new Promise(function (resolve) {
+    var done = false, observer = null, poll = null, limit = null;
+    function finish(open) {
+        if (done) { return; }
+        done = true;
+        if (observer) { observer.disconnect(); }
+        clearInterval(poll);
+        clearTimeout(limit);
+        resolve(result(open));
+    }
+    function check() { if (chipOpen()) { finish(true); } }
+
+    observer = new MutationObserver(check);
+    observer.observe(document.body || document.documentElement,
+                     {subtree: true, childList: true, attributes: true, attributeFilter: ['class', 'disabled', 'aria-disabled', 'style']});
+    poll = setInterval(check, 250);
+    limit = setTimeout(function () { finish(false); }, timeout);
+});
+"""
@@ -2,124 +2,173 @@
 """
 게임 상태 감지 및 결과 추적 모듈
 """
-from bs4 import BeautifulSoup
-import re
+import bisect
+from utils.result_history import ResultHistory
+from utils.latency_tracker import latency_tracker, STAGE_PARSE
+from modules.bead_road_extractor import find_bead_road, iter_cells_from, decode_cell, game_number, iter_packed_cells
 
 class GameDetector:
     def __init__(self):
         self.current_round = 0  # 현재 게임 판수
-        self.pb_history = []  # P/B 기록 (T 제외)
-        self.all_results = []  # P/B/T 모든 결과 기록
+        self.pb_history = ResultHistory(symbols=ResultHistory.PB_SYMBOLS)  # P/B 기록 (T 제외)
+        self.all_results = ResultHistory()  # P/B/T 모든 결과 기록
         self.reset()
 
     def reset(self):
         """게임 감지기 상태 완전 초기화"""
         self.current_round = 0
-        self.pb_history = []
-        self.all_results = []
+        self.pb_history.clear()
+        self.all_results.clear()
         # 내부 인식 상태 초기화
         self._last_processed_game = None
         self._last_processed_result = None
+        self._clear_grid()
+        
+    def _clear_grid(self):
+        """증분 파싱용 보드 캐시 초기화 (슈 리셋, 방 이동 시)"""
+        self._grid = {}  # (x, y) -> 결과
+        self._ordered_cells = []  # 게임 번호 순 [(game_number, x, y, result), ...]
+        self._results = []  # 게임 번호 순 결과 (_ordered_cells와 같은 순서)
+        self._game_results = []  # 게임 번호 순 (game_number, 결과)
+        self._board_text = None  # 이전 폴링의 보드 내용 (HTML 조각 또는 압축 문자열)
+        self._resume = None  # HTML 보드에서 마지막으로 닫힌 셀 뒤 (보드 기준 위치, svg 깊이)
+        self._board_info = None
         
     def parse_game_board(self, html_content):
         """
         게임 결과 보드를 파싱합니다.
+        이전 폴링 보드의 마지막 셀까지 내용이 같으면 그 뒤에 추가된 셀만 읽고 디코딩합니다.
         
         Args:
             html_content (str): HTML 소스 코드
                 
         Returns:
-            dict: 게임 정보 (판수, 최신 결과 등)
-        """
-        soup = BeautifulSoup(html_content, "html.parser")
-        
-        # 게임 결과 보드 찾기
-        bead_road = soup.find("svg", attrs={"data-role": "Bead-road"})
-        if not bead_road:
-            return {
-                "game_count": 0,
-                "latest_result": None,
-                "recent_results": []
-            }
-            
-        # 좌표 요소 찾기
-        coord_elements = bead_road.find_all("svg", attrs={"data-type": "coordinates"})
-        results = []
-        
-        # Y축 길이 (한 열에 몇 개의 결과가 들어가는지)
-        Y_MAX = 6  # 기본값, 실제 값으로 조정 필요
-        
-        for element in coord_elements:
-            try:
-                # x, y 좌표 추출
-                x = int(element.get("data-x", 0))
-                y = int(element.get("data-y", 0))
-                
-                # 게임 번호 계산 (y축으로 먼저 채우고, 다음 x축으로 이동)
-                game_number = x * Y_MAX + y + 1
-                
-                # 결과 유형 파싱 - HTML 소스에서 직접 확인
-                result_type = "unknown"
-                
-                # 요소 내용에 <text> 태그 내용 찾기
-                element_str = str(element)
-                
-                # 정규식으로 <text> 태그 내용 추출 시도
-                text_match = re.search(r'<text[^>]*>([^<]+)</text>', element_str)
-                
-                if text_match:
-                    # <text> 태그 내용 직접 사용
-                    text_content = text_match.group(1).strip()
-                    if text_content == "P":
-                        result_type = "P"
-                    elif text_content == "B":
-                        result_type = "B"
-                    elif text_content == "T":
-                        result_type = "T"
-                else:
-                    # <text> 태그를 찾지 못한 경우 기존 방식으로 백업
-                    name_match = re.search(r'name="([^"]+)"', element_str)
-                    if name_match:
-                        item_name = name_match.group(1).lower()
-                        if "tie" in item_name:
-                            result_type = "T"
-                        elif "player" in item_name:
-                            result_type = "P"
-                        elif "banker" in item_name:
-                            result_type = "B"
-                
-                results.append((x, y, result_type, game_number))
+            dict: 게임 정보 (판수, 최신 결과 등) - 결과 목록은 튜플
+        """
+        board_span = find_bead_road(html_content)
+        if not board_span:
+            return self._empty_board_info()
+        
+        # 보드 내용이 이전 폴링과 같으면 디코딩 없이 이전 결과 재사용
+        board_start, board_end = board_span
+        board = html_content[board_start:board_end]
+        if board == self._board_text and self._board_info is not None:
+            return dict(self._board_info)
+        
+        decode = lambda span: decode_cell(html_content, *span)
+        
+        # 마지막 셀까지 그대로면 추가된 셀만 읽음
+        if self._board_text is not None and self._resume is not None:
+            offset, depth = self._resume
+            if board.startswith(self._board_text[:offset]):
+                cells = self._scan_cells(html_content, board_span, board_start + offset, depth)
+                if self._add_cells(cells, decode):
+                    return self._store_board(board)
+        
+        # 처음이거나 기존 셀이 바뀐 경우(슈 리셋 등) 전체 파싱 (같은 좌표가 중복되면 나중 셀 사용)
+        self._clear_grid()
+        cells = self._scan_cells(html_content, board_span, None, 0)
+        self._add_cells(list({cell[:2]: cell for cell in cells}.values()), decode)
+        return self._store_board(board)
+        
+    def _scan_cells(self, html_content, board_span, start, depth):
+        """보드의 start 위치부터 셀 목록을 읽고 다음 폴링에서 이어 읽을 위치를 기록"""
+        board_start, board_end = board_span
+        cells = []
+        for x, y, cell_start, cell_end, cell_depth in iter_cells_from(html_content, board_span, start, depth):
+            cells.append((x, y, (cell_start, cell_end)))
+            # 닫히지 않은 셀(보드 끝까지)은 내용이 더 생길 수 있으므로 이어 읽을 위치로 쓰지 않음
+            if cell_end < board_end:
+                self._resume = (cell_end - board_start, cell_depth)
+        return cells
+        
+    def parse_packed_board(self, packed):
+        """
+        브라우저에서 추출한 압축 보드 문자열을 파싱합니다. (BEAD_ROAD_SCRIPT 결과)
+        이전 문자열 뒤에 셀이 덧붙은 경우 추가된 부분만 풉니다.
+        
+        Args:
+            packed (str): "x,y,R;x,y,R;..." 형태의 문자열 (보드가 없으면 None)
                 
-            except Exception as e:
-                print(f"결과 파싱 중 오류: {e}")
+        Returns:
+            dict: 게임 정보 (parse_game_board와 동일한 형식)
+        """
+        if packed is None:
+            return self._empty_board_info()
+        
+        if packed == self._board_text and self._board_info is not None:
+            return dict(self._board_info)
         
-        # 게임 번호 기준으로 정렬
-        results.sort(key=lambda r: r[3])
+        # 압축 문자열은 이미 디코딩된 결과이므로 디코딩 없이 결과 그대로 사용
+        keep = lambda result_type: result_type
+        previous = self._board_text
+        if previous is not None and packed.startswith(previous):
+            added = packed[len(previous):]
+            if not previous or added.startswith(";"):
+                if self._add_cells(list(iter_packed_cells(added.lstrip(";"))), keep):
+                    return self._store_board(packed)
         
-        # 게임 수
-        game_count = len(results)
+        self._clear_grid()
+        cells = {(x, y): (x, y, result_type) for x, y, result_type in iter_packed_cells(packed)}
+        self._add_cells(list(cells.values()), keep)
+        return self._store_board(packed)
+        
+    def _add_cells(self, cells, decode):
+        """
+        새 셀을 디코딩하여 보드 캐시에 추가합니다.
         
-        if not results:
-            return {
-                "game_count": 0,
-                "latest_result": None,
-                "recent_results": []
-            }
+        Args:
+            cells (list): [(x, y, 디코딩 인자), ...]
+            decode (callable): 디코딩 인자를 받아 결과 유형을 반환하는 함수
+            
+        Returns:
+            bool: 추가 성공 여부 (이미 있는 좌표가 다시 나오면 False - 전체 재파싱 필요)
+        """
+        for x, y, payload in cells:
+            key = (x, y)
+            if key in self._grid:
+                return False
+                
+            result_type = decode(payload)
+            self._grid[key] = result_type
             
-        # 최신 결과 및 최근 결과 목록
-        latest_result = results[-1]
-        recent_results = [r[2] for r in results]  # 모든 결과 가져오기
+            number = game_number(x, y)
+            index = bisect.bisect(self._ordered_cells, (number, x, y, result_type))
+            self._ordered_cells.insert(index, (number, x, y, result_type))
+            self._results.insert(index, result_type)
+            self._game_results.insert(index, (number, result_type))
+        return True
+        
+    def _store_board(self, board_text):
+        self._board_text = board_text
+        self._board_info = self._build_board_info()
+        return dict(self._board_info)
         
-        # 게임 번호와 결과 매핑 (디버깅용)
-        game_results = [(r[3], r[2]) for r in results]
+    @staticmethod
+    def _empty_board_info():
+        return {
+            "game_count": 0,
+            "latest_result": None,
+            "recent_results": ()
+        }
+        
+    def _build_board_info(self):
+        """보드 캐시에서 parse_game_board 결과 구성 (결과 목록은 호출자가 바꿀 수 없도록 튜플)"""
+        if not self._ordered_cells:
+            return self._empty_board_info()
+            
+        # 최신 결과 (x, y, result_type, game_number)
+        number, x, y, result_type = self._ordered_cells[-1]
+        latest_result = (x, y, result_type, number)
         
         return {
-            "game_count": game_count,
+            "game_count": len(self._ordered_cells),
             "latest_result": latest_result,
-            "recent_results": recent_results,
-            "game_results": game_results
+            "recent_results": tuple(self._results),  # 모든 결과 가져오기
+            "game_results": tuple(self._game_results)  # 게임 번호와 결과 매핑 (디버깅용)
         }
         
+    @latency_tracker.timed(STAGE_PARSE)
     def detect_game_state(self, html_content):
         """
         현재 게임 상태를 감지합니다.
@@ -130,8 +179,23 @@ class GameDetector:
         Returns:
             dict: 게임 상태 정보
         """
-        game_info = self.parse_game_board(html_content)
+        return self._build_game_state(self.parse_game_board(html_content))
+        
+    @latency_tracker.timed(STAGE_PARSE)
+    def detect_game_state_from_packed(self, packed):
+        """
+        브라우저에서 추출한 압축 보드 문자열로 현재 게임 상태를 감지합니다.
         
+        Args:
+            packed (str): BEAD_ROAD_SCRIPT 결과 (보드가 없으면 None)
+                
+        Returns:
+            dict: 게임 상태 정보 (detect_game_state와 동일한 형식)
+        """
+        return self._build_game_state(self.parse_packed_board(packed))
+        
+    def _build_game_state(self, game_info):
+        """보드 정보로 게임 상태 구성 및 결과 기록"""
         # 게임 수 업데이트
         self.current_round = game_info["game_count"]
         
@@ -151,20 +215,15 @@ class GameDetector:
         # 최근 결과 가져오기
         recent_results = game_info["recent_results"] if game_info["recent_results"] else []
         
-        # TIE를 제외한 결과를 정확히 10개 얻기 위한 처리
+        # TIE를 제외한 최근 P/B 결과 10개 (최신 결과부터 모은 뒤 오래된 순으로 뒤집음)
         desired_pb_count = 10  # P와 B를 합쳐 10개 필요
-        
-        # 결과에서 TIE를 제외한 P/B만의 결과 필터링
         filtered_results = []
-        
-        # 뒤에서부터(최신 결과부터) 개수 세기 - TIE 완전히 제외
         for result in reversed(recent_results):
-            if result in ['P', 'B']:
-                filtered_results.insert(0, result)  # 최신 결과를 앞에 추가
-            
-            # TIE 제외 결과가 10개면 충분
-            if len(filtered_results) >= desired_pb_count:
-                break
+            if result in ('P', 'B'):
+                filtered_results.append(result)
+                if len(filtered_results) >= desired_pb_count:
+                    break
+        filtered_results.reverse()
         
         # 최신 게임의 좌표 정보
         latest_coords = None
@@ -204,16 +263,7 @@ class GameDetector:
         Returns:
             int: 연속 횟수
         """
-        if not self.pb_history:
-            return 0
-            
-        count = 0
-        for result in reversed(self.pb_history):
-            if result == result_type:
-                count += 1
-            else:
-                break
-        return count
+        return self.pb_history.streak(result_type)
         
     def get_win_rate(self, last_n=0):
         """
@@ -228,7 +278,11 @@ class GameDetector:
         if not self.pb_history:
             return 0.0
             
-        history = self.pb_history[-last_n:] if last_n > 0 else self.pb_history
+        # 전체 기간은 링 버퍼 용량과 무관하게 누적 개수로 계산
+        if last_n <= 0:
+            return self.pb_history.total_count('P') / self.pb_history.total
+            
+        history = self.pb_history[-last_n:]
         if not history:
             return 0.0
             
@@ -1,6 +1,5 @@
 # services/balance_service.py
 import logging
-import time
 from utils.parser import HTMLParser
 from utils.settings_manager import SettingsManager
 from PyQt6.QtWidgets import QMessageBox
@@ -9,9 +8,24 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import re
 from utils.iframe_utils import IframeManager, switch_to_iframe_with_retry  # 추가: iframe 유틸리티 임포트
+from utils.parse_cache import ParseCache
+from utils.balance_ledger import BalanceLedger
+from utils.wait_engine import wait_until
+from utils.cdp_client import CDPError
+from utils.selector_registry import selector_registry
+from modules.balance_script import LOBBY_BALANCE_SCRIPT, LOBBY_BALANCE_STRATEGIES
+from utils.browser_executor import CMD_CLOSE_ROOM, CMD_READ_BALANCE
+from utils.async_bridge import defer_dialog
 
 class BalanceService:
-    def __init__(self, devtools, main_window, logger=None):
+    # 게임 iframe 안의 잔액 표시 요소 (우선순위 순)
+    IFRAME_BALANCE_SELECTORS = [
+        "span[data-role='balance-label-value']",
+        "[data-role='header-balance']"
+    ]
+    BALANCE_SETTLE_TIMEOUT = 3  # 결과 지급이 잔액 표시에 반영되기를 기다리는 최대 시간 (초)
+
+    def __init__(self, devtools, main_window, logger=None, parse_cache=None):
         """
         잔액 관리 서비스 초기화
         
@@ -19,6 +33,7 @@ class BalanceService:
             devtools (DevToolsController): 브라우저 제어 객체
             main_window (QMainWindow): 메인 윈도우 객체
             logger (logging.Logger, optional): 로깅을 위한 로거 객체
+            parse_cache (ParseCache, optional): 서비스 간 공유하는 틱 단위 파싱 캐시
         """
         self.logger = logger or logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
@@ -29,6 +44,14 @@ class BalanceService:
         
         # 추가: iframe 매니저 초기화
         self.iframe_manager = None
+        
+        self.parse_cache = parse_cache or ParseCache()
+        
+        # 마지막 잔액 스크립트가 찾은 후보 [{'strategy', 'value'}, ...] (순위 순)
+        self.lobby_balance_candidates = []
+        
+        # 베팅 결과로 계산하는 예상 잔액 (가끔씩만 DOM과 대조)
+        self.ledger = BalanceLedger()
 
     def get_lobby_balance(self):
         """
@@ -38,198 +61,46 @@ class BalanceService:
             int: 현재 잔액 또는 None (실패 시)
         """
         try:
-            # 현재 페이지 소스 가져오기
-            html = self.devtools.get_page_source()
-            
-            if not html:
+            # 페이지 소스는 마지막 정규식 방법에서만 필요하므로 여기서는 브라우저 상태만 확인
+            if not self.devtools.driver:
                 self.logger.error("페이지 소스를 가져올 수 없습니다.")
                 return None
             
             # 추가: iframe 매니저 초기화
             self.iframe_manager = IframeManager(self.devtools.driver)
             
-            # 기본 컨텐츠로 전환
-            self.devtools.driver.switch_to.default_content()
+            # iframe 전환 (창별 경로 캐시 → 첫 번째/중첩 iframe → 자동 검색 순)
+            if not switch_to_iframe_with_retry(self.devtools.driver):
+                self.logger.error("모든 iframe 전환 방법 실패")
+                return None
             
-            # 방법 1: 기존 방식으로 iframe 전환 시도
-            iframe_switched = False
-            try:
-                iframe = self.devtools.driver.find_element(By.CSS_SELECTOR, "iframe")
-                self.devtools.driver.switch_to.frame(iframe)
-                iframe_switched = True
-                
-                # 중첩된 iframe 확인
-                nested_iframes = self.devtools.driver.find_elements(By.TAG_NAME, "iframe")
-                if nested_iframes:
-                    self.logger.info("잔액 확인: 중첩된 iframe이 발견되어 전환")
-                    self.devtools.driver.switch_to.frame(nested_iframes[0])
-            except Exception as e:
-                self.logger.warning(f"잔액 확인: iframe 전환 실패: {e}")
+            # 모든 잔액 찾기 방법을 페이지 안에서 한 번에 실행 (WebDriver 왕복 1회)
+            script_ran, balance = self._get_lobby_balance_via_script()
+            if script_ran:
+                # 기본 컨텐츠로 돌아가기
                 self.devtools.driver.switch_to.default_content()
+                if balance is None:
+                    self.logger.error("모든 방법으로 잔액을 찾을 수 없습니다.")
+                else:
+                    self._sync_ledger(balance, "로비", settled=True)
+                return balance
             
-            # 방법 2: 실패 시 유틸리티 함수 사용
-            if not iframe_switched:
-                self.logger.info("잔액 확인: 자동 iframe 전환 시도")
-                iframe_switched = switch_to_iframe_with_retry(self.devtools.driver)
-                
-                if not iframe_switched:
-                    self.logger.error("모든 iframe 전환 방법 실패")
-                    return None
-            
-            # 기존 코드 (방법 1): balance-label-value 방식 - 항상 첫번째로 시도
-            try:
-                # 잔액 요소 찾기 (iframe 내부에서 잔액을 표시하는 요소)
-                balance_element = self.devtools.driver.find_element(By.CSS_SELECTOR, "span[data-role='balance-label-value']")
-                if balance_element:
-                    balance_text = balance_element.text
-                    # 숫자만 추출 (₩과 콤마, 특수 문자 제거)
-                    balance = int(re.sub(r'[^\d]', '', balance_text) or '0')
-                    self.logger.info(f"로비 iframe에서 가져온 잔액: {balance:,}원 (balance-label-value)")
-                    
-                    # 기본 컨텐츠로 돌아가기
-                    self.devtools.driver.switch_to.default_content()
-                    return balance
-            except Exception as e:
-                self.logger.warning(f"balance-label-value로 잔액 가져오기 실패: {e}")
-            
-            # 방법 2: data-role="header-balance" 속성을 가진 요소 찾기
-            try:
-                balance_element = self.devtools.driver.find_element(By.CSS_SELECTOR, "[data-role='header-balance']")
-                if balance_element:
-                    balance_text = balance_element.text
-                    self.logger.info(f"data-role='header-balance' 속성을 가진 요소에서 잔액 텍스트: {balance_text}")
-                    # 숫자만 추출 (₩과 콤마, 특수 문자 제거)
-                    balance = int(re.sub(r'[^\d]', '', balance_text) or '0')
-                    self.logger.info(f"로비 iframe에서 가져온 잔액: {balance:,}원 (header-balance)")
-                    
-                    # 기본 컨텐츠로 돌아가기
-                    self.devtools.driver.switch_to.default_content()
-                    return balance
-            except Exception as e:
-                self.logger.warning(f"header-balance로 잔액 가져오기 실패: {e}")
-            
-            # 방법 3: Typography 클래스를 가진 header-balance 요소 찾기
-            try:
-                typography_selector = "span.Typography--d2c9a[data-role='header-balance']"
-                balance_element = self.devtools.driver.find_element(By.CSS_SELECTOR, typography_selector)
-                if balance_element:
-                    balance_text = balance_element.text
-                    self.logger.info(f"Typography 클래스의 header-balance에서 잔액 텍스트: {balance_text}")
-                    # 숫자만 추출
-                    balance = int(re.sub(r'[^\d]', '', balance_text) or '0')
-                    self.logger.info(f"로비 iframe에서 가져온 잔액: {balance:,}원 (Typography header-balance)")
-                    
-                    # 기본 컨텐츠로 돌아가기
-                    self.devtools.driver.switch_to.default_content()
-                    return balance
-            except Exception as e:
-                self.logger.warning(f"Typography header-balance로 잔액 가져오기 실패: {e}")
-            
-            # 방법 4: 클래스 이름으로 Typography 요소 찾기
-            try:
-                # 클래스 이름으로 잔액 요소 찾기 시도
-                balance_elements = self.devtools.driver.find_elements(By.CSS_SELECTOR, ".Typography--d2c9a")
-                for element in balance_elements:
-                    try:
-                        balance_text = element.text
-                        self.logger.info(f"Typography 클래스 요소 텍스트: {balance_text}")
-                        if '₩' in balance_text or '원' in balance_text:
-                            self.logger.info(f"Typography 클래스에서 잔액 후보 텍스트: {balance_text}")
-                            # 숫자만 추출
-                            balance = int(re.sub(r'[^\d]', '', balance_text) or '0')
-                            self.logger.info(f"로비 iframe에서 가져온 잔액: {balance:,}원 (Typography)")
-                            
-                            # 기본 컨텐츠로 돌아가기
-                            self.devtools.driver.switch_to.default_content()
-                            return balance
-                    except Exception as inner_e:
-                        self.logger.warning(f"Typography 요소 처리 중 오류: {inner_e}")
-                        continue  # 다음 요소로 진행
-            except Exception as e:
-                self.logger.warning(f"Typography 클래스로 잔액 가져오기 실패: {e}")
-            
-            # 방법 5: 모든 span 요소 검색
-            try:
-                all_spans = self.devtools.driver.find_elements(By.TAG_NAME, "span")
-                self.logger.info(f"총 {len(all_spans)}개의 span 요소 찾음")
-                
-                for span in all_spans:
-                    try:
-                        span_text = span.text
-                        if re.search(r'[\d,]+', span_text) and ('₩' in span_text or '원' in span_text or len(re.findall(r'\d', span_text)) >= 3):
-                            self.logger.info(f"잠재적 잔액 요소 발견: {span_text}")
-                            # 숫자만 추출
-                            balance = int(re.sub(r'[^\d]', '', span_text) or '0')
-                            if balance > 100:  # 잔액은 보통 큰 숫자이므로 필터링
-                                self.logger.info(f"로비 iframe에서 가져온 잔액: {balance:,}원 (span 태그)")
-                                
-                                # 기본 컨텐츠로 돌아가기
-                                self.devtools.driver.switch_to.default_content()
-                                return balance
-                    except Exception as inner_e:
-                        continue  # 오류가 있어도 다음 span으로 계속 진행
-            except Exception as e:
-                self.logger.warning(f"모든 span 요소 검색 중 오류: {e}")
-            
-            # 방법 6: 내용에 '₩' 또는 '원'이 있는 모든 요소 검색
-            try:
-                # XPath로 검색
-                xpath_expr = "//*[contains(text(), '₩') or contains(text(), '원')]"
-                balance_candidates = self.devtools.driver.find_elements(By.XPATH, xpath_expr)
-                self.logger.info(f"₩ 또는 원을 포함하는 요소 {len(balance_candidates)}개 발견")
-                
-                for element in balance_candidates:
-                    try:
-                        balance_text = element.text
-                        self.logger.info(f"₩/원 포함 요소 발견: {balance_text}")
-                        # 숫자만 추출
-                        numbers = re.findall(r'\d+', re.sub(r'[,\.]', '', balance_text))
-                        if numbers:
-                            largest_number = max([int(num) for num in numbers])
-                            if largest_number > 100:  # 잔액은 보통 큰 숫자이므로 필터링
-                                self.logger.info(f"로비 iframe에서 가져온 잔액: {largest_number:,}원 (XPath)")
-                                
-                                # 기본 컨텐츠로 돌아가기
-                                self.devtools.driver.switch_to.default_content()
-                                return largest_number
-                    except Exception as inner_e:
-                        self.logger.warning(f"XPath 요소 처리 중 오류: {inner_e}")
-                        continue
-            except Exception as e:
-                self.logger.warning(f"XPath로 잔액 가져오기 실패: {e}")
+            # 스크립트를 실행할 수 없으면 잔액 찾기 방법을 사이트별로 성공한 순서대로 하나씩 시도
+            def attempt(strategy):
+                balance = strategy[1]()
+                return None if balance is None else (balance,)
             
-            # 방법 7: 페이지 소스에서 직접 정규식으로 검색
-            try:
-                page_source = self.devtools.driver.page_source
-                # 정규식 패턴 (다양한 형태의 금액 표시를 찾기 위함)
-                patterns = [
-                    r'₩\s*[\d,]+',  # ₩ 다음에 숫자와 콤마
-                    r'₩⁩([\d,]+)',  # 특수한 유니코드 문자 포함
-                    r'header-balance[^>]*>([^<]*\d[^<]*)',  # header-balance 속성 주변의 텍스트
-                    r'balance[^>]*>([^<]*\d[^<]*)'  # balance 속성 주변의 텍스트
-                ]
+            strategy, found = selector_registry.find(
+                "lobby_balance", self._lobby_balance_strategies(), attempt, key=lambda strategy: strategy[0]
+            )
+            if found:
+                balance = found[0]
+                self.logger.info(f"로비 iframe에서 가져온 잔액: {balance:,}원 ({strategy[0]})")
                 
-                for pattern in patterns:
-                    matches = re.findall(pattern, page_source)
-                    if matches:
-                        for match in matches:
-                            try:
-                                match_text = match if isinstance(match, str) else match[0]
-                                self.logger.info(f"정규식으로 찾은 텍스트: {match_text}")
-                                # 숫자만 추출
-                                numbers = re.findall(r'\d+', re.sub(r'[,\.]', '', match_text))
-                                if numbers:
-                                    largest_number = max([int(num) for num in numbers])
-                                    if largest_number > 100:
-                                        self.logger.info(f"소스에서 정규식으로 가져온 잔액: {largest_number:,}원")
-                                        
-                                        # 기본 컨텐츠로 돌아가기
-                                        self.devtools.driver.switch_to.default_content()
-                                        return largest_number
-                            except Exception as inner_e:
-                                continue
-            except Exception as e:
-                self.logger.warning(f"소스에서 정규식으로 잔액 찾기 실패: {e}")
+                # 기본 컨텐츠로 돌아가기
+                self.devtools.driver.switch_to.default_content()
+                self._sync_ledger(balance, "로비", settled=True)
+                return balance
             
             # 기본 컨텐츠로 돌아가기
             self.devtools.driver.switch_to.default_content()
@@ -248,6 +119,145 @@ class BalanceService:
             
             return None
         
+    def _get_lobby_balance_via_script(self):
+        """
+        로비 iframe 안에서 잔액 후보를 한 번에 수집 (LOBBY_BALANCE_SCRIPT)
+        - 사이트별로 마지막에 성공한 방법이 앞에 오도록 순서를 넘기고, 첫 번째 후보를 잔액으로 사용
+
+        Returns:
+            tuple: (스크립트 실행 여부, 잔액 또는 None)
+        """
+        order = selector_registry.order("lobby_balance", LOBBY_BALANCE_STRATEGIES)
+        try:
+            result = self.devtools.driver.execute_script(LOBBY_BALANCE_SCRIPT, order)
+        except Exception as e:
+            self.logger.warning(f"잔액 스크립트 실행 실패, 방법별로 확인: {e}")
+            return False, None
+        if not isinstance(result, dict):
+            return False, None
+
+        candidates = result.get("candidates") or []
+        self.lobby_balance_candidates = candidates
+        if not candidates:
+            return True, None
+
+        winner = candidates[0]
+        # 선택된 방법보다 앞 순서인데 후보를 못 찾은 방법은 실패로 기록
+        for strategy in order:
+            if strategy == winner["strategy"]:
+                break
+            selector_registry.record_miss("lobby_balance", strategy)
+        selector_registry.record_hit("lobby_balance", winner["strategy"])
+
+        balance = int(winner["value"])
+        self.logger.info(
+            f"로비 iframe에서 가져온 잔액: {balance:,}원 ({winner['strategy']}, "
+            f"후보 {len(candidates)}개, {result.get('elapsed_ms')}ms)"
+        )
+        return True, balance
+
+    def _lobby_balance_strategies(self):
+        """
+        로비 iframe 잔액 찾기 방법 목록 (원래 우선순위 순, 잔액 스크립트를 실행할 수 없을 때 사용)
+        각 방법은 잔액(int) 또는 None을 반환하며, iframe으로 전환된 상태에서 호출해야 합니다.
+        """
+        return [
+            ("balance-label-value", lambda: self._balance_from_selector("span[data-role='balance-label-value']")),
+            ("header-balance", lambda: self._balance_from_selector("[data-role='header-balance']")),
+            ("Typography header-balance",
+             lambda: self._balance_from_selector("span.Typography--d2c9a[data-role='header-balance']")),
+            ("Typography", self._balance_from_typography),
+            ("span 태그", self._balance_from_spans),
+            ("XPath", self._balance_from_currency_text),
+            ("정규식", self._balance_from_source),
+        ]
+
+    def _balance_from_selector(self, selector):
+        """선택자로 찾은 요소의 숫자를 잔액으로 사용"""
+        try:
+            balance_element = self.devtools.driver.find_element(By.CSS_SELECTOR, selector)
+        except Exception:
+            return None
+        # 숫자만 추출 (₩과 콤마, 특수 문자 제거)
+        return int(re.sub(r'[^\d]', '', balance_element.text) or '0')
+
+    def _balance_from_typography(self):
+        """Typography 클래스 요소 중 '₩' 또는 '원'이 들어간 텍스트"""
+        for element in self.devtools.driver.find_elements(By.CSS_SELECTOR, ".Typography--d2c9a"):
+            try:
+                balance_text = element.text
+                if '₩' in balance_text or '원' in balance_text:
+                    return int(re.sub(r'[^\d]', '', balance_text) or '0')
+            except Exception:
+                continue  # 다음 요소로 진행
+        return None
+
+    def _balance_from_spans(self):
+        """모든 span 요소 중 금액처럼 보이는 텍스트"""
+        for span in self.devtools.driver.find_elements(By.TAG_NAME, "span"):
+            try:
+                span_text = span.text
+                if re.search(r'[\d,]+', span_text) and ('₩' in span_text or '원' in span_text or len(re.findall(r'\d', span_text)) >= 3):
+                    balance = int(re.sub(r'[^\d]', '', span_text) or '0')
+                    if balance > 100:  # 잔액은 보통 큰 숫자이므로 필터링
+                        return balance
+            except Exception:
+                continue  # 오류가 있어도 다음 span으로 계속 진행
+        return None
+
+    def _balance_from_currency_text(self):
+        """내용에 '₩' 또는 '원'이 있는 요소의 가장 큰 숫자"""
+        xpath_expr = "//*[contains(text(), '₩') or contains(text(), '원')]"
+        for element in self.devtools.driver.find_elements(By.XPATH, xpath_expr):
+            try:
+                numbers = re.findall(r'\d+', re.sub(r'[,\.]', '', element.text))
+                if numbers:
+                    largest_number = max([int(num) for num in numbers])
+                    if largest_number > 100:  # 잔액은 보통 큰 숫자이므로 필터링
+                        return largest_number
+            except Exception:
+                continue
+        return None
+
+    def _balance_from_source(self):
+        """페이지 소스에서 직접 정규식으로 검색 (같은 소스는 캐시된 결과 재사용)"""
+        page_source = self.devtools.driver.page_source
+        return self.parse_cache.get_or_parse("lobby_balance_source", page_source, self._find_balance_in_source)
+
+    def _find_balance_in_source(self, page_source):
+        """
+        페이지 소스에서 정규식으로 잔액 후보를 찾습니다.
+        
+        Args:
+            page_source (str): 페이지 소스
+            
+        Returns:
+            int: 잔액 또는 None (찾지 못한 경우)
+        """
+        # 정규식 패턴 (다양한 형태의 금액 표시를 찾기 위함)
+        patterns = [
+            r'₩\s*[\d,]+',  # ₩ 다음에 숫자와 콤마
+            r'₩⁩([\d,]+)',  # 특수한 유니코드 문자 포함
+            r'header-balance[^>]*>([^<]*\d[^<]*)',  # header-balance 속성 주변의 텍스트
+            r'balance[^>]*>([^<]*\d[^<]*)'  # balance 속성 주변의 텍스트
+        ]
+        
+        for pattern in patterns:
+            for match in re.findall(pattern, page_source):
+                try:
+                    match_text = match if isinstance(match, str) else match[0]
+                    self.logger.info(f"정규식으로 찾은 텍스트: {match_text}")
+                    # 숫자만 추출
+                    numbers = re.findall(r'\d+', re.sub(r'[,\.]', '', match_text))
+                    if numbers:
+                        largest_number = max([int(num) for num in numbers])
+                        if largest_number > 100:
+                            return largest_number
+                except Exception:
+                    continue
+        
+        return None
+
     def update_balance_and_user_data(self, balance, username):
         """
         UI에 잔액 및 사용자 정보를 업데이트합니다.
@@ -286,41 +296,23 @@ class BalanceService:
         Returns:
             int: 현재 잔액 또는 None (실패 시)
         """
+        # 게임 프레임 CDP 컨텍스트가 있으면 iframe 전환 없이 한 번의 조회로 확인
+        balance = self._get_iframe_balance_via_cdp()
+        if balance is not None:
+            return balance
+        
         try:
             # 추가: iframe 매니저 초기화
             self.iframe_manager = IframeManager(self.devtools.driver)
             
-            # 기본 컨텐츠로 전환
-            self.devtools.driver.switch_to.default_content()
-            
-            # 방법 1: 기존 방식으로 iframe 전환 시도
-            iframe_switched = False
-            try:
-                iframe = self.devtools.driver.find_element(By.CSS_SELECTOR, "iframe")
-                self.devtools.driver.switch_to.frame(iframe)
-                iframe_switched = True
-                
-                # 중첩된 iframe 확인
-                nested_iframes = self.devtools.driver.find_elements(By.TAG_NAME, "iframe")
-                if nested_iframes:
-                    self.logger.info("잔액 확인: 중첩된 iframe이 발견되어 전환")
-                    self.devtools.driver.switch_to.frame(nested_iframes[0])
-            except Exception as e:
-                self.logger.warning(f"잔액 확인: iframe 전환 실패: {e}")
-                self.devtools.driver.switch_to.default_content()
-            
-            # 방법 2: 실패 시 유틸리티 함수 사용
-            if not iframe_switched:
-                self.logger.info("잔액 확인: 자동 iframe 전환 시도")
-                iframe_switched = switch_to_iframe_with_retry(self.devtools.driver)
-                
-                if not iframe_switched:
-                    self.logger.error("모든 iframe 전환 방법 실패")
-                    return None
+            # iframe 전환 (창별 경로 캐시 → 첫 번째/중첩 iframe → 자동 검색 순)
+            if not switch_to_iframe_with_retry(self.devtools.driver):
+                self.logger.error("모든 iframe 전환 방법 실패")
+                return None
             
             # 방법 1: 기본 잔액 요소 찾기
             try:
-                balance_element = self.devtools.driver.find_element(By.CSS_SELECTOR, "span[data-role='balance-label-value']")
+                balance_element = self.devtools.driver.find_element(By.CSS_SELECTOR, self.IFRAME_BALANCE_SELECTORS[0])
                 balance_text = balance_element.text
                 
                 # 숫자만 추출 (₩과 콤마, 특수 문자 제거)
@@ -338,7 +330,7 @@ class BalanceService:
             # 방법 2: 다른 속성 찾기
             try:
                 # 다른 속성으로 시도
-                balance_element = self.devtools.driver.find_element(By.CSS_SELECTOR, "[data-role='header-balance']")
+                balance_element = self.devtools.driver.find_element(By.CSS_SELECTOR, self.IFRAME_BALANCE_SELECTORS[1])
                 balance_text = balance_element.text
                 
                 # 숫자만 추출 (₩과 콤마, 특수 문자 제거)
@@ -392,32 +384,130 @@ class BalanceService:
             
             return None
         
+    def _get_iframe_balance_via_cdp(self):
+        """
+        게임 프레임 실행 컨텍스트에서 잔액 요소 조회 (DevToolsController.game_frame_query)
+
+        Returns:
+            int: 잔액 또는 None (CDP를 사용할 수 없거나 찾지 못한 경우 → Selenium 경로)
+        """
+        if not getattr(self.devtools, 'has_cdp', False) or self.devtools.get_game_frame() is None:
+            return None
+
+        try:
+            selectors = selector_registry.order("iframe_balance", self.IFRAME_BALANCE_SELECTORS)
+            elements = self.devtools.game_frame_query(selectors)
+        except CDPError as e:
+            self.logger.warning(f"CDP 잔액 조회 실패, Selenium으로 확인: {e}")
+            return None
+
+        for element in elements:
+            digits = re.sub(r'[^\d]', '', element["text"])
+            if digits:
+                balance = int(digits)
+                selector_registry.record_hit("iframe_balance", element["selector"])
+                self.logger.info(f"게임 프레임에서 가져온 잔액: {balance:,}원 ({element['selector']}, CDP)")
+                return balance
+        return None
+
+    def _sync_ledger(self, balance, source, settled=False):
+        """DOM에서 읽은 잔액으로 장부 맞추기 (차이가 허용치 이상이면 경고)"""
+        drift = self.ledger.sync(balance, settled=settled)
+        if self.ledger.drift_detected:
+            self.logger.warning(f"[{source}] 예상 잔액과 실제 잔액 차이: {drift:+,}원 - 다음 결과부터 매번 대조")
+        return drift
+
+    def apply_stream_balance(self, balance):
+        """
+        게임 WebSocket으로 받은 잔액 반영 (서버 값이므로 장부를 바로 맞춤)
+        
+        Args:
+            balance (int): 잔액
+        """
+        self._sync_ledger(balance, "WebSocket")
+        self.main_window.update_user_data(current_amount=balance)
+        self.check_target_amount(balance, source="WebSocket")
+        return balance
+
+    def get_balance_for_bet(self):
+        """
+        베팅 전 잔액 (대조가 필요할 때만 iframe에서 읽고, 아니면 장부의 예상 잔액)
+        
+        Returns:
+            int: 잔액 또는 None (실패 시)
+        """
+        if not self.ledger.needs_reconcile(self.settings_manager.get_target_amount()):
+            self.logger.info(f"예상 잔액 사용: {self.ledger.balance:,}원 (대조 후 결과 {self.ledger.results_since_sync}개)")
+            return self.ledger.balance
+        
+        balance = self.get_iframe_balance()
+        if balance is not None:
+            self._sync_ledger(balance, "베팅 전")
+        return balance
+
+    def record_bet(self, bet_type, amount):
+        """성공한 베팅을 장부에 기록"""
+        self.ledger.place(bet_type, amount)
+
+    def record_bet_result(self, result_status):
+        """
+        베팅 결과를 장부에 정산하고 예상 잔액을 UI에 표시
+        (예상 잔액이 목표 금액에 닿으면 실제 잔액으로 확인)
+        
+        Args:
+            result_status (str): 'win', 'lose', 'tie'
+        
+        Returns:
+            int: 예상 잔액 또는 None
+        """
+        balance = self.ledger.settle(result_status)
+        if balance is None:
+            return None
+        
+        self.main_window.update_user_data(current_amount=balance)
+        
+        target_amount = self.settings_manager.get_target_amount()
+        if target_amount > 0 and balance >= target_amount:
+            # 실제 잔액 확인은 브라우저 스레드에서 (GUI 스레드를 막지 않도록)
+            trading_manager = getattr(self.main_window, 'trading_manager', None)
+            if trading_manager is not None and hasattr(trading_manager, 'browser_executor'):
+                trading_manager.browser_executor.submit(
+                    CMD_READ_BALANCE, self.update_balance_after_bet_result, is_win=(result_status == "win")
+                )
+                return balance
+            return self.update_balance_after_bet_result(is_win=(result_status == "win"))
+        return balance
+
     def update_balance_after_bet_result(self, is_win=False):
         """
         베팅 결과 확인 후 잔액을 업데이트합니다.
+        장부로 충분하면 예상 잔액을 사용하고, 대조가 필요할 때만 iframe에서 읽습니다.
         
         Args:
-            is_win (bool): 베팅 성공 여부 (성공 시 지연 적용)
+            is_win (bool): 베팅 성공 여부
         
         Returns:
             int: 업데이트된 잔액 또는 None (실패 시)
         """
         try:
-            # 성공 시 3~4초 지연
-            if is_win:
-                self.logger.info("베팅 성공! 잔액 업데이트 전 3초 대기...")
-                time.sleep(2)
+            target_amount = self.settings_manager.get_target_amount()
+            if not self.ledger.needs_reconcile(target_amount):
+                balance = self.ledger.balance
+                self.logger.info(f"현재 잔액 (예상): {balance:,}원")
+                self.main_window.update_user_data(current_amount=balance)
+                return balance
             
             self.logger.info("베팅 결과 후 잔액 확인")
             
-            # iframe 내에서 잔액 가져오기
-            balance = self.get_iframe_balance()
+            # iframe 내에서 잔액 가져오기 (결과 지급이 표시에 반영될 때까지 고정 대기 없이 확인)
+            balance = self._read_settled_balance()
             
             if balance is None:
                 self.logger.error("iframe에서 잔액을 가져올 수 없습니다.")
                 return None
             
             self.logger.info(f"현재 잔액: {balance:,}원")
+            self._sync_ledger(balance, "베팅 결과")
             
             # UI 업데이트
             self.main_window.update_user_data(current_amount=balance)
@@ -431,6 +521,36 @@ class BalanceService:
             self.logger.error(f"잔액 확인 중 오류 발생: {e}")
             return None
         
+    def _read_settled_balance(self):
+        """
+        결과 정산 후 iframe 잔액 읽기
+        - 장부 예상 잔액이 있으면 표시가 예상 잔액(허용 차이 이내)으로 바뀔 때까지 확인 (승리 지급 표시 지연 대응)
+        - 시간 안에 맞지 않으면 마지막으로 읽은 값 사용 (차이는 장부 대조에서 처리)
+
+        Returns:
+            int: 잔액 또는 None (읽지 못한 경우)
+        """
+        expected = self.ledger.balance
+        if expected is None:
+            return self.get_iframe_balance()
+
+        last_read = []
+
+        def settled_balance():
+            balance = self.get_iframe_balance()
+            if balance is not None:
+                last_read[:] = [balance]
+                if abs(balance - expected) < self.ledger.drift_threshold:
+                    return balance
+            return None
+
+        result = wait_until(
+            settled_balance, timeout=self.BALANCE_SETTLE_TIMEOUT, interval=0.25, label="balance_settled"
+        )
+        if result:
+            return result.value
+        return last_read[0] if last_read else None
+
     # services/balance_service.py의 check_target_amount 메서드 수정 부분
     def check_target_amount(self, current_balance, source="BalanceService"):
             """
@@ -457,107 +577,14 @@ class BalanceService:
                 # 중복 알림 방지를 위해 플래그 설정
                 self._target_amount_reached = True
                 
-                # 중요: 즉시 모든 스레드와 진행 중인 작업 중지
+                # 중지 플래그는 바로 설정하고, 자동 매매 중지/알림은 GUI 스레드에서 처리
+                # (브라우저 스레드에서 호출된 경우에도 안전하도록)
                 if hasattr(self.main_window, 'trading_manager'):
-                    # 중지 플래그 설정
                     self.main_window.trading_manager.stop_all_processes = True
-                    self.logger.info("목표 금액 도달: 모든 프로세스 중지 플래그 설정")
-                    
-                    # 타이머 즉시 중지
-                    if hasattr(self.main_window, 'timer') and self.main_window.timer.isActive():
-                        self.main_window.timer.stop()
-                        self.logger.info("타이머 중지됨")
-                    
-                    # 자동 매매 중지 즉시 호출
-                    self.main_window.trading_manager.stop_trading()
-                    self.logger.info("자동 매매 종료 메서드 호출됨")
-                    
-                    # 간단하게 웹페이지만 종료하는 코드 추가
-                    try:
-                        # 현재 열린 창 모두 가져오기
-                        window_handles = self.devtools.driver.window_handles
-                        
-                        # 2개 이상의 창이 열려 있는 경우 (카지노 창이 있는 경우)
-                        if len(window_handles) >= 2:
-                            # 메인 창으로 전환 (1번 창)
-                            self.devtools.driver.switch_to.window(window_handles[0])
-                            self.logger.info("메인 창(1번 창)으로 포커싱 전환 완료")
-                            
-                            # 카지노 창(2번 창부터) 닫기
-                            for i in range(1, len(window_handles)):
-                                # 카지노 창으로 전환
-                                self.devtools.driver.switch_to.window(window_handles[i])
-                                # 창 닫기
-                                self.devtools.driver.close()
-                                self.logger.info(f"{i+1}번 창(카지노 창) 닫기 완료")
-                            
-                            # 다시 메인 창으로 전환
-                            self.devtools.driver.switch_to.window(window_handles[0])
-                            self.logger.info("모든 카지노 창 닫기 후 메인 창으로 포커싱 전환 완료")
-                    except Exception as e:
-                        self.logger.error(f"카지노 창 닫기 중 오류 발생: {e}")
-                
-                # 빵빠레 사운드 재생 - 추가된 부분
-                try:
-                    from PyQt6.QtCore import QUrl
-                    from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
-                    import os
-                    import sys
-                    
-                    # 사운드 파일 경로 지정 (실행 경로에 따라 다르게 처리)
-                    if getattr(sys, 'frozen', False):
-                        # PyInstaller로 실행된 경우
-                        base_dir = os.path.dirname(sys.executable)
-                        sound_paths = [
-                            os.path.join(base_dir, "_internal", "bbang.mp3"),  # _internal 폴더 내
-                            os.path.join(base_dir, "_internal", "bbang.wav"),
-                            os.path.join(base_dir, "bbang.mp3"),                # 루트 폴더
-                            os.path.join(base_dir, "bbang.wav")
-                        ]
-                    else:
-                        # 개발 환경에서 실행된 경우 - 같은 경로에 있음
-                        base_dir = os.path.dirname(os.path.abspath(__file__))
-                        sound_paths = [
-                            os.path.join(base_dir, "bbang.mp3"),                # 현재 폴더
-                            os.path.join(base_dir, "bbang.wav"),
-                            os.path.join(os.path.dirname(base_dir), "bbang.mp3"),  # 상위 폴더
-                            os.path.join(os.path.dirname(base_dir), "bbang.wav"),
-                        ]
-                    
-                    # 존재하는 첫 번째 파일 사용
-                    sound_file = None
-                    for path in sound_paths:
-                        if os.path.exists(path):
-                            sound_file = path
-                            break
-                    
-                    self.logger.info(f"빵빠레 사운드 재생 시도: {sound_file}")
-                    
-                    if sound_file and os.path.exists(sound_file):
-                        # QMediaPlayer 초기화
-                        self.player = QMediaPlayer()
-                        self.audio_output = QAudioOutput()
-                        self.player.setAudioOutput(self.audio_output)
-                        
-                        # 볼륨 설정 (0.0 ~ 1.0)
-                        self.audio_output.setVolume(0.8)
-                        
-                        # 미디어 설정 및 재생
-                        self.player.setSource(QUrl.fromLocalFile(os.path.abspath(sound_file)))
-                        self.player.play()
-                        
-                        self.logger.info("목표 금액 달성 빵빠레 사운드 재생 중...")
-                    else:
-                        self.logger.warning(f"빵빠레 사운드 파일을 찾을 수 없습니다: {sound_file}")
-                except Exception as e:
-                    self.logger.error(f"빵빠레 사운드 재생 중 오류 발생: {e}")
-                
-                # 메시지 박스 표시
-                QMessageBox.information(
-                    self.main_window, 
-                    "목표 금액 달성", 
-                    f"축하합니다! 목표 금액({target_amount:,}원)에 도달했습니다.\n현재 잔액: {current_balance:,}원\n자동 매매를 종료합니다."
-                )
+                if hasattr(self.main_window, 'run_on_gui_thread'):
+                    self.main_window.run_on_gui_thread(self._on_target_amount_reached, target_amount, current_balance)
+                else:
+                    self._on_target_amount_reached(target_amount, current_balance)
                 
                 return True
             
@@ -567,4 +594,114 @@ class BalanceService:
                 self.logger.info(f"목표 금액 접근 중: {progress:.1f}% (현재: {current_balance:,}원, 목표: {target_amount:,}원)")
             
             return False
+
+    def _on_target_amount_reached(self, target_amount, current_balance):
+        """목표 금액 도달 처리 (GUI 스레드) - 자동 매매 중지, 카지노 창 닫기, 알림"""
+        # 중요: 즉시 모든 스레드와 진행 중인 작업 중지
+        if hasattr(self.main_window, 'trading_manager'):
+            # 중지 플래그 설정
+            self.main_window.trading_manager.stop_all_processes = True
+            self.logger.info("목표 금액 도달: 모든 프로세스 중지 플래그 설정")
+            
+            # 자동 매매 중지 즉시 호출 (진행 중인 모니터링/베팅/방 이동 코루틴 취소)
+            self.main_window.trading_manager.stop_trading()
+            self.logger.info("자동 매매 종료 메서드 호출됨")
+            
+            # 카지노 창 닫기는 브라우저 스레드에서
+            trading_manager = self.main_window.trading_manager
+            if hasattr(trading_manager, 'browser_executor'):
+                trading_manager.browser_executor.submit(CMD_CLOSE_ROOM, self._close_casino_windows)
+            else:
+                self._close_casino_windows()
+        
+        # 빵빠레 사운드 재생 - 추가된 부분
+        try:
+            from PyQt6.QtCore import QUrl
+            from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
+            import os
+            import sys
+            
+            # 사운드 파일 경로 지정 (실행 경로에 따라 다르게 처리)
+            if getattr(sys, 'frozen', False):
+                # PyInstaller로 실행된 경우
+                base_dir = os.path.dirname(sys.executable)
+                sound_paths = [
+                    os.path.join(base_dir, "_internal", "bbang.mp3"),  # _internal 폴더 내
+                    os.path.join(base_dir, "_internal", "bbang.wav"),
+                    os.path.join(base_dir, "bbang.mp3"),                # 루트 폴더
+                    os.path.join(base_dir, "bbang.wav")
+                ]
+            else:
+                # 개발 환경에서 실행된 경우 - 같은 경로에 있음
+                base_dir = os.path.dirname(os.path.abspath(__file__))
+                sound_paths = [
+                    os.path.join(base_dir, "bbang.mp3"),                # 현재 폴더
+                    os.path.join(base_dir, "bbang.wav"),
+                    os.path.join(os.path.dirname(base_dir), "bbang.mp3"),  # 상위 폴더
+                    os.path.join(os.path.dirname(base_dir), "bbang.wav"),
+                ]
+            
+            # 존재하는 첫 번째 파일 사용
+            sound_file = None
+            for path in sound_paths:
+                if os.path.exists(path):
+                    sound_file = path
+                    break
+            
+            self.logger.info(f"빵빠레 사운드 재생 시도: {sound_file}")
+            
+            if sound_file and os.path.exists(sound_file):
+                # QMediaPlayer 초기화
+                self.player = QMediaPlayer()
+                self.audio_output = QAudioOutput()
+                self.player.setAudioOutput(self.audio_output)
+                
+                # 볼륨 설정 (0.0 ~ 1.0)
+                self.audio_output.setVolume(0.8)
+                
+                # 미디어 설정 및 재생
+                self.player.setSource(QUrl.fromLocalFile(os.path.abspath(sound_file)))
+                self.player.play()
+                
+                self.logger.info("목표 금액 달성 빵빠레 사운드 재생 중...")
+            else:
+                self.logger.warning(f"빵빠레 사운드 파일을 찾을 수 없습니다: {sound_file}")
+        except Exception as e:
+            self.logger.error(f"빵빠레 사운드 재생 중 오류 발생: {e}")
+        
+        # 메시지 박스 표시 (베팅 코루틴에서 목표 금액을 확인한 경우에도 코루틴을 막지 않도록 미룸)
+        defer_dialog(
+            QMessageBox.information,
+            self.main_window, 
+            "목표 금액 달성", 
+            f"축하합니다! 목표 금액({target_amount:,}원)에 도달했습니다.\n현재 잔액: {current_balance:,}원\n자동 매매를 종료합니다."
+        )
+
+    def _close_casino_windows(self):
+        """메인 창만 남기고 카지노 창 닫기"""
+        # 간단하게 웹페이지만 종료하는 코드 추가
+        try:
+            # 현재 열린 창 모두 가져오기
+            window_handles = self.devtools.driver.window_handles
+            
+            # 2개 이상의 창이 열려 있는 경우 (카지노 창이 있는 경우)
+            if len(window_handles) >= 2:
+                # 메인 창으로 전환 (1번 창)
+                self.devtools.driver.switch_to.window(window_handles[0])
+                self.logger.info("메인 창(1번 창)으로 포커싱 전환 완료")
+                
+                # 카지노 창(2번 창부터) 닫기
+                for i in range(1, len(window_handles)):
+                    # 카지노 창으로 전환
+                    self.devtools.driver.switch_to.window(window_handles[i])
+                    # 창 닫기
+                    self.devtools.driver.close()
+                    self.logger.info(f"{i+1}번 창(카지노 창) 닫기 완료")
+                
+                # 다시 메인 창으로 전환
+                self.devtools.driver.switch_to.window(window_handles[0])
+                self.logger.info("모든 카지노 창 닫기 후 메인 창으로 포커싱 전환 완료")
+        except Exception as e:
+            self.logger.error(f"카지노 창 닫기 중 오류 발생: {e}")
+    
         
\ No newline at end of file
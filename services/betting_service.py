@@ -8,9 +8,71 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from utils.iframe_utils import switch_to_iframe_with_retry, find_element_in_iframes
+from utils.cdp_client import CDPError, NOT_CONNECTED_ERROR
+from utils.devtools import GAME_FRAME_RETRY_ERRORS
+from modules.bet_plan_script import BET_PLAN_SCRIPT, BETTING_OPEN_SCRIPT
+from utils.wait_engine import wait_until, wait_stats, WaitResult
+from utils.selector_registry import selector_registry
+from utils.element_cache import ElementCache
+from utils.latency_tracker import (
+    latency_tracker, STAGE_BET_WINDOW, STAGE_CHIP_CLICK, STAGE_AREA_CLICK,
+    STAGE_BET_CLICKS, STAGE_BET_CONFIRM, STAGE_RESULT_TO_BET, MARK_RESULT,
+)
 
 class BettingService:
-    def __init__(self, devtools, main_window, logger=None):
+    # 칩 단위 (큰 칩부터 사용)
+    CHIP_VALUES = (500000, 100000, 25000, 5000, 1000)
+    CHIP_SELECTOR_TEMPLATES = (
+        "div.chip--29b81[data-role='chip'][data-value='{value}']",
+        "div[data-role='chip'][data-value='{value}']",
+        "div.chip[data-value='{value}']",
+    )
+    BET_AREA_SELECTORS = {
+        'P': [
+            "div.spot--5ad7f[data-betspot-destination='Player']",
+            "div[data-betspot-destination='Player']",
+            "div.player-bet-spot",
+            "div.bet-spot-player",
+            "div[data-type='player']",
+            "div.bet-spot[data-type='Player']",
+            "div.bet-area-player",
+            "div.bet-area[data-role='player']"
+        ],
+        'B': [
+            "div.spot--5ad7f[data-betspot-destination='Banker']",
+            "div[data-betspot-destination='Banker']",
+            "div.banker-bet-spot",
+            "div.bet-spot-banker",
+            "div[data-type='banker']",
+            "div.bet-spot[data-type='Banker']",
+            "div.bet-area-banker",
+            "div.bet-area[data-role='banker']"
+        ],
+    }
+    # 베팅 스크립트: 클릭 간격, 금액 반영 대기 한도, 스크립트 전체 응답 대기 시간
+    BET_CLICK_INTERVAL_MS = 30
+    BET_CONFIRM_TIMEOUT_MS = 3000
+    BET_SCRIPT_TIMEOUT = 15  # 초
+
+    # 베팅 창 남은 시간 표시 후보 (첫 숫자를 초로 해석)
+    BETTING_TIMER_SELECTORS = [
+        "[data-role='countdown-timer']",
+        "[data-role='timer']",
+        "[class*='countdown']",
+        "[class*='Timer']"
+    ]
+    BETTING_OPEN_CHUNK = 5  # 초 (스크립트 1회 최대 대기 - 드라이버 스크립트 타임아웃보다 짧게)
+    STREAM_OPEN_MAX_AGE = 10  # 초 (남은 시간을 모를 때 WebSocket 베팅 시작 이벤트를 믿는 시간)
+    GUI_APPLY_TIMEOUT = 5  # 초 (브라우저 스레드에서 GUI 스레드의 결과 반영을 기다리는 최대 시간)
+
+    BET_AMOUNT_SELECTORS = [
+        "span[data-role='total-bet-label-value']",
+        "div[data-role='total-bet'] span",
+        "div.total-bet-amount",
+        "span.bet-amount"
+    ]
+
+    def __init__(self, devtools, main_window, logger=None, element_cache=None):
         self.logger = logger or logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
 
@@ -25,6 +87,14 @@ class BettingService:
         self.last_bet_result = None
         self.last_bet_time = 0
         
+        # 마지막으로 감지한 베팅 창 정보 {'open', 'waited_ms', 'remaining', 'timer'}
+        self.betting_window = None
+        # 게임 WebSocket으로 받은 베팅 시작/마감 (열림 여부, 남은 시간, 수신 시각) 또는 None
+        self.stream_betting_state = None
+        
+        # 방 단위 요소 핸들 캐시 (베팅 영역, 칩 - TradingManager에서 서비스 간 공유)
+        self.element_cache = element_cache or ElementCache()
+        
     # 사용되지 않음. 필요시 수동 클릭 디버깅용
     def _click_element_randomly(self, element, element_name="", mode="default"):
         try:
@@ -81,22 +151,25 @@ class BettingService:
 
             # 2. 메모리 최적화
             gc.collect()
-            time.sleep(0.5)
             
-            # 3. iframe 전환
-            if not switch_to_iframe_with_retry(self.devtools.driver, max_retries=5, max_depth=3):
-                self.logger.error("베팅: iframe 전환 실패, 베팅 진행 불가")
+            # 3. iframe 전환 (게임 프레임 CDP 컨텍스트가 있으면 전환 없이 직접 조회/클릭)
+            use_frame_context = self._use_game_frame()
+            if not use_frame_context and not self._switch_to_game_iframe():
                 return False
 
             # 4. 베팅 가능 상태 확인
-            if not self._wait_for_betting_available():
+            with latency_tracker.span(STAGE_BET_WINDOW):
+                betting_available = self._wait_for_betting_available(use_frame_context=use_frame_context)
+            if not betting_available:
                 return False
                 
             # 5. 베팅 실행
-            bet_success = self._execute_betting(bet_type, bet_amount)
+            bet_success = self._execute_betting(bet_type, bet_amount, use_frame_context)
             
             # 6. 결과 처리
             if bet_success:
+                # 새 결과 감지부터 베팅 금액 확인까지 전체 지연
+                latency_tracker.measure_since(STAGE_RESULT_TO_BET, MARK_RESULT)
                 self._handle_successful_bet(bet_type, game_count, current_room_name)
                 return True
             return False
@@ -105,6 +178,40 @@ class BettingService:
             self.logger.error(f"베팅 중 오류 발생: {e}", exc_info=True)
             return False
             
+    def _use_game_frame(self):
+        """게임 프레임 CDP 실행 컨텍스트를 사용할 수 있는지 여부"""
+        if not getattr(self.devtools, 'has_cdp', False):
+            return False
+        return self.devtools.get_game_frame() is not None
+
+    def _switch_to_game_iframe(self):
+        """Selenium 경로용 게임 iframe 전환"""
+        if not switch_to_iframe_with_retry(self.devtools.driver, max_retries=5, max_depth=3):
+            self.logger.error("베팅: iframe 전환 실패, 베팅 진행 불가")
+            return False
+        return True
+
+    def _chip_selectors(self, chip_value):
+        """칩 금액별 선택자 목록 (사이트별로 성공한 선택자 우선)"""
+        templates = selector_registry.order("chip", self.CHIP_SELECTOR_TEMPLATES)
+        return [template.format(value=chip_value) for template in templates]
+
+    def _split_chips(self, bet_amount):
+        """베팅 금액을 칩별 클릭 횟수로 나누기 {칩 금액: 횟수}"""
+        chip_clicks = {}
+        remaining = bet_amount
+
+        for chip in self.CHIP_VALUES:
+            count = remaining // chip
+            if count > 0:
+                chip_clicks[chip] = count
+                remaining %= chip
+
+        if not chip_clicks:
+            chip_clicks[1000] = 1
+            self.logger.warning("1000원 칩으로 기본 배팅 시도")
+        return chip_clicks
+
     def _validate_bet_conditions(self, bet_type, is_trading_active):
         """베팅 전 조건 검증"""
         # 최근 베팅 후 최소 시간 확인
@@ -131,166 +238,271 @@ class BettingService:
             
         return True
 
-    def _wait_for_betting_available(self):
-        """베팅 가능 상태가 될 때까지 대기"""
+    def _wait_for_betting_available(self, timeout=60, use_frame_context=False):
+        """
+        베팅 가능 상태가 될 때까지 대기
+        - 페이지 안에서 칩 활성화를 MutationObserver로 기다리는 스크립트 사용 (열리는 즉시 반환)
+        - 스크립트를 실행할 수 없으면 칩 상태를 짧은 간격으로 확인
+
+        Args:
+            timeout (float): 최대 대기 시간 (초)
+            use_frame_context (bool): 게임 프레임 CDP 컨텍스트에서 대기 (False면 iframe 전환된 드라이버 사용)
+        """
         self.logger.info("베팅 가능 상태 확인 시작...")
-        max_attempts = 30  # 최대 30초 대기 (2초 간격)
         
-        for attempt in range(max_attempts):
+        # 게임 WebSocket이 베팅 시작을 알렸으면 DOM 확인 없이 진행 (칩 상태는 베팅 스크립트가 다시 확인)
+        if self._stream_betting_open():
+            self.logger.info("베팅 가능 상태 감지됨 (WebSocket)")
+            self._update_game_state()
+            return True
+        
+        # 여러 선택자로 1000원 칩 요소 찾기 시도
+        chip_selectors = self._chip_selectors(1000)
+        trading_manager = getattr(self.main_window, 'trading_manager', None)
+        stop = lambda: getattr(trading_manager, 'stop_all_processes', False)
+        
+        window = self._await_betting_open(chip_selectors, timeout, use_frame_context, stop)
+        if window is not None:
+            self.betting_window = window
+            wait_stats.record(WaitResult(
+                "betting_open", window.get("open"), window["waited_ms"] / 1000,
+                timed_out=not window.get("open") and not window.get("stopped"),
+                stopped=bool(window.get("stopped")),
+            ))
+            if window.get("open"):
+                remaining = window.get("remaining")
+                remaining_text = f"{remaining}초" if remaining is not None else "알 수 없음"
+                self.logger.info(f"베팅 가능 상태 감지됨 (대기 {window['waited_ms']}ms, 남은 시간 {remaining_text})")
+                self._update_game_state()
+                return True
+            if window.get("stopped"):
+                self.logger.info("중지 명령으로 베팅 가능 상태 대기 중단")
+            else:
+                self.logger.warning("베팅 가능 상태 대기 시간 초과.")
+            return False
+        
+        result = wait_until(
+            lambda: self._is_chip_available(chip_selectors),
+            timeout=timeout,
+            interval=0.25,
+            label="betting_available",
+            stop=stop,
+        )
+        
+        if result:
+            self.logger.info(f"베팅 가능 상태 감지됨 ({result.elapsed:.1f}초)")
+            self._update_game_state()
+            return True
+        
+        if result.stopped:
+            self.logger.info("중지 명령으로 베팅 가능 상태 대기 중단")
+        else:
+            self.logger.warning("베팅 가능 상태 대기 시간 초과.")
+        return False
+
+    def apply_stream_betting_state(self, is_open, remaining=None):
+        """게임 WebSocket의 베팅 시작/마감 이벤트 반영"""
+        self.stream_betting_state = (is_open, remaining, time.monotonic())
+
+    def _stream_betting_open(self):
+        """WebSocket 기준으로 지금 베팅 창이 열려 있는지 여부"""
+        if not self.stream_betting_state:
+            return False
+        is_open, remaining, received = self.stream_betting_state
+        if not is_open:
+            return False
+        max_age = remaining if isinstance(remaining, (int, float)) and remaining > 0 else self.STREAM_OPEN_MAX_AGE
+        return time.monotonic() - received < max_age
+
+    def _await_betting_open(self, chip_selectors, timeout, use_frame_context, stop):
+        """
+        페이지 안에서 베팅 창이 열릴 때까지 대기 (BETTING_OPEN_SCRIPT)
+        - 스크립트 타임아웃을 넘지 않도록 BETTING_OPEN_CHUNK초씩 나누어 실행하고 사이마다 중지 여부 확인
+
+        Returns:
+            dict: {'open', 'waited_ms', 'remaining', 'timer'} (중지 시 'stopped': True)
+                  또는 None (스크립트를 실행할 수 없어 폴링으로 확인해야 하는 경우)
+        """
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            chunk = min(self.BETTING_OPEN_CHUNK, deadline - time.monotonic())
+            if chunk <= 0:
+                return {"open": False, "waited_ms": int((time.monotonic() - started) * 1000),
+                        "remaining": None, "timer": None}
+
+            args = (chip_selectors, self.BETTING_TIMER_SELECTORS, int(chunk * 1000))
             try:
-                # 여러 선택자로 1000원 칩 요소 찾기 시도
-                chip_selectors = [
-                    "div.chip--29b81[data-role='chip'][data-value='1000']",
-                    "div[data-role='chip'][data-value='1000']",
-                    "div.chip[data-value='1000']"
-                ]
-                
-                for selector in chip_selectors:
-                    chip_elements = self.devtools.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if chip_elements and len(chip_elements) > 0:
-                        chip_element = chip_elements[0]
-                        if chip_element.is_displayed():
-                            # 클릭 가능한 상태인지 확인 (disabled 클래스가 없는지)
-                            chip_class = chip_element.get_attribute("class")
-                            if "disabled" not in chip_class:
-                                self.logger.info("베팅 가능 상태 감지됨")
-                                self._update_game_state()
-                                return True
-                
-                self.logger.info(f"베팅 가능 상태 대기 중... 시도: {attempt+1}/{max_attempts}")
-                time.sleep(2)
+                if use_frame_context:
+                    window = self.devtools.game_frame_execute(
+                        BETTING_OPEN_SCRIPT, *args, await_promise=True, timeout=chunk + 5
+                    )
+                else:
+                    window = self.devtools.driver.execute_script(BETTING_OPEN_SCRIPT, *args)
             except Exception as e:
-                self.logger.warning(f"칩 클릭 가능 상태 확인 중 오류: {e}")
-                time.sleep(1)
-        
-        self.logger.warning("베팅 가능 상태 대기 시간 초과.")
+                self.logger.warning(f"베팅 창 대기 스크립트 실행 실패, 칩 상태 확인으로 전환: {e}")
+                return None
+
+            if not isinstance(window, dict):
+                return None
+            if window.get("open"):
+                window["waited_ms"] = int((time.monotonic() - started) * 1000)
+                return window
+            if stop():
+                window["stopped"] = True
+                window["waited_ms"] = int((time.monotonic() - started) * 1000)
+                return window
+
+    def _is_chip_available(self, chip_selectors):
+        """
+        칩이 보이고 클릭 가능한 상태(disabled 클래스 없음)인지 확인
+        CDP 클라이언트가 있으면 선택자 전체를 한 번의 왕복으로 조회하고, 없거나 실패하면 Selenium으로 확인
+        (게임 프레임 컨텍스트를 찾았으면 그 프레임에서만 조회)
+        """
+        if getattr(self.devtools, 'has_cdp', False):
+            try:
+                if self._use_game_frame():
+                    found = self.devtools.game_frame_query(chip_selectors)
+                else:
+                    found = self.devtools.cdp_query(chip_selectors)
+                chips = {chip["selector"]: chip for chip in found}
+                for selector in chip_selectors:
+                    chip = chips.get(selector)
+                    if chip and chip["visible"] and "disabled" not in chip["className"]:
+                        return True
+                return False
+            except CDPError as e:
+                self.logger.warning(f"CDP 칩 상태 확인 실패, Selenium으로 확인: {e}")
+
+        for selector in chip_selectors:
+            chip_elements = self.devtools.driver.find_elements(By.CSS_SELECTOR, selector)
+            if chip_elements and len(chip_elements) > 0:
+                chip_element = chip_elements[0]
+                if chip_element.is_displayed():
+                    # 클릭 가능한 상태인지 확인 (disabled 클래스가 없는지)
+                    chip_class = chip_element.get_attribute("class")
+                    if "disabled" not in chip_class:
+                        return True
         return False
 
     def _update_game_state(self):
         """베팅 가능 상태 감지 후 최신 결과 업데이트"""
         try:
             # 게임 상태 다시 확인하여 최신 결과 업데이트
-            game_state = self.main_window.trading_manager.game_monitoring_service.get_current_game_state(log_always=False)
+            # 같은 틱에서 이미 분석한 상태가 있으면 프레임을 다시 가져오지 않고 재사용
+            monitoring_service = self.main_window.trading_manager.game_monitoring_service
+            game_state = monitoring_service.get_current_game_state(
+                log_always=False, max_age=monitoring_service.TICK_REUSE_SECONDS
+            )
             if not game_state:
                 return
 
             latest_result = game_state.get('latest_result')
             self.logger.info(f"베팅 가능 상태 감지 후 최신 결과 재확인: {latest_result}")
             
-            # 최신 결과가 있으면 엑셀에 반영
+            # 최신 결과가 있으면 엑셀에 반영 (UI 갱신 포함 - GUI 스레드에서 실행하고 베팅 전에 끝나도록 대기)
             if latest_result:
-                # 현재 게임 카운트 저장
-                current_game_count = self.main_window.trading_manager.game_count
-                
-                result = self.main_window.trading_manager.excel_trading_service.process_game_results(
-                    game_state, 
-                    current_game_count,
-                    self.main_window.trading_manager.current_room_name,
-                    log_on_change=True
-                )
-                
-                if result[0] is not None:
-                    last_column, new_game_count, recent_results, next_pick = result
-                    
-                    # 게임 카운트가 한 단계만 증가했는지 확인 (안전 장치)
-                    if new_game_count > current_game_count and new_game_count <= current_game_count + 1:
-                        self.logger.info(f"게임 카운트 업데이트: {current_game_count} → {new_game_count}")
-                        
-                        # game 속성 대신 game_helper 사용 
-                        if hasattr(self.main_window.trading_manager, 'game_helper'):
-                            self.main_window.trading_manager.game_helper.process_previous_game_result(game_state, new_game_count)
-                        
-                        # 게임 카운트 업데이트
-                        self.main_window.trading_manager.game_count = new_game_count
-                        
-                        # 새로운 PICK 값이 있으면 현재 PICK 값 업데이트 및 UI 갱신
-                        if next_pick in ['P', 'B']:
-                            self.main_window.trading_manager.current_pick = next_pick
-                            self.main_window.update_betting_status(pick=next_pick)
-                    else:
-                        # 갑자기 게임 카운트가 2 이상 증가한 경우 경고 로그
-                        if new_game_count > current_game_count + 1:
-                            self.logger.warning(f"게임 카운트가 비정상적으로 증가: {current_game_count} → {new_game_count}")
-                            # 안전하게 1씩만 증가시킴
-                            self.main_window.trading_manager.game_count = current_game_count + 1
+                if hasattr(self.main_window, 'run_on_gui_thread'):
+                    self.main_window.run_on_gui_thread(self._apply_game_state, game_state).result(
+                        timeout=self.GUI_APPLY_TIMEOUT
+                    )
+                else:
+                    self._apply_game_state(game_state)
         except Exception as e:
             self.logger.warning(f"베팅 가능 상태 후 최신 결과 확인 중 오류: {e}")
+
+    def _apply_game_state(self, game_state):
+        """베팅 직전에 확인한 최신 결과를 게임 진행 상태에 반영 (GUI 스레드)"""
+        # 현재 게임 카운트 저장
+        current_game_count = self.main_window.trading_manager.game_count
+        
+        result = self.main_window.trading_manager.excel_trading_service.process_game_results(
+            game_state, 
+            current_game_count,
+            self.main_window.trading_manager.current_room_name,
+            log_on_change=True
+        )
+        
+        if result[0] is not None:
+            last_column, new_game_count, recent_results, next_pick = result
             
-    def _find_betting_area(self, bet_type):
-        """베팅 영역 찾기"""
-        if bet_type == 'P':
-            # Player 영역 찾기
-            player_selectors = [
-                "div.spot--5ad7f[data-betspot-destination='Player']",
-                "div[data-betspot-destination='Player']",
-                "div.player-bet-spot",
-                "div.bet-spot-player",
-                "div[data-type='player']",
-                "div.bet-spot[data-type='Player']",
-                "div.bet-area-player",
-                "div.bet-area[data-role='player']"
-            ]
-            
-            self.logger.info(f"Player 베팅 영역 찾는 중...")
-            for selector in player_selectors:
-                try:
-                    elements = self.devtools.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements and elements[0].is_displayed():
-                        return elements[0]
-                except:
-                    continue
-            
-            # XPath로 시도
-            xpath_expressions = [
-                "//div[contains(@class, 'spot') and contains(@*, 'Player')]",
-                "//div[contains(@class, 'player') or contains(@class, 'Player')]",
-                "//div[contains(text(), 'Player') and (contains(@class, 'bet') or contains(@class, 'spot'))]"
-            ]
-            
-            for xpath in xpath_expressions:
-                try:
-                    elements = self.devtools.driver.find_elements(By.XPATH, xpath)
-                    if elements and elements[0].is_displayed():
-                        return elements[0]
-                except:
-                    continue
-                    
-        elif bet_type == 'B':
-            # Banker 영역 찾기
-            banker_selectors = [
-                "div.spot--5ad7f[data-betspot-destination='Banker']",
-                "div[data-betspot-destination='Banker']",
-                "div.banker-bet-spot",
-                "div.bet-spot-banker",
-                "div[data-type='banker']",
-                "div.bet-spot[data-type='Banker']",
-                "div.bet-area-banker",
-                "div.bet-area[data-role='banker']"
-            ]
+            # 게임 카운트가 한 단계만 증가했는지 확인 (안전 장치)
+            if new_game_count > current_game_count and new_game_count <= current_game_count + 1:
+                self.logger.info(f"게임 카운트 업데이트: {current_game_count} → {new_game_count}")
+                
+                # game 속성 대신 game_helper 사용 
+                if hasattr(self.main_window.trading_manager, 'game_helper'):
+                    self.main_window.trading_manager.game_helper.process_previous_game_result(game_state, new_game_count)
+                
+                # 게임 카운트 업데이트
+                self.main_window.trading_manager.game_count = new_game_count
+                
+                # 새로운 PICK 값이 있으면 현재 PICK 값 업데이트 및 UI 갱신
+                if next_pick in ['P', 'B']:
+                    self.main_window.trading_manager.current_pick = next_pick
+                    self.main_window.update_betting_status(pick=next_pick)
+            else:
+                # 갑자기 게임 카운트가 2 이상 증가한 경우 경고 로그
+                if new_game_count > current_game_count + 1:
+                    self.logger.warning(f"게임 카운트가 비정상적으로 증가: {current_game_count} → {new_game_count}")
+                    # 안전하게 1씩만 증가시킴
+                    self.main_window.trading_manager.game_count = current_game_count + 1
             
-            self.logger.info(f"Banker 베팅 영역 찾는 중...")
-            for selector in banker_selectors:
-                try:
+    def resolve_room_elements(self):
+        """
+        방 입장 직후 베팅 영역과 칩 요소를 미리 찾아 캐시
+        (칩은 베팅 창이 닫혀 있으면 보이지 않을 수 있으므로 대기 없이 있는 것만 저장)
+        """
+        if not switch_to_iframe_with_retry(self.devtools.driver, max_retries=3, max_depth=3):
+            self.logger.warning("베팅 요소 캐시: iframe 전환 실패 - 베팅 시 찾음")
+            return False
+        try:
+            found = []
+            for bet_type in self.BET_AREA_SELECTORS:
+                if self._find_betting_area(bet_type, fallback=False):
+                    found.append(bet_type)
+            for chip_value in self.CHIP_VALUES:
+                for selector in self._chip_selectors(chip_value):
                     elements = self.devtools.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements and elements[0].is_displayed():
-                        return elements[0]
-                except:
-                    continue
-            
-            # XPath로 시도
-            xpath_expressions = [
-                "//div[contains(@class, 'spot') and contains(@*, 'Banker')]",
-                "//div[contains(@class, 'banker') or contains(@class, 'Banker')]",
-                "//div[contains(text(), 'Banker') and (contains(@class, 'bet') or contains(@class, 'spot'))]"
-            ]
-            
-            for xpath in xpath_expressions:
-                try:
-                    elements = self.devtools.driver.find_elements(By.XPATH, xpath)
-                    if elements and elements[0].is_displayed():
-                        return elements[0]
-                except:
-                    continue
+                    if elements:
+                        self.element_cache.put(f"chip_{chip_value}", elements[0])
+                        found.append(chip_value)
+                        break
+            self.logger.info(f"베팅 요소 캐시 완료: {found}")
+            return True
+        except Exception as e:
+            self.logger.warning(f"베팅 요소 캐시 중 오류: {e}")
+            return False
+        finally:
+            self.devtools.driver.switch_to.default_content()
+
+    def _find_betting_area(self, bet_type, fallback=True):
+        """베팅 영역 찾기 (방 단위 캐시 → 사이트별로 성공한 선택자 순)"""
+        return self.element_cache.get(
+            f"bet_area_{bet_type}",
+            lambda: self._resolve_betting_area(bet_type, fallback),
+            check=lambda element: element.is_displayed(),
+        )
+
+    def _resolve_betting_area(self, bet_type, fallback=True):
+        """베팅 영역을 선택자로 찾기 (fallback이면 마지막에 iframe 전체 검색)"""
+        name = "Player" if bet_type == 'P' else "Banker"
+        self.logger.info(f"{name} 베팅 영역 찾는 중...")
+        
+        # CSS 선택자 → XPath 순의 후보
+        candidates = [(By.CSS_SELECTOR, selector) for selector in self.BET_AREA_SELECTORS.get(bet_type, [])]
+        candidates += [
+            (By.XPATH, f"//div[contains(@class, 'spot') and contains(@*, '{name}')]"),
+            (By.XPATH, f"//div[contains(@class, '{name.lower()}') or contains(@class, '{name}')]"),
+            (By.XPATH, f"//div[contains(text(), '{name}') and (contains(@class, 'bet') or contains(@class, 'spot'))]"),
+        ]
+        
+        _, element = selector_registry.find(
+            f"bet_area_{bet_type}", candidates, self._find_displayed, key=lambda candidate: candidate[1]
+        )
+        if element or not fallback:
+            return element
         
         # 최후의 수단: iframe_utils의 find_element_in_iframes 사용
         self.logger.info(f"기본 방법으로 {bet_type} 베팅 영역을 찾지 못함. 고급 검색 시도...")
@@ -307,24 +519,35 @@ class BettingService:
             
         return None
 
+    def _find_displayed(self, candidate):
+        """(By, 선택자) 후보로 찾은 첫 요소가 보이면 반환"""
+        elements = self.devtools.driver.find_elements(*candidate)
+        if elements and elements[0].is_displayed():
+            return elements[0]
+        return None
+
     def _find_chip(self, chip_value):
-        """칩 찾기"""
-        # 여러 선택자로 칩 찾기
-        chip_selectors = [
-            f"div.chip--29b81[data-role='chip'][data-value='{chip_value}']",
-            f"div[data-role='chip'][data-value='{chip_value}']",
-            f"div.chip[data-value='{chip_value}']"
-        ]
+        """칩 찾기 (방 단위 캐시 → 사이트별로 성공한 선택자 순)"""
+        return self.element_cache.get(
+            f"chip_{chip_value}",
+            lambda: self._resolve_chip(chip_value),
+            check=lambda element: element.is_displayed(),
+        )
+
+    def _resolve_chip(self, chip_value):
+        """칩을 선택자로 찾기"""
+        def attempt(template):
+            elements = WebDriverWait(self.devtools.driver, 3).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, template.format(value=chip_value)))
+            )
+            if elements and len(elements) > 0 and elements[0].is_displayed():
+                return elements[0]
+            return None
         
-        for selector in chip_selectors:
-            try:
-                elements = WebDriverWait(self.devtools.driver, 3).until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector))
-                )
-                if elements and len(elements) > 0 and elements[0].is_displayed():
-                    return elements[0]
-            except:
-                continue
+        # 여러 선택자로 칩 찾기
+        _, element = selector_registry.find("chip", self.CHIP_SELECTOR_TEMPLATES, attempt)
+        if element:
+            return element
         
         # XPath 사용
         try:
@@ -337,33 +560,144 @@ class BettingService:
         
         return None
 
-    def _execute_betting(self, bet_type, bet_amount=None):
-        """베팅 실행"""
-        bet_element = self._find_betting_area(bet_type)
-        if not bet_element:
-            self.logger.error(f"{bet_type} 베팅 영역을 찾을 수 없음")
-            return False
-
+    def _execute_betting(self, bet_type, bet_amount=None, use_frame_context=False):
+        """
+        베팅 실행
+        - 페이지 안에서 스크립트 1회로 칩/영역 클릭과 금액 확인까지 처리 (BET_PLAN_SCRIPT)
+        - 스크립트를 실행할 수 없을 때만 요소별 클릭 방식으로 베팅
+
+        Args:
+            bet_type (str): 'P' 또는 'B'
+            bet_amount (int, optional): 베팅 금액 (없으면 마틴 서비스의 현재 금액)
+            use_frame_context (bool): 게임 프레임 CDP 컨텍스트에서 실행 (False면 iframe 전환된 드라이버 사용)
+        """
         if bet_amount is None:
             bet_amount = self.main_window.trading_manager.martin_service.get_current_bet_amount()
 
         self.logger.info(f"현재 베팅 금액: {bet_amount:,}원")
 
-        available_chips = [500000, 100000, 25000, 5000, 1000]
-        chip_clicks = {}
-        remaining = bet_amount
+        chip_clicks = self._split_chips(bet_amount)
 
-        for chip in available_chips:
-            count = remaining // chip
-            if count > 0:
-                chip_clicks[chip] = count
-                remaining %= chip
+        self.logger.info(f"베팅 금액 {bet_amount:,}원 -> 칩별 클릭 횟수: {chip_clicks}")
 
-        if not chip_clicks:
-            chip_clicks[1000] = 1
-            self.logger.warning("1000원 칩으로 기본 배팅 시도")
+        result = self._run_bet_plan(bet_type, bet_amount, chip_clicks, use_frame_context)
+        if result is not None:
+            return self._check_bet_plan_result(bet_type, result)
+
+        if use_frame_context and not self._switch_to_game_iframe():
+            return False
+        return self._execute_betting_stepwise(bet_type, chip_clicks)
+
+    def _run_bet_plan(self, bet_type, bet_amount, chip_clicks, use_frame_context):
+        """
+        페이지 안에서 베팅 스크립트 실행
+
+        Returns:
+            dict: 스크립트 결과 또는 None (스크립트를 실행하지 못해 요소별 클릭으로 진행해야 하는 경우)
+        """
+        plan = [[chip_value, self._chip_selectors(chip_value), clicks] for chip_value, clicks in chip_clicks.items()]
+        args = (
+            selector_registry.order(f"bet_area_{bet_type}", self.BET_AREA_SELECTORS[bet_type]),
+            plan,
+            selector_registry.order("bet_amount", self.BET_AMOUNT_SELECTORS),
+            bet_amount,
+            self.BET_CONFIRM_TIMEOUT_MS,
+            self.BET_CLICK_INTERVAL_MS,
+        )
+
+        # 스크립트를 보내기 전에 실패한 경우만 요소별 클릭으로 진행
+        if use_frame_context and self.devtools.get_game_frame() is None:
+            self.logger.warning("게임 프레임 컨텍스트를 찾을 수 없어 요소별 클릭으로 베팅")
+            return None
+
+        # 보낸 뒤 결과를 알 수 없을 때 비교할 기준 금액 (이전 라운드 표시가 남아 있어도 새 베팅으로 오인하지 않도록)
+        before = self._get_current_bet_amount()
+
+        try:
+            if use_frame_context:
+                result = self.devtools.game_frame_execute(
+                    BET_PLAN_SCRIPT, *args, await_promise=True, timeout=self.BET_SCRIPT_TIMEOUT
+                )
+            else:
+                result = self.devtools.driver.execute_script(BET_PLAN_SCRIPT, *args)
+        except CDPError as e:
+            if any(error in str(e) for error in (NOT_CONNECTED_ERROR,) + GAME_FRAME_RETRY_ERRORS):
+                # 보내기 전에 실패했거나 CDP가 실행 전에 거부 - 클릭하지 않았으므로 요소별 클릭으로 진행
+                self.logger.warning(f"베팅 스크립트를 실행하지 못함: {e}")
+                return None
+            return self._wait_unknown_bet_outcome(bet_amount, before, e)
+        except Exception as e:
+            return self._wait_unknown_bet_outcome(bet_amount, before, e)
+
+        if not isinstance(result, dict):
+            # 스크립트는 이미 실행되어 클릭했을 수 있으므로 요소별 클릭으로 다시 베팅하지 않음
+            return self._wait_unknown_bet_outcome(bet_amount, before, f"결과 형식 오류: {result!r}")
+        if result.get("click_ms") is not None:
+            latency_tracker.record(STAGE_BET_CLICKS, result["click_ms"] / 1000)
+            latency_tracker.record(STAGE_BET_CONFIRM, result["confirm_ms"] / 1000)
+        return result
+
+    def _wait_unknown_bet_outcome(self, bet_amount, before, error):
+        """
+        스크립트를 보낸 뒤 실패한 경우 - 클릭이 이미 진행됐을 수 있으므로 다시 베팅하지 않고 금액 반영만 확인
+
+        Args:
+            bet_amount (int): 베팅하려던 금액
+            before (int): 스크립트를 보내기 전 베팅 금액 표시 (이보다 늘어난 경우만 베팅된 것으로 봄)
+            error: 실패 원인 (로그용)
+
+        Returns:
+            dict: 베팅 스크립트 결과 형식 (금액이 늘지 않으면 ok=False)
+        """
+        self.logger.warning(f"베팅 스크립트 실행 중 오류 - 결과를 알 수 없어 금액 반영만 확인: {error}")
+
+        def increased_amount():
+            current = self._get_current_bet_amount()
+            return current if current > before else None
+
+        amount = wait_until(
+            increased_amount,
+            timeout=self.BET_CONFIRM_TIMEOUT_MS / 1000,
+            label="bet_amount_unknown",
+        ).value or before
+        placed = amount - before
+        if placed > 0:
+            return {"ok": True, "error": None, "amount": amount, "before": before, "expected": bet_amount,
+                    "confirmed": placed >= bet_amount, "clicks": None, "elapsed_ms": None}
+        return {"ok": False, "error": "unknown_outcome", "amount": amount, "before": before, "expected": bet_amount}
+
+    def _check_bet_plan_result(self, bet_type, result):
+        """베팅 스크립트 결과 확인 및 로그"""
+        if not result.get("ok"):
+            error = result.get("error")
+            if error == "area_not_found":
+                self.logger.error(f"{bet_type} 베팅 영역을 찾을 수 없음")
+            elif error == "chip_not_found":
+                self.logger.warning(f"{result.get('chip')}원 칩을 찾지 못함 - 베팅하지 않음")
+            elif error == "chip_disabled":
+                self.logger.warning(f"{result.get('chip'):,}원 칩이 비활성화 상태입니다 - 베팅하지 않음")
+            elif error == "unknown_outcome":
+                self.logger.warning("[실패] 베팅 결과를 알 수 없고 금액도 확인되지 않음 - 중복 베팅을 막기 위해 다시 베팅하지 않음")
+            else:
+                self.logger.warning(f"[실패] 베팅 후에도 금액이 반영되지 않았습니다. ({result})")
+            return False
+
+        placed = result["amount"] - result["before"]
+        if not result.get("confirmed"):
+            self.logger.warning(f"베팅 금액 일부만 확인됨: {placed:,}원 / 예상 {result['expected']:,}원")
+        self.logger.info(
+            f"[성공] 베팅 금액 확인됨: {result['amount']}원 "
+            f"(영역 클릭 {result['clicks']}회, {result['elapsed_ms']}ms)"
+        )
+        return True
+
+    def _execute_betting_stepwise(self, bet_type, chip_clicks):
+        """요소별 클릭 베팅 (베팅 스크립트를 실행할 수 없는 경우)"""
+        bet_element = self._find_betting_area(bet_type)
+        if not bet_element:
+            self.logger.error(f"{bet_type} 베팅 영역을 찾을 수 없음")
+            return False
 
-        self.logger.info(f"베팅 금액 {bet_amount:,}원 -> 칩별 클릭 횟수: {chip_clicks}")
         bet_successful = False
 
         for chip_value, clicks in chip_clicks.items():
@@ -379,13 +713,14 @@ class BettingService:
             # 칩 클릭 시도 (우선 일반 클릭, 실패 시 JS)
             try:
                 time.sleep(0.3)
-                try:
-                    chip_element.click()
-                    self.logger.info(f"[클릭] {chip_value:,}원 칩 클릭 성공")
-                except Exception as e:
-                    self.logger.warning(f"{chip_value:,}원 칩 일반 클릭 실패 → JS 클릭 시도")
-                    self.devtools.driver.execute_script("arguments[0].click();", chip_element)
-                    self.logger.info(f"[JS 클릭] {chip_value:,}원 칩 클릭 완료")
+                with latency_tracker.span(STAGE_CHIP_CLICK):
+                    try:
+                        chip_element.click()
+                        self.logger.info(f"[클릭] {chip_value:,}원 칩 클릭 성공")
+                    except Exception as e:
+                        self.logger.warning(f"{chip_value:,}원 칩 일반 클릭 실패 → JS 클릭 시도")
+                        self.devtools.driver.execute_script("arguments[0].click();", chip_element)
+                        self.logger.info(f"[JS 클릭] {chip_value:,}원 칩 클릭 완료")
                 time.sleep(0.3)
             except Exception as e:
                 self.logger.error(f"{chip_value}원 칩 클릭 실패: {e}")
@@ -394,21 +729,25 @@ class BettingService:
             for i in range(clicks):
                 try:
                     time.sleep(0.2)
-                    try:
-                        bet_element.click()
-                        self.logger.info(f"{bet_type} 영역 {i+1}/{clicks} 클릭 완료")
-                    except Exception as e:
-                        self.logger.warning(f"{bet_type} 영역 일반 클릭 실패 → JS 클릭")
-                        self.devtools.driver.execute_script("arguments[0].click();", bet_element)
-                        self.logger.info(f"{bet_type} 영역 JS 클릭 완료 ({i+1}/{clicks})")
+                    with latency_tracker.span(STAGE_AREA_CLICK):
+                        try:
+                            bet_element.click()
+                            self.logger.info(f"{bet_type} 영역 {i+1}/{clicks} 클릭 완료")
+                        except Exception as e:
+                            self.logger.warning(f"{bet_type} 영역 일반 클릭 실패 → JS 클릭")
+                            self.devtools.driver.execute_script("arguments[0].click();", bet_element)
+                            self.logger.info(f"{bet_type} 영역 JS 클릭 완료 ({i+1}/{clicks})")
                     bet_successful = True
                 except Exception as e:
                     self.logger.error(f"베팅 클릭 중 오류 발생: {e}")
                     continue
 
         if bet_successful:
-            time.sleep(1.5)
-            amount_after = self._get_current_bet_amount()
+            # 베팅 금액이 반영되는 즉시 확인
+            with latency_tracker.span(STAGE_BET_CONFIRM):
+                amount_after = wait_until(
+                    self._get_current_bet_amount, timeout=3, label="bet_amount_confirm"
+                ).value or 0
             if amount_after > 0:
                 self.logger.info(f"[성공] 베팅 금액 확인됨: {amount_after}원")
                 return True
@@ -421,23 +760,30 @@ class BettingService:
 
 
     def _get_current_bet_amount(self):
-        """현재 베팅 금액 조회"""
+        """현재 베팅 금액 조회 (사이트별로 성공한 선택자를 먼저 시도)"""
+        if self._use_game_frame():
+            try:
+                selectors = selector_registry.order("bet_amount", self.BET_AMOUNT_SELECTORS)
+                for element in self.devtools.game_frame_query(selectors):
+                    selector_registry.record_hit("bet_amount", element["selector"])
+                    return int(''.join(filter(str.isdigit, element["text"])) or '0')
+                return 0
+            except CDPError as e:
+                self.logger.warning(f"CDP 베팅 금액 확인 실패, Selenium으로 확인: {e}")
+                if not switch_to_iframe_with_retry(self.devtools.driver, max_retries=3, max_depth=3):
+                    return 0
+
         try:
             # 베팅 금액 요소 찾기
-            bet_amount_selectors = [
-                "span[data-role='total-bet-label-value']",
-                "div[data-role='total-bet'] span",
-                "div.total-bet-amount",
-                "span.bet-amount"
-            ]
-            
-            for selector in bet_amount_selectors:
+            def attempt(selector):
                 elements = self.devtools.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements and len(elements) > 0:
-                    total_bet_element = elements[0]
-                    amount_text = total_bet_element.text
-                    # 숫자만 추출
-                    return int(''.join(filter(str.isdigit, amount_text)) or '0')
+                return elements[0] if elements else None
+            
+            _, total_bet_element = selector_registry.find("bet_amount", self.BET_AMOUNT_SELECTORS, attempt)
+            if total_bet_element:
+                amount_text = total_bet_element.text
+                # 숫자만 추출
+                return int(''.join(filter(str.isdigit, amount_text)) or '0')
             
             return 0
         except Exception as e:
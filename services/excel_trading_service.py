@@ -4,6 +4,7 @@ import logging
 from typing import Dict, Any, Tuple, List, Optional, Union
 import time
 from utils.prediction_engine import PredictionEngine
+from utils.latency_tracker import latency_tracker, MARK_RESULT
 
 class ExcelTradingService:
     def __init__(self, main_window, logger=None):
@@ -52,6 +53,13 @@ class ExcelTradingService:
 
         # 새로운 결과가 있을 때는 항상 로깅
         self.logger.info(f"새로운 게임 결과 감지: {latest_result}")
+        # 결과→베팅 지연은 이 결과의 푸시 수신 또는 보드 조회 시작 시각부터 측정
+        latency_tracker.mark(MARK_RESULT, at=game_state.get('observed_at'))
+
+        # 방별 결과 주기 학습 (다음 결과 예상 구간에 맞춰 폴링)
+        if hasattr(self.main_window, 'trading_manager') and hasattr(self.main_window.trading_manager, 'round_cadence'):
+            self.main_window.trading_manager.round_cadence.record_result()
+            self.main_window.trading_manager.cadence_store.save()
 
         # 현재 열 찾기 및 결과 처리
         return self._process_new_result(latest_result, new_game_count, recent_results)
@@ -2,11 +2,22 @@
 import logging
 from selenium.webdriver.common.by import By
 from modules.game_detector import GameDetector
+from modules.bead_road_extractor import BEAD_ROAD_SCRIPT
 import time
-from utils.iframe_utils import switch_to_iframe_with_retry
+from utils.iframe_utils import switch_to_iframe_with_retry, frame_path_cache
+from utils.parse_cache import ParseCache
+from utils.element_cache import ElementCache
+from utils.cdp_client import CDPError
+from utils.latency_tracker import latency_tracker, STAGE_PAGE_FETCH
+from utils.wait_engine import wait_until, page_left
 
 class GameMonitoringService:
-    def __init__(self, devtools, main_window, logger=None):
+    GAME_STATE_CACHE_KEY = "game_state"
+    CLOSE_BUTTON_SELECTOR = "button[data-role='close-button']"
+    TICK_REUSE_SECONDS = 1.0  # 같은 틱으로 간주하여 게임 상태를 재사용할 시간 (초)
+    ROOM_CLOSE_TIMEOUT = 3  # 종료 버튼 클릭 후 게임 화면을 떠나기를 기다리는 최대 시간 (초)
+
+    def __init__(self, devtools, main_window, logger=None, parse_cache=None, element_cache=None):
         """게임 모니터링 서비스 초기화"""
         self.logger = logger or logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
@@ -14,12 +25,117 @@ class GameMonitoringService:
         self.devtools = devtools
         self.main_window = main_window
         self.game_detector = GameDetector()
+        
+        # True: 게임 iframe 안에서 스크립트로 보드만 추출 (page_source 전송/파싱 생략)
+        # False 또는 스크립트 실패 시: 기존 page_source 파싱 방식
+        self.use_script_extraction = True
+        
+        # 결과 푸시 채널 (TradingManager에서 설정) 및 현재 방의 MutationObserver 설치 여부
+        self.push_channel = None
+        self.push_observer_installed = False
+        self.push_observer_attempted = False  # 현재 방에서 설치를 시도했는지 여부 (실패해도 CDP 경로 사용)
+        
+        # 틱 단위 파싱 캐시 (TradingManager에서 서비스 간 공유)
+        self.parse_cache = parse_cache or ParseCache()
+        
+        # 방 단위 요소 핸들 캐시 (종료 버튼 - 베팅 영역/칩과 함께 TradingManager에서 공유)
+        self.element_cache = element_cache or ElementCache()
+        
+        # 현재 방에서 CDP 직접 추출로 보드를 찾지 못했는지 여부 (다른 출처 iframe 등 → Selenium 경로)
+        self.cdp_board_unavailable = False
+        
+        # 직전 보드 조회 시작 시각 (time.perf_counter()) - 그 뒤에 받은 푸시가 있으면 결과 시각으로 사용
+        self._last_fetch_started = 0.0
+
+    def reset_room_state(self):
+        """방 이동/입장 시 방 단위 추출 상태 초기화"""
+        # 새 방에는 MutationObserver를 다시 설치해야 함
+        self.push_observer_installed = False
+        self.push_observer_attempted = False
+        self.cdp_board_unavailable = False
+        # 새 방 창의 iframe 경로와 게임 프레임 실행 컨텍스트는 다시 확인
+        frame_path_cache.invalidate(self.devtools.driver)
+        if hasattr(self.devtools, 'invalidate_game_frame'):
+            self.devtools.invalidate_game_frame()
+        # 이전 방의 요소 핸들은 더 이상 쓸 수 없음
+        self.element_cache.invalidate()
 
-    def get_current_game_state(self, log_always=True):
-        """현재 게임 상태를 분석"""
+    def resolve_room_elements(self):
+        """방 입장 직후 종료 버튼을 미리 찾아 캐시"""
+        try:
+            if not switch_to_iframe_with_retry(self.devtools.driver, max_retries=3):
+                return False
+            elements = self.devtools.driver.find_elements(By.CSS_SELECTOR, self.CLOSE_BUTTON_SELECTOR)
+            return self.element_cache.put("close_button", elements[0] if elements else None) is not None
+        except Exception as e:
+            self.logger.warning(f"종료 버튼 캐시 중 오류: {e}")
+            return False
+        finally:
+            try:
+                self.devtools.driver.switch_to.default_content()
+            except Exception:
+                pass
+
+    def _can_use_cdp(self, probe=False):
+        """CDP 직접 추출 경로를 사용할 수 있는지 여부"""
+        if not self.use_script_extraction or self.cdp_board_unavailable:
+            return False
+        if not getattr(self.devtools, 'has_cdp', False):
+            return False
+        if not self.push_channel or self.push_observer_attempted:
+            return True
+        # MutationObserver 설치 전: 게임 프레임 기본 world 컨텍스트가 있으면 CDP로 설치,
+        # 없으면 Selenium iframe 전환 경로에서 설치
+        frame = self.devtools.get_game_frame(remember_miss=not probe)
+        return frame is not None and not frame.isolated
+
+    def _install_push_observer(self, frame=None):
+        """방마다 한 번 결과 푸시용 MutationObserver 설치 (frame이 있으면 CDP 컨텍스트에 직접 설치)"""
+        if not self.push_channel or self.push_observer_installed:
+            return
+        self.push_observer_attempted = True
+        self.push_observer_installed = self.push_channel.install_observer(frame)
+
+    def get_current_game_state(self, log_always=True, max_age=0, probe=False):
+        """
+        현재 게임 상태를 분석
+        
+        Args:
+            log_always (bool): 분석 시작 로그 출력 여부
+            max_age (float): 0보다 크면 이 시간(초) 안에 분석한 상태를 프레임을 다시 가져오지 않고 재사용
+            probe (bool): 방 입장 직후 보드가 그려지기를 기다리는 확인 - 게임 프레임/보드를 찾지 못해도
+                방 단위 상태(cdp_board_unavailable, 게임 프레임 캐시)로 기억하지 않고 MutationObserver도 설치하지 않음
+        """
+        if max_age > 0:
+            cached_state = self.parse_cache.latest(self.GAME_STATE_CACHE_KEY, max_age)
+            if cached_state is not None:
+                return cached_state
+        
         try:
             if log_always:
                 self.logger.info("현재 게임 상태 분석 중...")
+            observed_at = self._observed_since_last_fetch()
+            
+            # CDP 경로: iframe 전환과 chromedriver 왕복 없이 브라우저 웹소켓으로 보드만 추출
+            # (방 입장 후 찾은 게임 프레임 컨텍스트에서 직접 실행, 없으면 접근 가능한 하위 문서 순회)
+            if self._can_use_cdp(probe):
+                try:
+                    frame = self.devtools.get_game_frame(remember_miss=not probe)
+                    if frame is not None:
+                        if not frame.isolated and not probe:
+                            self._install_push_observer(frame)
+                        with latency_tracker.span(STAGE_PAGE_FETCH):
+                            packed = self.devtools.game_frame_execute(BEAD_ROAD_SCRIPT)
+                    else:
+                        with latency_tracker.span(STAGE_PAGE_FETCH):
+                            packed = self.devtools.cdp_execute(BEAD_ROAD_SCRIPT)
+                    if packed is not None:
+                        return self._parse_state(packed, self.game_detector.detect_game_state_from_packed, observed_at)
+                    if not probe:
+                        self.cdp_board_unavailable = True
+                        self.logger.info("CDP로 보드를 찾을 수 없어 Selenium 경로 사용 (다른 출처 iframe 등)")
+                except CDPError as e:
+                    self.logger.warning(f"CDP 보드 추출 실패, Selenium 경로로 전환: {e}")
             
             # 기본 프레임으로 전환
             self.devtools.driver.switch_to.default_content()
@@ -29,13 +145,25 @@ class GameMonitoringService:
                 self.logger.error("게임 상태 확인: iframe 전환 실패")
                 return None
             
-            # 페이지 소스 가져오기
-            html_content = self.devtools.driver.page_source
+            # 방마다 한 번 결과 푸시용 MutationObserver 설치
+            if not probe:
+                self._install_push_observer()
             
-            # 게임 상태 감지
-            game_state = self.game_detector.detect_game_state(html_content)
+            # 스크립트 추출 모드: 압축된 보드 문자열만 받아서 바로 감지
+            if self.use_script_extraction:
+                try:
+                    with latency_tracker.span(STAGE_PAGE_FETCH):
+                        packed = self.devtools.driver.execute_script(BEAD_ROAD_SCRIPT)
+                    return self._parse_state(packed, self.game_detector.detect_game_state_from_packed, observed_at)
+                except Exception as e:
+                    self.logger.warning(f"스크립트 보드 추출 실패, page_source 방식으로 전환: {e}")
             
-            return game_state
+            # 페이지 소스 가져오기
+            with latency_tracker.span(STAGE_PAGE_FETCH):
+                html_content = self.devtools.driver.page_source
+            
+            # 게임 상태 감지 (같은 내용이면 캐시된 상태 재사용)
+            return self._parse_state(html_content, self.game_detector.detect_game_state, observed_at)
             
         except Exception as e:
             self.logger.error(f"게임 상태 분석 중 오류 발생: {e}", exc_info=True)
@@ -48,6 +176,31 @@ class GameMonitoringService:
                 
             return None
 
+    def _observed_since_last_fetch(self):
+        """
+        이번 조회에서 새 결과가 나오면 그 결과가 나타난 시각으로 볼 값 (time.perf_counter())
+        - 직전 조회 이후 결과 푸시를 받았으면 푸시 수신 시각, 아니면 이번 조회 시작 시각
+        """
+        now = time.perf_counter()
+        observed = now
+        pushed = getattr(self.push_channel, 'last_push_perf', 0.0) if self.push_channel else 0.0
+        if pushed > self._last_fetch_started:
+            observed = pushed
+        self._last_fetch_started = now
+        return observed
+
+    def _parse_state(self, content, detect, observed_at):
+        """
+        보드 내용으로 게임 상태 구성 (같은 내용이면 캐시된 상태 재사용)
+        - 새로 파싱한 상태에는 결과가 나타난 시각(observed_at, perf_counter)을 함께 저장
+        """
+        def parse(text):
+            state = detect(text)
+            if state is not None:
+                state['observed_at'] = observed_at
+            return state
+        return self.parse_cache.get_or_parse(self.GAME_STATE_CACHE_KEY, content, parse)
+
     def close_current_room(self):
         """현재 열린 방을 종료하고 카지노 로비 창으로 포커싱 전환"""
         try:
@@ -66,6 +219,7 @@ class GameMonitoringService:
             try:
                 # 기본 프레임으로 전환
                 self.devtools.driver.switch_to.default_content()
+                game_url = self.devtools.driver.current_url
                 
                 # 개선된 iframe 전환
                 iframe_switched = switch_to_iframe_with_retry(self.devtools.driver, max_retries=3)
@@ -75,10 +229,13 @@ class GameMonitoringService:
                     
                     # 종료 버튼 찾기 (직접 접근 방식으로 변경)
                     try:
-                        close_button = self.devtools.driver.find_element(By.CSS_SELECTOR, "button[data-role='close-button']")
+                        close_button = self.element_cache.get(
+                            "close_button",
+                            lambda: self.devtools.driver.find_element(By.CSS_SELECTOR, self.CLOSE_BUTTON_SELECTOR)
+                        )
                         close_button.click()
                         self.logger.info("방 종료 버튼 클릭 완료!")
-                        time.sleep(2)
+                        self._wait_room_closed(game_url)
                     except Exception as e:
                         self.logger.warning(f"종료 버튼 클릭 실패: {e}")
                         # JavaScript로 시도 (실패한 경우)
@@ -87,7 +244,7 @@ class GameMonitoringService:
                                 "document.querySelector('button[data-role=\"close-button\"]').click();"
                             )
                             self.logger.info("JavaScript로 종료 버튼 클릭 완료!")
-                            time.sleep(1)
+                            self._wait_room_closed(game_url)
                         except:
                             pass
                 else:
@@ -117,6 +274,20 @@ class GameMonitoringService:
                 
             return False
 
+    def _wait_room_closed(self, game_url):
+        """종료 버튼 클릭 후 게임 화면을 떠날 때까지 대기 (게임 URL을 벗어나거나 게임 iframe이 사라지면 바로 진행)"""
+        try:
+            self.devtools.driver.switch_to.default_content()
+        except Exception:
+            pass
+        result = wait_until(
+            page_left(self.devtools.driver, game_url),
+            timeout=self.ROOM_CLOSE_TIMEOUT, interval=0.2, label="room_closed"
+        )
+        if not result:
+            self.logger.warning(f"방 종료 확인 시간 초과 ({self.ROOM_CLOSE_TIMEOUT}초) - 로비로 전환 계속")
+        return bool(result)
+
     def _switch_to_lobby_window(self, window_handles):
         """로비 창으로 전환 (메소드 추출)"""
         try:
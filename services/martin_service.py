@@ -1,6 +1,8 @@
 # services/martin_service.py 리팩토링
 import logging
 from utils.settings_manager import SettingsManager
+from utils.result_history import ResultHistory
+from utils.latency_tracker import latency_tracker, STAGE_MARTIN_AMOUNT
 
 class MartinBettingService:
     def __init__(self, main_window, logger=None):
@@ -29,13 +31,14 @@ class MartinBettingService:
         self.has_bet_in_current_room = False
         
         # 역배팅 관련 변수 추가
-        self.recent_results = []  # 최근 5게임 결과 기록
+        self.recent_results = ResultHistory(capacity=10, symbols=("win", "lose"))  # 최근 게임 결과 기록 (무승부 제외)
         self.game_count_for_mode = 0  # 모드 결정을 위한 게임 카운터
         self.mode_game_threshold = 5  # 모드 결정을 위한 게임 수 임계값
         self.original_pick = None  # 원래 선택한 PICK 값
         self.diff_history = []  # 10판 단위 승패차 기록
         self.current_direction = 'forward'  # 현재 방향 (forward / reverse)
         
+    @latency_tracker.timed(STAGE_MARTIN_AMOUNT)
     def get_current_bet_amount(self):
         """현재 마틴 단계에 따른 베팅 금액을 반환합니다."""
         # 최신 설정 로드
@@ -174,7 +177,7 @@ class MartinBettingService:
         self.has_bet_in_current_room = False
         
         # 역배팅 변수 초기화
-        self.recent_results = []
+        self.recent_results.clear()
         self.game_count_for_mode = 0
         self.original_pick = None
         
@@ -4,9 +4,9 @@ import logging
 import re
 from PyQt6.QtWidgets import QMessageBox
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from utils.iframe_utils import IframeManager, switch_to_iframe_with_retry
+from utils.selector_registry import selector_registry
+from utils.wait_engine import wait_until, document_ready, new_window_opened, element_present
 
 class RoomEntryService:
     def __init__(self, devtools, main_window, room_manager, logger=None):
@@ -36,6 +36,23 @@ class RoomEntryService:
         self.refresh_interval = 60  # 새로고침 사이의 최소 간격(초)
         self.consecutive_failures = 0
 
+    def _show_warning(self, title, message):
+        """경고창 표시 (브라우저 스레드에서 방에 입장하는 경우 GUI 스레드에서 표시)"""
+        if hasattr(self.main_window, 'run_on_gui_thread'):
+            self.main_window.run_on_gui_thread(QMessageBox.warning, self.main_window, title, message)
+        else:
+            QMessageBox.warning(self.main_window, title, message)
+
+    def _read_entered_game_state(self, monitoring_service):
+        """
+        입장한 방의 게임 상태 (보드에 결과가 그려지기 전이면 None)
+        - 보드가 아직 없어도 방 단위 캐시(게임 프레임, CDP 보드 경로)를 바꾸지 않도록 probe로 조회
+        """
+        game_state = monitoring_service.get_current_game_state(log_always=False, probe=True)
+        if game_state and game_state.get('round', 0) > 0:
+            return game_state
+        return None
+
     def enter_room(self):
         """
         랜덤 순서로 생성된 방 목록에서 다음 방에 입장합니다.
@@ -69,7 +86,7 @@ class RoomEntryService:
                 room_name = self.room_manager.get_next_room_to_visit()
                 
                 if not room_name:
-                    QMessageBox.warning(self.main_window, "알림", "자동 매매를 시작할 방을 선택해주세요.")
+                    self._show_warning("알림", "자동 매매를 시작할 방을 선택해주세요.")
                     return None
                 
                 # 방 이름에서 첫 번째 줄만 추출 (UI 표시용)
@@ -82,7 +99,7 @@ class RoomEntryService:
                     if len(window_handles) >= 2:
                         # 카지노 로비 창으로 전환 시도
                         self.devtools.driver.switch_to.window(window_handles[1])
-                        time.sleep(1)
+                        wait_until(document_ready(self.devtools.driver), timeout=3, label="lobby_window_ready")
                         
                         # 새로고침 간격 조건 추가 (마지막 새로고침 후 최소 시간이 지났고, 실패 횟수가 임계값을 넘었을 때만)
                         current_time = time.time()
@@ -90,7 +107,7 @@ class RoomEntryService:
                             (self.consecutive_failures >= 2 or attempts % 5 == 0)):  # 연속 2번 실패했거나 5번째 시도마다
                             # self.logger.info("카지노 로비 페이지 새로고침")
                             self.devtools.driver.refresh()
-                            time.sleep(3)
+                            wait_until(document_ready(self.devtools.driver), timeout=10, label="lobby_refresh")
                             self.last_refresh_time = current_time
                             self.consecutive_failures = 0  # 새로고침 후 카운터 리셋
 
@@ -107,23 +124,12 @@ class RoomEntryService:
                 # 성공하면 연속 실패 카운터 리셋
                 self.consecutive_failures = 0
                 
-                # 방 입장 후 게임 수 확인
-                time.sleep(2)  # 방 입장 후 충분히 대기
-                
-                # 게임 상태 확인
-                retry_state_check = 3
-                game_state = None
-                
-                # 게임 상태 확인 여러 번 시도
-                for i in range(retry_state_check):
-                    try:
-                        game_state = self.main_window.trading_manager.game_monitoring_service.get_current_game_state()
-                        if game_state:
-                            break
-                        time.sleep(1)
-                    except Exception as e:
-                        self.logger.warning(f"게임 상태 확인 {i+1}번째 시도 실패: {e}")
-                        time.sleep(1)
+                # 방 입장 후 게임 수 확인 (보드에 결과가 그려지는 즉시 진행 - 그 전에는 round가 0)
+                monitoring_service = self.main_window.trading_manager.game_monitoring_service
+                game_state = wait_until(
+                    lambda: self._read_entered_game_state(monitoring_service),
+                    timeout=6, interval=0.5, label="room_game_state"
+                ).value
                 
                 if game_state:
                     game_count = game_state.get('round', 0)
@@ -157,8 +163,7 @@ class RoomEntryService:
                 self.consecutive_failures += 1
                 
                 if attempts >= max_attempts:
-                    QMessageBox.warning(
-                        self.main_window, 
+                    self._show_warning(
                         "방 입장 실패", 
                         f"여러 방에 입장을 시도했으나 모두 실패했습니다.\n최대 시도 횟수({max_attempts}회)를 초과했습니다."
                     )
@@ -187,7 +192,7 @@ class RoomEntryService:
                         if current_time - self.last_refresh_time > self.refresh_interval:
                             # self.logger.info(f"페이지 새로고침 후 재시도 중...")
                             self.devtools.driver.refresh()
-                            time.sleep(3)  # 페이지 로드 대기
+                            wait_until(document_ready(self.devtools.driver), timeout=10, label="lobby_refresh")
                             self.last_refresh_time = current_time
                             refresh_needed = False
                     except Exception as e:
@@ -242,15 +247,18 @@ class RoomEntryService:
                     self.devtools.driver.switch_to.default_content()
                     continue
                 
-                # 검색 입력 필드에 방 이름 입력
-                time.sleep(1)
+                # 검색 입력 필드에 방 이름 입력 (입력 가능해지면 바로)
+                wait_until(
+                    lambda: search_input.is_displayed() and search_input.is_enabled(),
+                    timeout=2, label="search_input_ready"
+                )
                 search_input.clear()
                 search_input.send_keys(search_name)
                 
-                # 검색 결과가 나타날 때까지 충분히 대기
-                time.sleep(2)
+                # 새 창 감지를 위해 클릭 전 창 목록 저장
+                known_handles = self.devtools.driver.window_handles
                 
-                # 검색 결과 찾기 시도
+                # 검색 결과 찾기 시도 (결과가 나타나는 즉시)
                 try:
                     # 여러 선택자로 검색 결과 찾기
                     result_selectors = [
@@ -260,21 +268,14 @@ class RoomEntryService:
                         "div.game-result-item"
                     ]
                     
-                    search_results = []
-                    for selector in result_selectors:
-                        try:
-                            results = WebDriverWait(self.devtools.driver, 3).until(
-                                EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector))
-                            )
-                            if results:
-                                search_results = results
-                                break
-                        except:
-                            continue
+                    search_result = wait_until(
+                        element_present(self.devtools.driver, result_selectors),
+                        timeout=5, label="search_results"
+                    ).value
                     
                     # 검색 결과가 있는지 확인
-                    if search_results and len(search_results) > 0:
-                        search_results[0].click()
+                    if search_result:
+                        search_result.click()
                     else:
                         # JavaScript로 다시 시도
                         js_script = """
@@ -306,14 +307,17 @@ class RoomEntryService:
                     self.logger.warning(f"검색 결과 처리 중 오류: {e}")
                     continue  # 다음 재시도로 넘어감
 
-                # 새 창으로 전환
+                # 새 창으로 전환 (새 창이 열리는 즉시)
                 try:
-                    time.sleep(3)  # 새 창이 로드될 때까지 충분히 대기
+                    new_handle = wait_until(
+                        new_window_opened(self.devtools.driver, known_handles),
+                        timeout=10, label="room_window"
+                    ).value
                     new_window_handles = self.devtools.driver.window_handles
                     
-                    if len(new_window_handles) > 1:
-                        self.devtools.driver.switch_to.window(new_window_handles[-1])
-                        time.sleep(1)
+                    if new_handle or len(new_window_handles) > 1:
+                        self.devtools.driver.switch_to.window(new_handle or new_window_handles[-1])
+                        wait_until(document_ready(self.devtools.driver), timeout=5, label="room_window_ready")
                         
                         # UI 업데이트
                         self.main_window.update_betting_status(room_name=room_name)
@@ -345,30 +349,21 @@ class RoomEntryService:
         """검색 입력 필드를 다양한 방법으로 찾는 헬퍼 메서드"""
         search_input = None
         
-        # 방법 1: 기본 선택자들
+        # 방법 1: 기본 선택자들 + 복합 선택자 (사이트별로 성공한 선택자부터)
         search_selectors = [
             "input.TableTextInput--464ac",
             "input[data-role='search-input']",
             "input[placeholder='찾기']",
-            "input.search-input"
+            "input.search-input",
+            "input.TableTextInput--464ac[placeholder='찾기'][data-role='search-input']"
         ]
         
-        for selector in search_selectors:
-            try:
-                search_input = self.devtools.driver.find_element(By.CSS_SELECTOR, selector)
-                if search_input:
-                    return search_input
-            except:
-                continue
-        
-        # 방법 2: 복합 선택자
-        try:
-            composite_selector = "input.TableTextInput--464ac[placeholder='찾기'][data-role='search-input']"
-            search_input = self.devtools.driver.find_element(By.CSS_SELECTOR, composite_selector)
-            if search_input:
-                return search_input
-        except:
-            pass
+        _, search_input = selector_registry.find(
+            "search_input", search_selectors,
+            lambda selector: self.devtools.driver.find_element(By.CSS_SELECTOR, selector)
+        )
+        if search_input:
+            return search_input
         
         # 방법 3: 모든 input 요소 확인
         try:
@@ -0,0 +1,133 @@
+# tests/test_balance_ledger.py
+"""
+로컬 잔액 장부(BalanceLedger) 테스트
+- 결과별 정산: 플레이어 승리, 뱅커 승리(커미션 0.95), 무승부 반환, 패배
+- needs_reconcile(): N개 결과마다, 차이 감지 후, 목표 금액 도달 시 DOM 대조
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from utils.balance_ledger import BalanceLedger
+
+
+def _ledger(balance=100000, **kwargs):
+    ledger = BalanceLedger(**kwargs)
+    ledger.sync(balance, settled=True)
+    return ledger
+
+
+@pytest.mark.parametrize("bet_type, status, expected", [
+    ('P', "win", 100000 - 10000 + 20000),  # 플레이어 1배
+    ('B', "win", 100000 - 10000 + 19500),  # 뱅커 0.95배 (커미션 5%)
+    ('P', "tie", 100000),  # 무승부는 베팅 금액 반환
+    ('B', "tie", 100000),
+    ('P', "lose", 100000 - 10000),
+    ('B', "lose", 100000 - 10000),
+])
+def test_settle(bet_type, status, expected):
+    ledger = _ledger()
+
+    ledger.place(bet_type, 10000)
+    assert ledger.balance == 90000
+    assert ledger.pending == (bet_type, 10000)
+
+    assert ledger.settle(status) == expected
+    assert ledger.balance == expected
+    assert ledger.pending is None
+    assert ledger.results_since_sync == 1
+
+
+def test_banker_commission_rounds():
+    # 1,500 × 0.95 = 1,425 / 1,010 × 0.95 = 959.5 → 960
+    assert BalanceLedger.payout('B', 1500, "win") == 1500 + 1425
+    assert BalanceLedger.payout('B', 1010, "win") == 1010 + 960
+    assert BalanceLedger.payout('P', 1010, "win") == 2020
+
+
+def test_settle_without_pending_bet():
+    ledger = _ledger()
+
+    assert ledger.settle("win") == 100000
+    assert ledger.results_since_sync == 0
+
+
+def test_unknown_balance_needs_reconcile():
+    ledger = BalanceLedger()
+    assert ledger.needs_reconcile()
+
+    ledger.place('P', 10000)
+    assert ledger.settle("win") is None
+    assert ledger.needs_reconcile()
+
+
+def test_reconcile_after_n_results():
+    ledger = _ledger(reconcile_every=3)
+
+    for _ in range(2):
+        ledger.place('P', 1000)
+        ledger.settle("lose")
+        assert not ledger.needs_reconcile()
+
+    ledger.place('P', 1000)
+    ledger.settle("lose")
+    assert ledger.needs_reconcile()
+
+    # 대조하면 다시 N개 결과까지 대조하지 않음
+    assert ledger.sync(ledger.balance) == 0
+    assert ledger.results_since_sync == 0
+    assert not ledger.needs_reconcile()
+
+
+def test_reconcile_after_drift():
+    ledger = _ledger(drift_threshold=1000)
+
+    ledger.place('B', 10000)
+    ledger.settle("win")  # 예상 109,500
+
+    # 허용치 미만의 차이는 무시
+    assert ledger.sync(109900) == 400
+    assert not ledger.drift_detected
+    assert not ledger.needs_reconcile()
+
+    # 허용치 이상 차이 나면 다음 결과부터 매번 대조
+    assert ledger.sync(108900) == -1000
+    assert ledger.drift_detected
+    assert ledger.needs_reconcile()
+
+    # 다시 맞으면 해제
+    ledger.sync(108900)
+    assert not ledger.drift_detected
+    assert not ledger.needs_reconcile()
+
+
+def test_reconcile_near_target():
+    ledger = _ledger()
+
+    ledger.place('P', 10000)
+    ledger.settle("win")  # 예상 110,000
+    assert not ledger.needs_reconcile(target_amount=120000)
+    assert not ledger.needs_reconcile()  # 목표 금액 미설정
+
+    ledger.place('P', 10000)
+    ledger.settle("win")  # 예상 120,000
+    assert ledger.needs_reconcile(target_amount=120000)
+
+
+def test_reset():
+    ledger = _ledger(drift_threshold=10)
+    ledger.place('P', 1000)
+    ledger.sync(50000)
+
+    ledger.reset()
+
+    assert ledger.balance is None
+    assert ledger.pending is None
+    assert ledger.results_since_sync == 0
+    assert not ledger.drift_detected
+    assert ledger.needs_reconcile()
@@ -0,0 +1,100 @@
+# tests/test_ws_frame_ingest.py
+"""
+게임 WebSocket 프레임 수신 테스트
+- 기록한 프레임(fixtures/ws_frames.jsonl)을 replay()로 디코딩한 이벤트 확인
+- serve_frames() 로컬 재생 서버 → websockets 클라이언트 → feed() 왕복 확인
+"""
+import asyncio
+import os
+import socket
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+pytest.importorskip("PyQt6")
+
+from utils.ws_frame_ingest import (
+    WebSocketFrameIngest, JsonFrameDecoder, replay, serve_frames, load_frames,
+    ROUND_RESULT, BALANCE, BETTING_OPEN, BETTING_CLOSED,
+)
+
+FRAMES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "ws_frames.jsonl")
+
+# 기록 순서대로 기대하는 이벤트 (ping, heartbeat, 바이너리 프레임은 이벤트 없음)
+EXPECTED_EVENTS = [
+    (BETTING_OPEN, {"remaining": 15}),
+    (BETTING_CLOSED, {}),
+    (ROUND_RESULT, {"result": "B", "round": 23}),
+    (BALANCE, {"balance": 1250000}),
+]
+
+
+def _summary(events):
+    return [(event.kind, event.data) for event in events]
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_replay_with_decoder():
+    events = replay(FRAMES, JsonFrameDecoder())
+
+    assert _summary(events) == EXPECTED_EVENTS
+    assert all(event.url == "wss://game.example/ws" for event in events)
+
+
+def test_replay_with_ingest_emits_events():
+    ingest = WebSocketFrameIngest()
+    received = []
+    ingest.event_received.connect(received.append)
+
+    events = replay(FRAMES, ingest)
+
+    assert _summary(events) == EXPECTED_EVENTS
+    assert received == events
+    assert ingest.frames == 6  # 텍스트 프레임만 (바이너리 1개 제외)
+    assert ingest.events == len(EXPECTED_EVENTS)
+    assert ingest.errors == 0
+
+
+def test_serve_frames_round_trip():
+    websockets = pytest.importorskip("websockets")
+    port = _free_port()
+    url = f"ws://127.0.0.1:{port}"
+
+    async def run():
+        server = asyncio.ensure_future(serve_frames(FRAMES, port=port, speed=0))
+        try:
+            # 서버가 뜰 때까지 연결 재시도
+            for _ in range(50):
+                try:
+                    connection = await websockets.connect(url)
+                    break
+                except OSError:
+                    await asyncio.sleep(0.05)
+            else:
+                pytest.fail("프레임 재생 서버에 연결할 수 없음")
+
+            ingest = WebSocketFrameIngest()
+            events = []
+            messages = 0
+            async with connection:
+                async for message in connection:
+                    messages += 1
+                    events.extend(ingest.feed(message, url))
+            return messages, events
+        finally:
+            server.cancel()
+
+    messages, events = asyncio.run(asyncio.wait_for(run(), 10))
+
+    assert messages == len(list(load_frames(FRAMES)))
+    assert _summary(events) == EXPECTED_EVENTS
+    assert all(event.url == url for event in events)
@@ -0,0 +1,108 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QPushButton,
+                             QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox)
+from PyQt6.QtCore import Qt, QTimer
+from utils.latency_tracker import (
+    latency_tracker, STAGE_IFRAME_SWITCH, STAGE_PAGE_FETCH, STAGE_PARSE, STAGE_PREDICTION,
+    STAGE_MARTIN_AMOUNT, STAGE_BET_WINDOW, STAGE_CHIP_CLICK, STAGE_AREA_CLICK,
+    STAGE_BET_CLICKS, STAGE_BET_CONFIRM, STAGE_RESULT_TO_BET,
+)
+
+# 단계 표시 이름
+STAGE_LABELS = {
+    STAGE_IFRAME_SWITCH: "iframe 전환",
+    STAGE_PAGE_FETCH: "보드 가져오기",
+    STAGE_PARSE: "파싱",
+    STAGE_PREDICTION: "예측",
+    STAGE_MARTIN_AMOUNT: "마틴 금액",
+    STAGE_BET_WINDOW: "베팅 가능 대기",
+    STAGE_CHIP_CLICK: "칩 클릭",
+    STAGE_AREA_CLICK: "영역 클릭",
+    STAGE_BET_CLICKS: "클릭 (스크립트)",
+    STAGE_BET_CONFIRM: "금액 확인",
+    STAGE_RESULT_TO_BET: "결과 → 베팅 확인",
+}
+
+
+class LatencyPanel(QWidget):
+    """단계별 지연 시간 디버그 패널 (p50/p95/p99)"""
+
+    REFRESH_MS = 1000
+
+    def __init__(self, tracker=None):
+        super().__init__()
+        self.tracker = tracker or latency_tracker
+
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(0, 0, 0, 0)
+
+        group = QGroupBox("지연 시간 (ms)")
+        group_layout = QVBoxLayout()
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(6)
+        self.table.setHorizontalHeaderLabels(["단계", "횟수", "p50", "p95", "p99", "최대"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for column in range(1, 6):
+            self.table.horizontalHeader().setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        group_layout.addWidget(self.table)
+
+        button_layout = QHBoxLayout()
+        self.export_button = QPushButton("JSON 내보내기")
+        self.export_button.clicked.connect(self.export_json)
+        self.reset_button = QPushButton("초기화")
+        self.reset_button.clicked.connect(self.reset)
+        button_layout.addWidget(self.export_button)
+        button_layout.addWidget(self.reset_button)
+        group_layout.addLayout(button_layout)
+
+        group.setLayout(group_layout)
+        main_layout.addWidget(group)
+        self.setLayout(main_layout)
+
+        # 보이는 동안에만 주기적으로 갱신
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.refresh_timer.start(self.REFRESH_MS)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        """통계 다시 표시"""
+        summary = self.tracker.summary()
+        self.table.setRowCount(len(summary))
+        for row, (stage, stat) in enumerate(summary.items()):
+            values = [
+                STAGE_LABELS.get(stage, stage),
+                str(stat["count"]),
+                f"{stat['p50_ms']:.1f}",
+                f"{stat['p95_ms']:.1f}",
+                f"{stat['p99_ms']:.1f}",
+                f"{stat['max_ms']:.1f}",
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+    def export_json(self):
+        """통계를 JSON 파일로 저장"""
+        path, _ = QFileDialog.getSaveFileName(self, "지연 시간 내보내기", "latency.json", "JSON (*.json)")
+        if not path:
+            return
+        try:
+            self.tracker.export_json(path)
+        except Exception as e:
+            QMessageBox.warning(self, "내보내기 실패", f"파일 저장 중 오류가 발생했습니다.\n{e}")
+
+    def reset(self):
+        self.tracker.reset()
+        self.refresh()
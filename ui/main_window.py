@@ -11,7 +11,9 @@ from utils.settings_manager import SettingsManager
 from utils.room_manager import RoomManager
 from utils.trading_manager import TradingManager
 from utils.ui_updater import UIUpdater
+from utils.browser_executor import GuiDispatcher, gui_thread
 from ui.room_log_widget import RoomLogWidget
+from ui.latency_panel import LatencyPanel
 from datetime import datetime, timedelta
 
 import time
@@ -73,6 +75,9 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"MainWindow 아이콘 설정 오류: {e}")
 
+        # 브라우저 스레드에서 요청한 UI 갱신을 GUI 스레드에서 실행
+        self.gui_dispatcher = GuiDispatcher()
+
         # 유틸리티 클래스 초기화
         self.devtools = DevToolsController()
         self.settings_manager = SettingsManager()
@@ -311,8 +316,19 @@ class MainWindow(QMainWindow):
         room_buttons_layout.addWidget(self.save_room_button)
         
         self.room_panel.addLayout(room_buttons_layout)
+
+        # 단계별 지연 시간 디버그 패널 (버튼으로 열고 닫기)
+        self.latency_button = QPushButton("⏱ 지연 시간")
+        self.latency_button.setCheckable(True)
+        self.room_panel.addWidget(self.latency_button)
+
+        self.latency_panel = LatencyPanel()
+        self.latency_panel.setVisible(False)
+        self.latency_button.toggled.connect(self.latency_panel.setVisible)
+        self.room_panel.addWidget(self.latency_panel)
     
     # ui/main_window.py에 추가할 update_button_styles 메서드
+    @gui_thread
     def update_button_styles(self):
         # 활성화/비활성화 상태에 따라 단순 스타일 적용
         if self.start_button.isEnabled():
@@ -449,19 +465,21 @@ class MainWindow(QMainWindow):
         time.sleep(1)
         return True
     
-    # 델리게이트 함수들: 각 매니저 클래스의 메서드를 호출
-    def set_remaining_time(self, hours, minutes, seconds):
-        self.ui_updater.set_remaining_time(hours, minutes, seconds)
-    
-    def update_remaining_time(self):
-        self.ui_updater.update_remaining_time()
+    def run_on_gui_thread(self, func, *args, **kwargs):
+        """GUI 스레드에서 func 실행 (브라우저 스레드에서 호출 시 GUI 스레드로 넘김) - Future 반환"""
+        return self.gui_dispatcher.call(func, *args, **kwargs)
     
+    # 델리게이트 함수들: 각 매니저 클래스의 메서드를 호출
+    # (브라우저 스레드에서 호출되면 GUI 스레드로 넘겨 실행)
+    @gui_thread
     def update_user_data(self, **kwargs):
         self.ui_updater.update_user_data(**kwargs)
     
+    @gui_thread
     def update_betting_status(self, **kwargs):
         self.ui_updater.update_betting_status(**kwargs)
     
+    @gui_thread
     def add_betting_result(self, no, room_name, step, result):
         self.ui_updater.add_betting_result(no, room_name, step, result)
     
@@ -674,6 +692,11 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 print(f"[ERROR] 로그아웃 처리 중 오류 발생: {e}")
         
+        # 매매 코루틴 취소 및 상주 분석 스레드 종료
+        if hasattr(self, 'trading_manager') and hasattr(self.trading_manager, '_analysis_thread'):
+            self.trading_manager.engine.stop()
+            self.trading_manager._analysis_thread.shutdown()
+        
         # 브라우저 종료
         if hasattr(self, 'devtools') and self.devtools.driver:
             try:
@@ -760,18 +783,11 @@ class MainWindow(QMainWindow):
             if hasattr(self.trading_manager.balance_service, '_target_amount_reached'):
                 delattr(self.trading_manager.balance_service, '_target_amount_reached')
             
-            # 추가: 타이머 완전 리셋
-            if hasattr(self, 'timer'):
-                if self.timer.isActive():
-                    self.timer.stop()
-                # 새로운 타이머 생성
-                from PyQt6.QtCore import QTimer
-                self.timer = QTimer()
-                self.timer.timeout.connect(self.update_remaining_time)
-            
-            # 이전 스레드 참조 제거
+            # 이전 매매 코루틴과 분석 요청 취소 (분석 스레드는 상주하므로 재사용)
+            if hasattr(self.trading_manager, 'engine'):
+                self.trading_manager.engine.stop()
             if hasattr(self.trading_manager, '_analysis_thread'):
-                delattr(self.trading_manager, '_analysis_thread')
+                self.trading_manager._analysis_thread.cancel()
             
             # 자동 매매 시작
             self.trading_manager.start_trading()
@@ -1,17 +1,16 @@
 # utils/analysis_thread.py
-from PyQt6.QtCore import QThread, pyqtSignal
 import logging
-# utils/analysis_thread.py의 GameAnalysisThread 클래스 수정
+from utils.browser_executor import BrowserExecutor, CMD_ANALYZE
 
-class GameAnalysisThread(QThread):
-    """게임 분석 작업을 위한 스레드 - 중지 가능"""
-    # 결과 전달용 신호 정의
-    analysis_complete = pyqtSignal(dict)  # 게임 상태 결과를 담은 신호
-    analysis_error = pyqtSignal(str)      # 오류 메시지를 담은 신호
-    room_change_needed = pyqtSignal()     # 방 이동이 필요할 때 발생하는 신호
+class GameAnalysisThread(BrowserExecutor):
+    """
+    게임 분석 작업을 위한 상주 스레드 - 중지 가능
+    - 브라우저 명령 스레드(BrowserExecutor)로, 분석도 베팅/방 이동/잔액 조회 명령과 같은 큐에서 순서대로 실행
+    - 분석 요청은 매매 엔진(TradingEngine)의 모니터링 코루틴이 CMD_ANALYZE로 제출하고 결과를 await
+    """
     
     def __init__(self, trading_manager):
-        super().__init__()
+        super().__init__(trading_manager.logger)
         self.tm = trading_manager  # TradingManager 객체 참조
         self.logger = trading_manager.logger or logging.getLogger(__name__)
         self.game_count = trading_manager.game_count
@@ -20,8 +19,26 @@ class GameAnalysisThread(QThread):
         # 중지 플래그 추가
         self.should_stop = False
     
-    def run(self):
-        """스레드의 메인 실행 메서드 - 중지 확인 기능 추가"""
+    def cancel(self):
+        """대기 중인 명령 취소 (진행 중인 분석은 중지 플래그를 확인하여 종료)"""
+        self.should_stop = True
+        self.cancel_pending()
+    
+    def execute(self, command):
+        if command.kind == CMD_ANALYZE:
+            # 분석 시점의 게임 수/방 이름 기준으로 결과 전달
+            self.game_count = self.tm.game_count
+            self.current_room_name = self.tm.current_room_name
+        return super().execute(command)
+    
+    def _analyze(self):
+        """
+        게임 상태 분석 1회 - 중지 확인 기능 추가
+
+        Returns:
+            dict: {'game_state', 'previous_game_count'} 또는 방 이동이 필요하면 {'room_change_needed': True},
+                  중지/오류 시 None
+        """
         try:
             # 중요: 매 단계마다 중지 요청 확인
             # 1. TradingManager의 중지 플래그 확인
@@ -52,15 +69,13 @@ class GameAnalysisThread(QThread):
                     return
                 
                 self.logger.info("방 이동 필요 감지 (스레드)")
-                self.room_change_needed.emit()
-                return
+                return {'room_change_needed': True}
                     
             # 게임 상태 가져오기만 스레드에서 수행
             game_state = self.tm.game_monitoring_service.get_current_game_state(log_always=True)
             
             if not game_state:
                 self.logger.error("게임 상태를 가져올 수 없습니다. (스레드)")
-                self.analysis_error.emit("게임 상태를 가져올 수 없습니다.")
                 return
             
             # 중지 요청 한번 더 확인
@@ -75,12 +90,11 @@ class GameAnalysisThread(QThread):
                 'previous_game_count': self.game_count
             }
             
-            # 결과를 메인 스레드로 전송
-            self.analysis_complete.emit(analysis_result)
+            # 결과는 매매 엔진이 메인 스레드에서 받아 처리
+            return analysis_result
                     
         except Exception as e:
             self.logger.error(f"게임 상태 분석 스레드 오류: {e}", exc_info=True)
-            self.analysis_error.emit(f"게임 상태 분석 오류: {str(e)}")
     
     def stop(self):
         """스레드 중지 요청"""
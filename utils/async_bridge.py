@@ -0,0 +1,88 @@
+# utils/async_bridge.py
+"""
+Qt 이벤트 루프와 asyncio 이벤트 루프 연결
+- qasync가 설치되어 있으면 qasync.QEventLoop 사용 (Qt 루프가 곧 asyncio 루프)
+- 없으면 GUI 스레드의 asyncio 루프를 QTimer로 짧게 반복 실행 (QtLoopPump)
+- 어느 쪽이든 코루틴은 GUI 스레드에서 실행되므로 위젯을 바로 다룰 수 있음
+- 단, 모달 대화상자(QMessageBox 등)는 코루틴 안에서 바로 열지 않고 defer_dialog()로 미룸
+"""
+import asyncio
+import functools
+import logging
+
+from PyQt6.QtCore import QObject, QTimer
+
+try:
+    import qasync
+except ImportError:  # qasync가 없으면 QTimer 펌프 사용
+    qasync = None
+
+_loop = None
+_pump = None
+
+
+class QtLoopPump(QObject):
+    """QTimer마다 asyncio 루프에 쌓인 콜백을 한 번씩 실행"""
+
+    INTERVAL_MS = 10
+
+    def __init__(self, loop, interval_ms=INTERVAL_MS):
+        super().__init__()
+        self.loop = loop
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self._pump)
+
+    def start(self):
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def _pump(self):
+        # 코루틴 안에서 연 모달 대화상자 등 중첩된 Qt 루프에서는 건너뜀
+        if self.loop.is_running():
+            return
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+
+
+def get_event_loop():
+    """GUI 스레드의 asyncio 루프 (run_app 전에 호출되면 QTimer 펌프로 연결)"""
+    global _loop, _pump
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+        _pump = QtLoopPump(_loop)
+        _pump.start()
+    return _loop
+
+
+def defer_dialog(show, *args, **kwargs):
+    """
+    모달 대화상자를 현재 코루틴 단계가 끝난 뒤 Qt 이벤트로 표시
+    - 코루틴 안에서 모달 루프를 열면 qasync에서 다른 작업이 실행될 수 없음 (Cannot enter into task ...)
+
+    Args:
+        show (callable): 대화상자를 여는 함수 (예: QMessageBox.information)
+    """
+    QTimer.singleShot(0, functools.partial(show, *args, **kwargs))
+
+
+def run_app(app):
+    """
+    asyncio 루프를 연결한 상태로 Qt 애플리케이션 실행
+
+    Returns:
+        int: 종료 코드
+    """
+    global _loop
+    if qasync is not None and _loop is None:
+        _loop = qasync.QEventLoop(app)
+        asyncio.set_event_loop(_loop)
+        with _loop:
+            return _loop.run_forever()
+
+    logging.getLogger(__name__).info("qasync가 없어 QTimer로 asyncio 루프를 실행합니다.")
+    get_event_loop()
+    return app.exec()
@@ -0,0 +1,103 @@
+# utils/balance_ledger.py
+"""
+로컬 잔액 장부
+- 베팅 금액과 결과(승/패/무승부)로 잔액을 직접 계산하여 결과마다 DOM에서 잔액을 다시 읽지 않음
+- 승리 시 뱅커는 커미션 5%를 뺀 0.95배, 플레이어는 1배 지급 / 무승부는 베팅 금액 반환
+- N개 결과마다, 직전 대조에서 차이가 허용치를 넘었을 때, 또는 목표 금액에 닿았을 때만 DOM 잔액과 대조
+"""
+
+
+class BalanceLedger:
+    """베팅 결과 기반 예상 잔액"""
+
+    BANKER_PAYOUT = 0.95  # 뱅커 승리 배당 (커미션 5%)
+    RECONCILE_EVERY = 5  # 결과 N개마다 DOM 잔액과 대조
+    DRIFT_THRESHOLD = 1000  # 원 (대조 시 이 이상 차이 나면 다음 결과부터 매번 대조)
+
+    def __init__(self, reconcile_every=RECONCILE_EVERY, drift_threshold=DRIFT_THRESHOLD):
+        """
+        Args:
+            reconcile_every (int): DOM 대조 간격 (결과 개수)
+            drift_threshold (int): 허용 차이 (원)
+        """
+        self.reconcile_every = reconcile_every
+        self.drift_threshold = drift_threshold
+
+        self.balance = None  # 예상 잔액 (DOM에서 한 번도 읽지 않았으면 None)
+        self.pending = None  # 결과를 기다리는 베팅 (베팅 타입, 금액)
+        self.results_since_sync = 0
+        self.last_drift = 0
+        self.drift_detected = False
+        self.syncs = 0
+
+    @classmethod
+    def payout(cls, bet_type, amount, result_status):
+        """결과별 돌려받는 금액 (베팅 금액 포함)"""
+        if result_status == "win":
+            profit = int(round(amount * cls.BANKER_PAYOUT)) if bet_type == 'B' else amount
+            return amount + profit
+        if result_status == "tie":
+            return amount
+        return 0
+
+    def sync(self, actual, settled=False):
+        """
+        DOM에서 읽은 잔액으로 맞추기
+
+        Args:
+            actual (int): 실제 잔액
+            settled (bool): 결과를 기다리는 베팅이 없는 상태 (로비 등)
+
+        Returns:
+            int: 예상 잔액과의 차이 (실제 - 예상, 처음이면 0)
+        """
+        drift = 0 if self.balance is None else actual - self.balance
+        self.balance = actual
+        if settled:
+            self.pending = None
+        self.results_since_sync = 0
+        self.last_drift = drift
+        self.drift_detected = abs(drift) >= self.drift_threshold
+        self.syncs += 1
+        return drift
+
+    def place(self, bet_type, amount):
+        """베팅 기록 (베팅 금액은 베팅 시점에 잔액에서 빠짐)"""
+        self.pending = (bet_type, amount)
+        if self.balance is not None:
+            self.balance -= amount
+
+    def settle(self, result_status):
+        """
+        결과를 기다리는 베팅 정산
+
+        Args:
+            result_status (str): 'win', 'lose', 'tie'
+
+        Returns:
+            int: 예상 잔액 또는 None (모르는 경우)
+        """
+        if self.pending is None:
+            return self.balance
+        bet_type, amount = self.pending
+        self.pending = None
+        if self.balance is not None:
+            self.balance += self.payout(bet_type, amount, result_status)
+        self.results_since_sync += 1
+        return self.balance
+
+    def needs_reconcile(self, target_amount=0):
+        """DOM 잔액과 대조해야 하는지 여부 (target_amount에 닿은 예상 잔액도 실제 값으로 확인)"""
+        if self.balance is None or self.drift_detected:
+            return True
+        if self.results_since_sync >= self.reconcile_every:
+            return True
+        return target_amount > 0 and self.balance >= target_amount
+
+    def reset(self):
+        """장부 초기화 (다음 잔액 조회는 DOM에서)"""
+        self.balance = None
+        self.pending = None
+        self.results_since_sync = 0
+        self.last_drift = 0
+        self.drift_detected = False
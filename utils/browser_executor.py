@@ -0,0 +1,175 @@
+# utils/browser_executor.py
+"""
+브라우저 명령 실행 스레드
+- WebDriver/CDP 작업(분석, 베팅, 방 이동, 잔액 조회)을 GUI 스레드가 아닌 하나의 상주 스레드에서 순서대로 실행
+- GUI는 명령을 제출(submit)하고 Future를 받음 (매매 엔진 코루틴이 await하여 결과를 GUI 스레드에서 처리)
+- 브라우저 스레드에서 실행되는 코드가 UI를 갱신할 때는 GuiDispatcher로 GUI 스레드에 넘겨 실행
+"""
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from concurrent.futures import Future
+import functools
+import logging
+import queue
+import threading
+import time
+
+# 명령 종류
+CMD_ANALYZE = "analyze"
+CMD_PLACE_BET = "place_bet"
+CMD_READ_BALANCE = "read_balance"
+CMD_CHANGE_ROOM = "change_room"
+CMD_PREPARE_ROOM = "prepare_room"
+CMD_CLOSE_ROOM = "close_room"
+
+
+class BrowserCommand:
+    """브라우저 스레드에서 실행할 명령"""
+    __slots__ = ("kind", "func", "args", "kwargs", "future", "submitted_at")
+
+    def __init__(self, kind, func, args, kwargs):
+        self.kind = kind
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.future = Future()
+        self.submitted_at = time.monotonic()
+
+    def __repr__(self):
+        return f"BrowserCommand({self.kind})"
+
+
+class BrowserExecutor(QThread):
+    """
+    브라우저 명령 큐를 처리하는 상주 스레드
+    - 명령은 제출 순서대로 하나씩 실행 (WebDriver 호출이 겹치지 않음)
+    - 실행 전에 취소된 명령(future.cancel())은 건너뜀
+    """
+    _SHUTDOWN = object()
+
+    def __init__(self, logger=None):
+        super().__init__()
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._commands = queue.Queue()
+        self._thread_id = None
+
+    def submit(self, kind, func, *args, **kwargs):
+        """
+        명령 제출 (스레드가 실행 중이 아니면 시작)
+
+        Args:
+            kind (str): 명령 종류 (CMD_*)
+            func (callable): 브라우저 스레드에서 실행할 함수
+
+        Returns:
+            Future: 함수 반환값/예외
+        """
+        command = BrowserCommand(kind, func, args, kwargs)
+        self._commands.put(command)
+        if not self.isRunning():
+            self.start()
+        return command.future
+
+    def is_executor_thread(self):
+        """현재 스레드가 브라우저 스레드인지 여부"""
+        return threading.get_ident() == self._thread_id
+
+    def cancel_pending(self):
+        """
+        대기 중인 명령 취소 (실행 중인 명령은 끝까지 실행)
+
+        Returns:
+            int: 취소한 명령 수
+        """
+        cancelled = 0
+        while True:
+            try:
+                command = self._commands.get_nowait()
+            except queue.Empty:
+                break
+            if command is self._SHUTDOWN:
+                self._commands.put(command)
+                break
+            command.future.cancel()
+            cancelled += 1
+        return cancelled
+
+    def shutdown(self, timeout_ms=1000):
+        """스레드 종료 (앱 종료 시)"""
+        self.cancel_pending()
+        self._commands.put(self._SHUTDOWN)
+        if self.isRunning():
+            self.wait(timeout_ms)
+
+    def run(self):
+        """명령 큐 처리 루프"""
+        self._thread_id = threading.get_ident()
+        while True:
+            command = self._commands.get()
+            if command is self._SHUTDOWN:
+                return
+            if not command.future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                command.future.set_result(self.execute(command))
+            except Exception as e:
+                self.logger.error(f"브라우저 명령 실행 오류 ({command.kind}): {e}", exc_info=True)
+                command.future.set_exception(e)
+
+    def execute(self, command):
+        """명령 실행 (하위 클래스에서 명령 종류별 준비 작업 추가)"""
+        return command.func(*command.args, **command.kwargs)
+
+
+class GuiDispatcher(QObject):
+    """다른 스레드에서 GUI 스레드로 함수 호출을 넘기는 객체 (GUI 스레드에서 생성)"""
+
+    call_requested = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self._gui_thread_id = threading.get_ident()
+        self.call_requested.connect(self._run)
+
+    def on_gui_thread(self):
+        return threading.get_ident() == self._gui_thread_id
+
+    def call(self, func, *args, **kwargs):
+        """
+        GUI 스레드에서 func 실행 (GUI 스레드에서 호출하면 바로 실행)
+
+        Returns:
+            Future: 반환값/예외 (결과가 필요하면 future.result(timeout))
+        """
+        future = Future()
+        call = (future, func, args, kwargs)
+        if self.on_gui_thread():
+            self._run(call)
+        else:
+            self.call_requested.emit(call)
+        return future
+
+    def _run(self, call):
+        future, func, args, kwargs = call
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+
+def gui_thread(method):
+    """
+    MainWindow UI 갱신 메서드용 데코레이터
+    - 브라우저 스레드 등 다른 스레드에서 호출하면 GUI 스레드로 넘겨 실행 (결과를 기다리지 않음)
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        dispatcher = getattr(self, 'gui_dispatcher', None)
+        if dispatcher is not None and not dispatcher.on_gui_thread():
+            dispatcher.call(method, self, *args, **kwargs)
+            return None
+        return method(self, *args, **kwargs)
+    return wrapper
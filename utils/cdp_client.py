@@ -0,0 +1,563 @@
+# utils/cdp_client.py
+"""
+브라우저와 직접 연결하는 지속형 CDP(Chrome DevTools Protocol) 클라이언트
+- chromedriver HTTP 왕복 없이 브라우저 웹소켓 하나로 명령/이벤트를 주고받음
+- 백그라운드 스레드의 asyncio 루프에서 동작하며, 동기 코드(서비스, QThread)는 run()으로 호출
+- Target.attachToTarget(flatten)으로 창(타깃)별 세션을 만들어 evaluate/query/click 실행
+- Page.getFrameTree + Page.createIsolatedWorld로 게임 iframe의 실행 컨텍스트를 만들어 직접 실행
+  (다른 프로세스 iframe(OOPIF)은 해당 타깃에 연결)
+- Runtime.enable은 봇 탐지에 쓰이는 흔적이므로 기본으로 보내지 않음 (runtime_enable=True일 때만
+  Runtime.executionContextCreated로 페이지 기본 world 컨텍스트를 기록하여 사용)
+- 연결할 수 없으면 DevToolsController는 기존 Selenium 경로를 그대로 사용
+"""
+import asyncio
+import json
+import logging
+import threading
+import urllib.request
+
+try:
+    import websockets
+except ImportError:  # websockets가 없으면 CDP 경로 비활성화 (Selenium만 사용)
+    websockets = None
+
+
+# 연결되지 않아 명령을 보내지 못한 경우의 오류 메시지
+NOT_CONNECTED_ERROR = "CDP 클라이언트가 연결되지 않았습니다."
+
+
+class CDPError(Exception):
+    """CDP 명령 실패 또는 연결 불가"""
+
+
+def wrap_script(script, args=()):
+    """
+    Selenium execute_script 형식(return 문, arguments 사용) 스크립트를 Runtime.evaluate 식으로 변환
+
+    Args:
+        script (str): 스크립트 본문
+        args (tuple): arguments로 전달할 값 (JSON 직렬화 가능해야 함)
+    """
+    return "(function () {\n%s\n}).apply(null, %s)" % (script, json.dumps(list(args)))
+
+
+def wrap_script_all_frames(script, args=()):
+    """
+    스크립트를 최상위 문서부터 접근 가능한 하위 iframe 문서까지 차례로 실행하는 식으로 변환
+    - 스크립트 안의 document는 각 프레임의 문서를 가리킴
+    - 결과가 null/undefined/false가 아니면 그 값을 반환, 모든 문서에서 없으면 null
+    - 다른 출처(cross-origin) iframe 문서는 건너뜀
+    """
+    return """(function (args) {
+    var docs = [document];
+    for (var i = 0; i < docs.length; i++) {
+        var result = (function (document) {
+            return (function () {
+%s
+            }).apply(null, args);
+        })(docs[i]);
+        if (result !== null && result !== undefined && result !== false) { return result; }
+        var frames = docs[i].querySelectorAll('iframe, frame');
+        for (var j = 0; j < frames.length; j++) {
+            try { if (frames[j].contentDocument) { docs.push(frames[j].contentDocument); } } catch (e) {}
+        }
+    }
+    return null;
+})(%s)""" % (script, json.dumps(list(args)))
+
+
+# 모든 접근 가능한 문서에서 선택자별 요소 정보를 수집하는 스크립트
+# - arguments[0]: 선택자 목록, arguments[1]: 선택자당 최대 개수
+QUERY_SCRIPT = """
+var selectors = arguments[0], limit = arguments[1];
+var docs = [document];
+for (var i = 0; i < docs.length; i++) {
+    var frames = docs[i].querySelectorAll('iframe, frame');
+    for (var j = 0; j < frames.length; j++) {
+        try { if (frames[j].contentDocument) { docs.push(frames[j].contentDocument); } } catch (e) {}
+    }
+}
+var out = [];
+selectors.forEach(function (selector) {
+    var count = 0;
+    for (var d = 0; d < docs.length && count < limit; d++) {
+        var found;
+        try { found = docs[d].querySelectorAll(selector); } catch (e) { return; }
+        for (var k = 0; k < found.length && count < limit; k++, count++) {
+            var el = found[k];
+            var style = el.ownerDocument.defaultView.getComputedStyle(el);
+            var rect = el.getBoundingClientRect();
+            out.push({
+                selector: selector,
+                tag: el.tagName.toLowerCase(),
+                className: (typeof el.className === 'string' ? el.className : el.getAttribute('class')) || '',
+                text: (el.textContent || '').trim().slice(0, 200),
+                visible: el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none',
+                disabled: !!el.disabled || el.getAttribute('aria-disabled') === 'true',
+                rect: {x: rect.x, y: rect.y, width: rect.width, height: rect.height}
+            });
+        }
+    }
+});
+return out;
+"""
+
+# 선택자 목록 중 처음으로 보이는 요소를 찾아 클릭하는 스크립트 (클릭한 선택자 반환, 없으면 null)
+CLICK_SCRIPT = """
+var selectors = arguments[0];
+var docs = [document];
+for (var i = 0; i < docs.length; i++) {
+    var frames = docs[i].querySelectorAll('iframe, frame');
+    for (var j = 0; j < frames.length; j++) {
+        try { if (frames[j].contentDocument) { docs.push(frames[j].contentDocument); } } catch (e) {}
+    }
+}
+for (var s = 0; s < selectors.length; s++) {
+    for (var d = 0; d < docs.length; d++) {
+        var found;
+        try { found = docs[d].querySelectorAll(selectors[s]); } catch (e) { break; }
+        for (var k = 0; k < found.length; k++) {
+            var el = found[k];
+            if (el.getClientRects().length === 0) { continue; }
+            el.scrollIntoView({block: 'center'});
+            el.click();
+            return selectors[s];
+        }
+    }
+}
+return null;
+"""
+
+
+class FrameContext:
+    """locate_frame()으로 찾은 iframe 실행 컨텍스트"""
+    __slots__ = ("session_id", "frame_id", "context_id", "url", "isolated")
+
+    def __init__(self, session_id, frame_id, context_id, url="", isolated=False):
+        """
+        Args:
+            session_id (str): 프레임이 속한 타깃의 세션 id (OOPIF면 iframe 타깃의 세션)
+            frame_id (str): CDP 프레임 id
+            context_id (int): 스크립트를 실행할 실행 컨텍스트 id
+            url (str): 찾았을 때의 프레임 주소
+            isolated (bool): 페이지 기본 world가 아닌 격리 world 컨텍스트인지 여부
+                             (DOM은 공유하지만 페이지 전역 변수/바인딩은 보이지 않음)
+        """
+        self.session_id = session_id
+        self.frame_id = frame_id
+        self.context_id = context_id
+        self.url = url
+        self.isolated = isolated
+
+    def __repr__(self):
+        world = "isolated" if self.isolated else "main"
+        return f"FrameContext(frame={self.frame_id}, context={self.context_id}, {world}, url={self.url!r})"
+
+
+class CDPClient:
+    """브라우저 웹소켓 엔드포인트에 연결하는 지속형 비동기 CDP 클라이언트"""
+
+    COMMAND_TIMEOUT = 10  # 초
+    ISOLATED_WORLD_NAME = "__holdemAutoTrader"
+
+    def __init__(self, debugger_address, logger=None, runtime_enable=False):
+        """
+        Args:
+            debugger_address (str): 브라우저 원격 디버깅 주소 (예: "127.0.0.1:9222")
+            logger (logging.Logger, optional): 로거
+            runtime_enable (bool): 세션에 Runtime.enable을 보내 기본 world 컨텍스트와 콘솔 이벤트를 받을지 여부
+                                   (페이지에서 감지할 수 있으므로 기본값 False)
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.debugger_address = debugger_address
+        self.runtime_enable = runtime_enable
+
+        self.loop = None
+        self._thread = None
+        self._ws = None
+        self._reader = None
+        self._next_id = 0
+        self._pending = {}  # 명령 id -> Future
+        self._listeners = {}  # 이벤트 이름 -> [콜백, ...]
+        self._sessions = {}  # 타깃 id -> 세션 id
+        self._contexts = {}  # (세션 id, 프레임 id) -> 기본 world 실행 컨텍스트 id
+        self._lock = threading.Lock()
+
+        self.connected = False
+
+    @property
+    def is_connected(self):
+        return self.connected and self.loop is not None
+
+    # ------------------------------------------------------------------
+    # 연결 관리
+    # ------------------------------------------------------------------
+    def start(self, timeout=5):
+        """
+        백그라운드 이벤트 루프를 시작하고 브라우저 웹소켓에 연결
+
+        Returns:
+            bool: 연결 성공 여부
+        """
+        if self.is_connected:
+            return True
+
+        if websockets is None:
+            self.logger.warning("websockets 패키지가 없어 CDP 클라이언트를 사용할 수 없습니다.")
+            return False
+
+        try:
+            ws_url = self._browser_ws_url(timeout)
+        except Exception as e:
+            self.logger.warning(f"CDP 웹소켓 주소 확인 실패 ({self.debugger_address}): {e}")
+            return False
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="CDPClient", daemon=True)
+        self._thread.start()
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._connect(ws_url), self.loop).result(timeout)
+        except Exception as e:
+            self.logger.warning(f"CDP 웹소켓 연결 실패: {e}")
+            self.close()
+            return False
+
+        self.logger.info(f"CDP 웹소켓 연결 완료: {ws_url}")
+        return True
+
+    def _browser_ws_url(self, timeout):
+        """/json/version에서 브라우저 웹소켓 주소 조회"""
+        with urllib.request.urlopen(f"http://{self.debugger_address}/json/version", timeout=timeout) as response:
+            return json.loads(response.read().decode("utf-8"))["webSocketDebuggerUrl"]
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    async def _connect(self, ws_url):
+        self._ws = await websockets.connect(ws_url, max_size=None, ping_interval=None)
+        self._reader = asyncio.ensure_future(self._read_loop())
+        self.connected = True
+
+    async def _read_loop(self):
+        """웹소켓 메시지 수신 (명령 응답은 Future로, 이벤트는 리스너로 전달)"""
+        try:
+            async for raw in self._ws:
+                message = json.loads(raw)
+                message_id = message.get("id")
+                if message_id is not None:
+                    future = self._pending.pop(message_id, None)
+                    if future and not future.done():
+                        if "error" in message:
+                            future.set_exception(CDPError(message["error"].get("message", str(message["error"]))))
+                        else:
+                            future.set_result(message.get("result", {}))
+                    continue
+                self._dispatch(message)
+        except Exception as e:
+            if self.connected:
+                self.logger.warning(f"CDP 웹소켓 수신 종료: {e}")
+        finally:
+            self.connected = False
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(CDPError("CDP 연결이 종료되었습니다."))
+            self._pending.clear()
+            self._sessions.clear()
+            self._contexts.clear()
+
+    def _dispatch(self, message):
+        """이벤트를 등록된 리스너에 전달 (이벤트 루프 스레드에서 호출)"""
+        method = message.get("method")
+        params = message.get("params", {})
+        if method == "Target.detachedFromTarget":
+            session_id = params.get("sessionId")
+            for target_id, known in list(self._sessions.items()):
+                if known == session_id:
+                    del self._sessions[target_id]
+            self._drop_contexts(session_id)
+        elif method == "Runtime.executionContextCreated":
+            context = params.get("context", {})
+            aux_data = context.get("auxData", {})
+            if aux_data.get("isDefault") and aux_data.get("frameId"):
+                self._contexts[(message.get("sessionId"), aux_data["frameId"])] = context["id"]
+        elif method == "Runtime.executionContextDestroyed":
+            session_id = message.get("sessionId")
+            context_id = params.get("executionContextId")
+            for key, known in list(self._contexts.items()):
+                if key[0] == session_id and known == context_id:
+                    del self._contexts[key]
+        elif method == "Runtime.executionContextsCleared":
+            self._drop_contexts(message.get("sessionId"))
+
+        for callback in self._listeners.get(method, ()):
+            try:
+                callback(message)
+            except Exception as e:
+                self.logger.warning(f"CDP 이벤트 처리 오류 ({method}): {e}")
+
+    def _drop_contexts(self, session_id):
+        """세션의 실행 컨텍스트 기록 삭제 (이벤트 루프 스레드에서 호출)"""
+        for key in [key for key in self._contexts if key[0] == session_id]:
+            del self._contexts[key]
+
+    async def _shutdown(self):
+        """웹소켓을 닫고 수신 작업 종료"""
+        if self._ws is not None:
+            await self._ws.close()
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except BaseException:
+                pass
+
+    def add_listener(self, event, callback):
+        """
+        CDP 이벤트 리스너 등록 (콜백은 이벤트 루프 스레드에서 호출되며 message 전체를 받음)
+        """
+        with self._lock:
+            self._listeners.setdefault(event, []).append(callback)
+
+    def remove_listener(self, event, callback):
+        with self._lock:
+            callbacks = self._listeners.get(event, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def close(self):
+        """연결 종료 및 이벤트 루프 정리"""
+        loop = self.loop
+        if loop is None:
+            return
+
+        self.connected = False
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(2)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(2)
+
+        self.loop = None
+        self._thread = None
+        self._ws = None
+        self._reader = None
+        self._sessions.clear()
+        self._contexts.clear()
+
+    # ------------------------------------------------------------------
+    # 명령
+    # ------------------------------------------------------------------
+    def run(self, coro, timeout=None):
+        """
+        동기 코드에서 코루틴 실행 (결과를 기다려 반환)
+
+        Raises:
+            CDPError: 연결되지 않았거나 명령이 실패/시간 초과된 경우
+        """
+        if not self.is_connected:
+            coro.close()
+            raise CDPError(NOT_CONNECTED_ERROR)
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout or self.COMMAND_TIMEOUT)
+        except CDPError:
+            raise
+        except Exception as e:
+            future.cancel()
+            raise CDPError(f"CDP 명령 실패: {e!r}") from e
+
+    async def send(self, method, params=None, session_id=None, timeout=None):
+        """
+        CDP 명령 전송 후 응답 대기
+
+        Args:
+            method (str): CDP 메서드 (예: "Runtime.evaluate")
+            params (dict, optional): 파라미터
+            session_id (str, optional): 대상 세션 (없으면 브라우저 전체)
+            timeout (float, optional): 응답 대기 시간 (초)
+
+        Returns:
+            dict: result
+        """
+        if not self.connected:
+            raise CDPError(NOT_CONNECTED_ERROR)
+
+        self._next_id += 1
+        message_id = self._next_id
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            await self._ws.send(json.dumps(message))
+            return await asyncio.wait_for(future, timeout or self.COMMAND_TIMEOUT)
+        finally:
+            self._pending.pop(message_id, None)
+
+    async def attach(self, target_id):
+        """
+        타깃(창/탭/OOPIF)에 flatten 세션으로 연결 (타깃별로 재사용)
+
+        Returns:
+            str: 세션 id
+        """
+        session_id = self._sessions.get(target_id)
+        if session_id:
+            return session_id
+
+        result = await self.send("Target.attachToTarget", {"targetId": target_id, "flatten": True})
+        session_id = result["sessionId"]
+        self._sessions[target_id] = session_id
+        return session_id
+
+    async def evaluate(self, expression, session_id=None, context_id=None, await_promise=False, timeout=None):
+        """
+        Runtime.evaluate 실행 후 값 반환 (returnByValue)
+
+        Raises:
+            CDPError: 스크립트 예외 발생 시
+        """
+        params = {"expression": expression, "returnByValue": True, "awaitPromise": await_promise}
+        if context_id is not None:
+            params["contextId"] = context_id
+
+        result = await self.send("Runtime.evaluate", params, session_id, timeout)
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            description = details.get("exception", {}).get("description") or details.get("text")
+            raise CDPError(f"스크립트 실행 오류: {description}")
+        return result.get("result", {}).get("value")
+
+    async def call_script(self, script, *args, session_id=None, context_id=None, all_frames=False,
+                          await_promise=False, timeout=None):
+        """
+        Selenium execute_script 형식 스크립트 실행
+
+        Args:
+            script (str): 스크립트 본문 (return 문 사용)
+            args: arguments로 전달할 값
+            all_frames (bool): True면 접근 가능한 하위 iframe 문서까지 차례로 실행
+            await_promise (bool): 스크립트가 Promise를 반환하면 완료될 때까지 기다려 결과 반환
+        """
+        wrap = wrap_script_all_frames if all_frames else wrap_script
+        return await self.evaluate(wrap(script, args), session_id, context_id, await_promise, timeout)
+
+    async def query(self, selectors, session_id=None, context_id=None, limit=1, timeout=None):
+        """
+        선택자별 요소 정보 조회 (하위 iframe 문서 포함, 한 번의 왕복)
+
+        Args:
+            selectors (str or list): CSS 선택자 또는 목록
+            limit (int): 선택자당 최대 요소 수
+
+        Returns:
+            list: [{'selector', 'tag', 'className', 'text', 'visible', 'disabled', 'rect'}, ...]
+        """
+        if isinstance(selectors, str):
+            selectors = [selectors]
+        return await self.evaluate(
+            wrap_script(QUERY_SCRIPT, (list(selectors), limit)), session_id, context_id, timeout=timeout
+        ) or []
+
+    async def click(self, selectors, session_id=None, context_id=None, timeout=None):
+        """
+        선택자 목록 중 처음으로 보이는 요소 클릭
+
+        Returns:
+            str: 클릭한 선택자 또는 None
+        """
+        if isinstance(selectors, str):
+            selectors = [selectors]
+        return await self.evaluate(
+            wrap_script(CLICK_SCRIPT, (list(selectors),)), session_id, context_id, timeout=timeout
+        )
+
+    # ------------------------------------------------------------------
+    # 프레임 실행 컨텍스트
+    # ------------------------------------------------------------------
+    async def get_frame_tree(self, session_id):
+        """
+        Page.getFrameTree 결과를 펼친 목록 (부모 프레임이 먼저)
+
+        Returns:
+            list: [(frame dict, 깊이), ...] - frame은 'id', 'parentId', 'url' 등을 포함
+        """
+        result = await self.send("Page.getFrameTree", {}, session_id)
+        frames = []
+        stack = [(result["frameTree"], 0)]
+        while stack:
+            node, depth = stack.pop()
+            frames.append((node["frame"], depth))
+            for child in reversed(node.get("childFrames", [])):
+                stack.append((child, depth + 1))
+        return frames
+
+    async def frame_context(self, session_id, frame_id):
+        """
+        프레임에서 스크립트를 실행할 실행 컨텍스트 id
+        - Runtime.executionContextCreated로 받은 기본 world 컨텍스트가 있으면 사용 (runtime_enable일 때만 기록됨)
+        - 없으면 Page.createIsolatedWorld로 격리 world를 만들어 사용 (Runtime.enable 불필요)
+
+        Returns:
+            tuple: (컨텍스트 id, 격리 world 여부)
+        """
+        context_id = self._contexts.get((session_id, frame_id))
+        if context_id is not None:
+            return context_id, False
+
+        # grantUniveralAccess는 CDP 파라미터 이름의 철자 그대로
+        result = await self.send(
+            "Page.createIsolatedWorld",
+            {"frameId": frame_id, "worldName": self.ISOLATED_WORLD_NAME, "grantUniveralAccess": True},
+            session_id,
+        )
+        return result["executionContextId"], True
+
+    async def locate_frame(self, session_id, probe_script, max_targets=4):
+        """
+        확인 스크립트가 참을 반환하는 프레임의 실행 컨텍스트 찾기
+        - 깊은 프레임부터 확인 (게임 화면은 보통 중첩 iframe 안에 있음)
+        - 이 세션에서 실행할 수 없는 하위 프레임은 OOPIF로 보고 해당 타깃에 연결하여 다시 탐색
+          (OOPIF의 타깃 id는 프레임 id와 같음)
+
+        Args:
+            session_id (str): 탐색을 시작할 창(타깃) 세션 id
+            probe_script (str): execute_script 형식 확인 스크립트
+            max_targets (int): 연결을 시도할 OOPIF 최대 개수
+
+        Returns:
+            FrameContext: 찾은 프레임 또는 None
+        """
+        # Runtime.enable은 명시적으로 허용한 경우에만 (처음이면 기존 컨텍스트가 이벤트로 전달됨)
+        if self.runtime_enable:
+            await self.send("Runtime.enable", {}, session_id)
+        frames = await self.get_frame_tree(session_id)
+        frames.sort(key=lambda item: -item[1])
+
+        out_of_process = []
+        for frame, depth in frames:
+            try:
+                context_id, isolated = await self.frame_context(session_id, frame["id"])
+                found = await self.call_script(probe_script, session_id=session_id, context_id=context_id)
+            except CDPError:
+                if depth > 0:
+                    out_of_process.append(frame)
+                continue
+            if found:
+                return FrameContext(session_id, frame["id"], context_id, frame.get("url", ""), isolated)
+
+        for frame in out_of_process[:max_targets]:
+            try:
+                child_session = await self.attach(frame["id"])
+            except CDPError:
+                continue
+            located = await self.locate_frame(child_session, probe_script, max_targets)
+            if located:
+                return located
+        return None
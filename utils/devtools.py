@@ -4,10 +4,31 @@ import os
 import re
 import subprocess
 import platform
+from utils.cdp_client import CDPClient, CDPError, NOT_CONNECTED_ERROR
+from utils.wait_engine import wait_until, document_ready
+from utils.selector_registry import selector_registry
+
+# 게임 iframe 확인 스크립트 (Bead-road 보드, 칩, 베팅 영역, 잔액 표시 중 하나라도 있으면 게임 화면)
+GAME_FRAME_PROBE_SCRIPT = """
+return !!document.querySelector(
+    "svg[data-role='Bead-road'], div[data-role='chip'], div[data-betspot-destination], span[data-role='balance-label-value']"
+);
+"""
+
+# 명령이 실행되기 전에 CDP가 거부한 오류 (프레임 재로드로 컨텍스트/세션이 사라짐) - 이 경우만 다시 찾아서 재시도
+GAME_FRAME_RETRY_ERRORS = (
+    "Cannot find context with specified id",
+    "Session with given id not found",
+)
 
 class DevToolsController:
     def __init__(self):
         self.driver = None  # 초기에는 브라우저 실행 X
+        self.cdp = None  # 브라우저 웹소켓에 직접 연결한 CDP 클라이언트 (없으면 Selenium만 사용)
+        # 방 입장마다 한 번 찾는 게임 iframe 실행 컨텍스트 (창 핸들, FrameContext 또는 None)
+        self._game_frame = None
+        # 게임 WebSocket 프레임 수신 (선택 기능, start_ws_ingest로 시작)
+        self.ws_ingest = None
 
     def get_chrome_version(self):
         """현재 시스템에 설치된 Chrome 브라우저의 버전을 감지"""
@@ -63,6 +84,8 @@ class DevToolsController:
             options.headless = False  # False: UI 보이게, True: 백그라운드 실행
             options.add_argument("--disable-blink-features=AutomationControlled")  # 봇 탐지 우회
             
+            # enable_cdp_events는 켜지 않음 (chromedriver로 performance 로그를 계속 폴링하는 스레드가 생김)
+            # CDP 이벤트는 _start_cdp_client의 웹소켓으로만 받고, 연결하지 못하면 결과 푸시 없이 폴링
             # Chrome 버전 감지 및 적용
             chrome_version = self.get_chrome_version()
             if chrome_version:
@@ -80,6 +103,7 @@ class DevToolsController:
                 print("[INFO] 기본 설정으로 Chrome 브라우저 실행됨")
             
             print("[INFO] Chrome 브라우저 실행 완료")
+            self._start_cdp_client()
             return True
         except Exception as e:
             print(f"[ERROR] 브라우저 시작 실패: {e}")
@@ -102,6 +126,7 @@ class DevToolsController:
                 url = "https://" + url
 
             print(f"[INFO] 사이트 이동: {url}")
+            selector_registry.set_site(url)
             try:
                 self.driver.get(url)
             except Exception as e:
@@ -116,7 +141,7 @@ class DevToolsController:
                 else:
                     return False
                     
-            time.sleep(2)  # 페이지 로딩 대기
+            wait_until(document_ready(self.driver), timeout=5, label="open_site")  # 페이지 로딩 대기
             return True
         except Exception as e:
             print(f"[ERROR] 사이트 열기 실패: {e}")
@@ -124,6 +149,8 @@ class DevToolsController:
 
     def close_browser(self):
         """브라우저 종료 - 에러 처리 강화"""
+        self._close_cdp_client()
+        selector_registry.save(force=True)
         if self.driver:
             try:
                 self.driver.quit()
@@ -146,8 +173,218 @@ class DevToolsController:
             url = "https://" + url
 
         print(f"[INFO] 사이트 이동: {url}")
+        selector_registry.set_site(url)
         self.driver.get(url)
-        time.sleep(2)  # 페이지 로딩 대기
+        wait_until(document_ready(self.driver), timeout=5, label="open_site")  # 페이지 로딩 대기
+
+    def _start_cdp_client(self):
+        """브라우저 웹소켓에 직접 연결하는 CDP 클라이언트 시작 (실패 시 Selenium 경로만 사용)"""
+        self._close_cdp_client()
+        try:
+            address = self.driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+        except Exception:
+            address = None
+
+        if not address:
+            print("[WARNING] 브라우저 디버깅 주소를 찾을 수 없어 CDP 클라이언트를 사용하지 않습니다.")
+            return False
+
+        client = CDPClient(address)
+        if not client.start():
+            print("[WARNING] CDP 클라이언트 연결 실패 - Selenium 경로만 사용")
+            return False
+
+        self.cdp = client
+        print(f"[INFO] CDP 클라이언트 연결 완료 ({address})")
+        return True
+
+    def _close_cdp_client(self):
+        """CDP 클라이언트 종료"""
+        self._game_frame = None
+        self.stop_ws_ingest()
+        if self.cdp:
+            try:
+                self.cdp.close()
+            except Exception as e:
+                print(f"[WARNING] CDP 클라이언트 종료 중 오류: {e}")
+            self.cdp = None
+
+    @property
+    def has_cdp(self):
+        """CDP 클라이언트 사용 가능 여부"""
+        return self.cdp is not None and self.cdp.is_connected
+
+    def get_cdp_session(self):
+        """
+        현재 Selenium 창(타깃)에 연결된 CDP 세션 id
+
+        Raises:
+            CDPError: CDP를 사용할 수 없거나 창을 찾을 수 없는 경우
+        """
+        if not self.has_cdp:
+            raise CDPError(NOT_CONNECTED_ERROR)
+        try:
+            handle = self.driver.current_window_handle
+        except Exception as e:
+            raise CDPError(f"현재 창을 확인할 수 없습니다: {e}") from e
+
+        # chromedriver 창 핸들은 타깃 id (구버전은 "CDwindow-" 접두사)
+        target_id = handle[len("CDwindow-"):] if handle.startswith("CDwindow-") else handle
+        return self.cdp.run(self.cdp.attach(target_id))
+
+    def cdp_execute(self, script, *args, all_frames=True, timeout=None):
+        """
+        현재 창에서 CDP로 스크립트 실행 (Selenium iframe 전환 불필요)
+
+        Args:
+            script (str): execute_script 형식 스크립트 (return 문 사용)
+            args: arguments로 전달할 값
+            all_frames (bool): 접근 가능한 하위 iframe 문서까지 차례로 실행
+
+        Raises:
+            CDPError: CDP를 사용할 수 없거나 실행 실패
+        """
+        session_id = self.get_cdp_session()
+        return self.cdp.run(
+            self.cdp.call_script(script, *args, session_id=session_id, all_frames=all_frames), timeout
+        )
+
+    def cdp_query(self, selectors, limit=1, timeout=None):
+        """현재 창(하위 iframe 포함)에서 선택자별 요소 정보 조회 (CDPClient.query 참고)"""
+        session_id = self.get_cdp_session()
+        return self.cdp.run(self.cdp.query(selectors, session_id=session_id, limit=limit), timeout)
+
+    def cdp_click(self, selectors, timeout=None):
+        """현재 창(하위 iframe 포함)에서 처음으로 보이는 요소 클릭 - 클릭한 선택자 또는 None"""
+        session_id = self.get_cdp_session()
+        return self.cdp.run(self.cdp.click(selectors, session_id=session_id), timeout)
+
+    def get_game_frame(self, refresh=False, remember_miss=True):
+        """
+        현재 창의 게임 iframe 실행 컨텍스트 (창마다 한 번 찾고 재사용)
+        - 찾지 못한 결과도 기억하여 매 틱 다시 탐색하지 않음 (invalidate_game_frame()으로 초기화)
+
+        Args:
+            refresh (bool): 기억한 결과를 무시하고 다시 탐색
+            remember_miss (bool): False면 찾지 못한 결과를 기억하지 않음 (방 입장 직후 게임 화면이 그려지기 전)
+
+        Returns:
+            FrameContext: 게임 프레임 컨텍스트 또는 None (CDP 미사용 또는 찾지 못함)
+        """
+        if not self.has_cdp:
+            return None
+        try:
+            handle = self.driver.current_window_handle
+        except Exception:
+            return None
+
+        if not refresh and self._game_frame and self._game_frame[0] == handle:
+            return self._game_frame[1]
+
+        try:
+            session_id = self.get_cdp_session()
+            frame = self.cdp.run(self.cdp.locate_frame(session_id, GAME_FRAME_PROBE_SCRIPT))
+        except CDPError as e:
+            print(f"[WARNING] CDP 게임 프레임 탐색 실패: {e}")
+            frame = None
+
+        self._game_frame = (handle, frame) if frame or remember_miss else None
+        if frame:
+            print(f"[INFO] 게임 프레임 컨텍스트 확인: {frame}")
+        return frame
+
+    def invalidate_game_frame(self):
+        """방 이동/입장 시 게임 프레임 컨텍스트 초기화"""
+        self._game_frame = None
+
+    def start_ws_ingest(self, ingest):
+        """
+        게임 탭의 WebSocket 프레임 수신 시작 (방 입장마다 호출)
+        - 게임 iframe이 다른 프로세스(OOPIF)면 그 타깃 세션에서 수신
+
+        Args:
+            ingest (WebSocketFrameIngest): 프레임을 디코딩하여 이벤트를 발생시키는 객체
+
+        Returns:
+            bool: 성공 여부 (CDP를 사용할 수 없으면 False)
+        """
+        if not self.has_cdp:
+            return False
+        try:
+            frame = self.get_game_frame()
+            session_id = frame.session_id if frame else self.get_cdp_session()
+        except CDPError as e:
+            print(f"[WARNING] WebSocket 프레임 수신 세션을 찾을 수 없습니다: {e}")
+            return False
+
+        if not ingest.attach(self.cdp, session_id):
+            return False
+        self.ws_ingest = ingest
+        return True
+
+    def stop_ws_ingest(self):
+        """WebSocket 프레임 수신 중지"""
+        if self.ws_ingest is not None:
+            self.ws_ingest.detach()
+            self.ws_ingest = None
+
+    def _run_in_game_frame(self, make_coro, timeout=None, retry=True):
+        """
+        게임 프레임 컨텍스트에서 코루틴 실행
+        - 프레임이 다시 로드되어 컨텍스트/세션이 사라졌으면 한 번 다시 찾아서 재시도
+        - 재시도는 CDP가 실행 전에 거부한 경우(GAME_FRAME_RETRY_ERRORS)만 - 실행 중 끊긴 경우는 결과를 알 수 없으므로 그대로 예외
+
+        Args:
+            make_coro (callable): FrameContext를 받아 코루틴을 반환하는 함수
+            retry (bool): False면 재시도하지 않음 (한 번만 실행되어야 하는 스크립트)
+
+        Raises:
+            CDPError: 게임 프레임을 찾을 수 없거나 실행 실패
+        """
+        frame = self.get_game_frame()
+        if frame is None:
+            raise CDPError("게임 프레임 컨텍스트를 찾을 수 없습니다.")
+        try:
+            return self.cdp.run(make_coro(frame), timeout)
+        except CDPError as e:
+            if not retry or not any(error in str(e) for error in GAME_FRAME_RETRY_ERRORS):
+                raise
+            frame = self.get_game_frame(refresh=True)
+            if frame is None:
+                raise
+            return self.cdp.run(make_coro(frame), timeout)
+
+    def game_frame_execute(self, script, *args, await_promise=False, timeout=None):
+        """
+        게임 iframe 컨텍스트에서 직접 스크립트 실행 (iframe 전환/하위 문서 순회 없음)
+
+        Args:
+            await_promise (bool): 스크립트가 반환한 Promise의 결과를 기다림 (베팅 등 재실행하면 안 되는 스크립트이므로 재시도 안 함)
+        """
+        return self._run_in_game_frame(
+            lambda frame: self.cdp.call_script(
+                script, *args, session_id=frame.session_id, context_id=frame.context_id,
+                await_promise=await_promise, timeout=timeout
+            ),
+            timeout,
+            retry=not await_promise,
+        )
+
+    def game_frame_query(self, selectors, limit=1, timeout=None):
+        """게임 iframe에서 선택자별 요소 정보 조회 (CDPClient.query 참고)"""
+        return self._run_in_game_frame(
+            lambda frame: self.cdp.query(
+                selectors, session_id=frame.session_id, context_id=frame.context_id, limit=limit
+            ),
+            timeout,
+        )
+
+    def game_frame_click(self, selectors, timeout=None):
+        """게임 iframe에서 처음으로 보이는 요소 클릭 - 클릭한 선택자 또는 None"""
+        return self._run_in_game_frame(
+            lambda frame: self.cdp.click(selectors, session_id=frame.session_id, context_id=frame.context_id),
+            timeout,
+        )
 
     def get_page_source(self):
         """현재 페이지의 HTML 가져오기"""
@@ -0,0 +1,79 @@
+# utils/element_cache.py
+"""
+방 단위 요소 핸들 캐시
+- 베팅 영역, 칩, 종료 버튼처럼 방에 있는 동안 바뀌지 않는 요소를 방 입장 시 한 번 찾아 보관
+- 사용할 때는 가벼운 확인(기본: tag_name 조회)만 하고, 요소가 DOM에서 사라졌거나
+  (StaleElementReferenceException) 다른 프레임 기준 핸들이면 그때만 다시 찾음
+- 방 이동 시 GameMonitoringService.reset_room_state에서 비움
+"""
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+
+
+def _alive(element):
+    """요소 핸들이 아직 유효한지 확인 (무효하면 예외 발생)"""
+    return bool(element.tag_name)
+
+
+class ElementCache:
+    """이름 -> WebElement 캐시 (Selenium 호출과 같은 스레드에서 사용)"""
+
+    def __init__(self):
+        self._elements = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def get(self, name, resolve, check=None):
+        """
+        캐시된 요소를 확인 후 반환, 없거나 무효하면 resolve()로 다시 찾아 저장
+
+        Args:
+            name (str): 요소 이름 (예: 'bet_area_P', 'chip_1000', 'close_button')
+            resolve (callable): 요소를 찾는 함수 (못 찾으면 None 반환 또는 예외)
+            check (callable, optional): 캐시된 요소를 그대로 써도 되는지 확인하는 함수 (기본: _alive)
+
+        Returns:
+            WebElement 또는 None
+        """
+        element = self._elements.get(name)
+        if element is not None:
+            try:
+                if (check or _alive)(element):
+                    self.hits += 1
+                    return element
+            except (StaleElementReferenceException, NoSuchElementException):
+                self.stale += 1
+
+        self.misses += 1
+        self._elements.pop(name, None)
+        element = resolve()
+        if element is not None:
+            self._elements[name] = element
+        return element
+
+    def put(self, name, element):
+        """찾은 요소 저장 (방 입장 시 미리 찾기)"""
+        if element is None:
+            self._elements.pop(name, None)
+        else:
+            self._elements[name] = element
+        return element
+
+    def invalidate(self, name=None):
+        """캐시 비우기 (방 이동 등) - name을 지정하면 해당 요소만"""
+        if name is None:
+            self._elements.clear()
+        else:
+            self._elements.pop(name, None)
+
+    def stats(self):
+        """캐시 적중 통계"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._elements),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -1,15 +1,172 @@
 # utils/iframe_utils.py
 import logging
+import threading
 import time
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from utils.latency_tracker import latency_tracker, STAGE_IFRAME_SWITCH
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# 현재 프레임의 경로(각 단계의 window.frames 인덱스)와 주소를 구하는 스크립트
+# - 다른 출처 프레임이어도 parent/frames 접근은 허용되므로 경로 계산 가능
+FRAME_PATH_SCRIPT = """
+var path = [], w = window;
+while (w !== w.parent) {
+    var parent = w.parent, index = -1;
+    for (var i = 0; i < parent.frames.length; i++) {
+        if (parent.frames[i] === w) { index = i; break; }
+    }
+    if (index < 0) { return null; }
+    path.unshift(index);
+    w = parent;
+}
+return [path, location.href];
+"""
+
+
+class FramePathCache:
+    """
+    창 핸들별로 확인된 게임 iframe 경로 캐시
+    - 경로는 각 단계의 프레임 인덱스 목록이며, 다음 전환은 find_elements 없이 인덱스 이동만 수행
+    - 전환 오류(없는 프레임, 만료된 요소)나 프레임 주소 변경(페이지 이동) 시 무효화
+    """
+
+    VALIDATE_INTERVAL = 10.0  # 프레임 주소를 다시 확인하는 최소 간격 (초)
+
+    def __init__(self):
+        self._entries = {}  # (세션 id, 창 핸들) -> [경로, 주소, 마지막 확인 시각]
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(driver, handle):
+        return getattr(driver, "session_id", None), handle
+
+    @staticmethod
+    def _strip_fragment(url):
+        return (url or "").split("#", 1)[0]
+
+    def switch(self, driver, handle):
+        """
+        캐시된 경로로 iframe 전환
+
+        Returns:
+            bool: 전환 성공 여부 (False면 기본 컨텐츠 상태, 호출자가 다시 탐색)
+        """
+        key = self._key(driver, handle)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False
+            path, url, validated_at = entry
+
+        try:
+            driver.switch_to.default_content()
+            for index in path:
+                driver.switch_to.frame(index)
+
+            now = time.monotonic()
+            if now - validated_at > self.VALIDATE_INTERVAL:
+                current_url = driver.execute_script("return location.href;")
+                if self._strip_fragment(current_url) != self._strip_fragment(url):
+                    logger.info(f"iframe 주소 변경 감지, 경로 캐시 무효화: {url} -> {current_url}")
+                    self._invalidate_key(key)
+                    driver.switch_to.default_content()
+                    return False
+                with self._lock:
+                    if key in self._entries:
+                        self._entries[key][2] = now
+        except WebDriverException as e:
+            logger.info(f"캐시된 iframe 경로 전환 실패, 다시 탐색: {type(e).__name__}")
+            self._invalidate_key(key)
+            try:
+                driver.switch_to.default_content()
+            except Exception:
+                pass
+            return False
+
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def remember(self, driver, handle):
+        """현재 전환된 프레임의 경로를 기록"""
+        try:
+            resolved = driver.execute_script(FRAME_PATH_SCRIPT)
+        except WebDriverException as e:
+            logger.warning(f"iframe 경로 계산 실패: {e}")
+            return False
+
+        if not resolved or not resolved[0]:
+            return False
+
+        path, url = resolved
+        with self._lock:
+            self._entries[self._key(driver, handle)] = [tuple(path), url, time.monotonic()]
+        return True
+
+    def _invalidate_key(self, key):
+        """캐시된 경로가 더 이상 유효하지 않음 (실패한 전환은 캐시 실패로 집계)"""
+        with self._lock:
+            self.misses += 1
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def invalidate(self, driver=None, handle=None):
+        """
+        경로 캐시 무효화
+
+        Args:
+            driver: 지정하면 해당 드라이버 세션만 (없으면 전체)
+            handle: 지정하면 해당 창만
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if driver is not None and key[0] != getattr(driver, "session_id", None):
+                    continue
+                if handle is not None and key[1] != handle:
+                    continue
+                del self._entries[key]
+                self.invalidations += 1
+
+    def stats(self):
+        """캐시 적중 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+# 모든 서비스가 공유하는 iframe 경로 캐시
+frame_path_cache = FramePathCache()
+
+
+def _current_handle(driver):
+    """현재 창 핸들 (확인할 수 없으면 None)"""
+    try:
+        return driver.current_window_handle
+    except Exception:
+        return None
+
+
+def get_frame_cache_stats():
+    """iframe 경로 캐시 통계 (적중/실패/무효화 횟수)"""
+    return frame_path_cache.stats()
+
+
 class IframeManager:
     """
     iframe을 관리하기 위한 유틸리티 클래스
@@ -102,26 +259,44 @@ class IframeManager:
         
         return True
     
-    def find_and_switch_to_any_iframe(self, max_depth=2, timeout=3):
+    def find_and_switch_to_any_iframe(self, max_depth=2, timeout=3, use_cache=True):
         """
         페이지 내 모든 iframe을 찾아 전환 시도 (중첩된 iframe 최대 max_depth까지)
         
         Args:
             max_depth (int): 최대 중첩 깊이
             timeout (int): 대기 시간(초)
+            use_cache (bool): 창별 iframe 경로 캐시 먼저 사용 (이미 확인한 경우 False)
             
         Returns:
             bool: 성공 여부
         """
+        handle = _current_handle(self.driver)
+        
+        # 이 창에서 이미 확인한 경로가 있으면 인덱스 이동만으로 전환
+        if use_cache and handle and frame_path_cache.switch(self.driver, handle):
+            self.iframe_stack = ["cached"]
+            return True
+        
         # 기본 컨텐츠로 먼저 복귀
         self.driver.switch_to.default_content()
         self.iframe_stack = []  # 스택 초기화
         
-        return self._find_and_switch_recursive(depth=0, max_depth=max_depth, timeout=timeout)
+        switched = self._find_and_switch_recursive(depth=0, max_depth=max_depth, timeout=timeout)
+        if switched and handle:
+            frame_path_cache.remember(self.driver, handle)
+        return switched
+    
+    @property
+    def cache_stats(self):
+        """iframe 경로 캐시 통계"""
+        return frame_path_cache.stats()
     
     def _find_and_switch_recursive(self, depth=0, max_depth=2, timeout=3):
         """
         iframe을 재귀적으로 찾아 전환 (내부 메서드)
+        - 첫 번째로 전환 가능한 iframe으로 들어가고, 중첩 iframe이 있으면 max_depth까지 더 들어감
+        - 하위 탐색에 실패하면 parent_frame()으로 한 단계만 복귀 (스택 재구성 없음)
         
         Args:
             depth (int): 현재 깊이
@@ -129,11 +304,11 @@ class IframeManager:
             timeout (int): 대기 시간(초)
             
         Returns:
-            bool: 성공 여부
+            bool: 성공 여부 (iframe 안에 있으면 성공)
         """
-        # 최대 깊이 초과 시 종료
+        # 최대 깊이 도달 시 현재 iframe 유지
         if depth >= max_depth:
-            return False
+            return depth > 0
         
         try:
             # 현재 문서에서 모든 iframe 찾기
@@ -141,67 +316,36 @@ class IframeManager:
             
             if not iframes:
                 logger.info(f"깊이 {depth}에서 iframe을 찾을 수 없음")
-                return False
+                # 더 이상 중첩된 iframe이 없으면 현재 iframe이 목적지
+                return depth > 0
             
             logger.info(f"깊이 {depth}에서 {len(iframes)}개의 iframe 발견")
             
             # 각 iframe에 대해 시도
             for i, iframe in enumerate(iframes):
                 try:
+                    # 스택 식별자 (전환 전에 부모 문서에서 읽음)
+                    iframe_id = iframe.get_attribute("id") or iframe.get_attribute("name") or f"iframe_{depth}_{i}"
+                    
                     # iframe으로 전환
                     self.driver.switch_to.frame(iframe)
-                    
-                    # 스택에 추가 (임시 식별자 사용)
-                    iframe_id = iframe.get_attribute("id") or iframe.get_attribute("name") or f"iframe_{depth}_{i}"
                     self.iframe_stack.append(iframe_id)
-                    
                     logger.info(f"깊이 {depth}의 iframe {iframe_id}로 전환 성공")
                     
                     # 중첩된 iframe이 있는지 재귀적으로 확인
-                    nested_result = self._find_and_switch_recursive(depth + 1, max_depth, timeout)
-                    
-                    # 중첩된 iframe으로 전환 성공 시 현재 상태 유지
-                    if nested_result:
+                    if self._find_and_switch_recursive(depth + 1, max_depth, timeout):
                         return True
                     
-                    # 실패 시 현재 iframe으로 다시 전환
-                    self.driver.switch_to.default_content()
-                    for j in range(len(self.iframe_stack) - 1):  # 마지막 항목 제외
-                        selector = self.iframe_stack[j]
-                        if selector.startswith("iframe_"):
-                            # 임시 식별자인 경우 인덱스로 접근
-                            parts = selector.split("_")
-                            d, idx = int(parts[1]), int(parts[2])
-                            frame = self.driver.find_elements(By.TAG_NAME, "iframe")[idx]
-                            self.driver.switch_to.frame(frame)
-                        else:
-                            iframe = self.driver.find_element(By.CSS_SELECTOR, selector)
-                            self.driver.switch_to.frame(iframe)
-                    
-                    # 스택에서 제거
+                    # 실패 시 부모 문서로 한 단계 복귀 후 다음 iframe 시도
+                    self.driver.switch_to.parent_frame()
                     self.iframe_stack.pop()
                     
                 except (NoSuchElementException, TimeoutException, StaleElementReferenceException) as e:
                     logger.warning(f"iframe 전환 중 오류: {e}")
-                    # 기본 컨텐츠로 복귀하고 다시 현재 깊이까지 전환
+                    # 이 깊이의 요소 목록이 만료되었으므로 처음부터 다시 탐색하도록 실패 처리
                     self.driver.switch_to.default_content()
                     self.iframe_stack = []
-                    continue
-            
-            # 모든 iframe 시도 후 실패 시 부모로 복귀
-            if len(self.iframe_stack) > 0:
-                self.driver.switch_to.default_content()
-                for i in range(len(self.iframe_stack) - 1):
-                    selector = self.iframe_stack[i]
-                    if selector.startswith("iframe_"):
-                        # 임시 식별자인 경우 인덱스로 접근
-                        parts = selector.split("_")
-                        d, idx = int(parts[1]), int(parts[2])
-                        frame = self.driver.find_elements(By.TAG_NAME, "iframe")[idx]
-                        self.driver.switch_to.frame(frame)
-                    else:
-                        iframe = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        self.driver.switch_to.frame(iframe)
+                    return False
             
             return False
             
@@ -445,6 +589,7 @@ class IframeManager:
 
 # 유틸리티 함수: 기존 코드에 쉽게 통합하기 위한 함수들
 
+@latency_tracker.timed(STAGE_IFRAME_SWITCH)
 def switch_to_iframe_with_retry(driver, max_retries=3, max_depth=2):
     """
     iframe 전환 시도 (중첩된 iframe 처리)
@@ -457,6 +602,12 @@ def switch_to_iframe_with_retry(driver, max_retries=3, max_depth=2):
     Returns:
         bool: 성공 여부
     """
+    handle = _current_handle(driver)
+    
+    # 이 창에서 이미 확인한 경로가 있으면 find_elements 없이 인덱스 이동만으로 전환
+    if handle and frame_path_cache.switch(driver, handle):
+        return True
+    
     iframe_manager = IframeManager(driver)
     
     # 기본 컨텐츠로 복귀
@@ -476,14 +627,18 @@ def switch_to_iframe_with_retry(driver, max_retries=3, max_depth=2):
                     try:
                         driver.switch_to.frame(nested_iframe[0])
                         # logger.info("중첩된 iframe 발견 및 전환 성공")
+                        if handle:
+                            frame_path_cache.remember(driver, handle)
                         return True
                     except:
                         logger.info("중첩된 iframe 전환 실패, 단일 iframe 상태 유지")
                 
+                if handle:
+                    frame_path_cache.remember(driver, handle)
                 return True
             
             # 2. IframeManager로 자동 검색 시도
-            if iframe_manager.find_and_switch_to_any_iframe(max_depth=max_depth):
+            if iframe_manager.find_and_switch_to_any_iframe(max_depth=max_depth, use_cache=False):
                 logger.info(f"IframeManager로 iframe 전환 성공 (시도 {retry+1}/{max_retries})")
                 return True
             
@@ -0,0 +1,166 @@
+# utils/latency_tracker.py
+"""
+결과 감지부터 베팅 확인까지 단계별 소요 시간 측정
+- 단계(iframe 전환, 보드 가져오기, 파싱, 예측, 마틴 금액, 칩/영역 클릭, 금액 확인)마다
+  span()/timed()로 시간을 재서 최근 샘플을 메모리에 보관하고 p50/p95/p99를 계산
+- 새 결과 감지 시각을 mark()로 남겨 두고 베팅 확인 시 measure_since()로 전체 지연(결과 → 베팅 확인)을 기록
+- export_json()으로 파일 저장, MainWindow의 지연 시간 패널(ui/latency_panel.py)에서 확인
+"""
+import functools
+import json
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# 단계 이름 (패널 표시 순서)
+STAGE_IFRAME_SWITCH = "iframe_switch"
+STAGE_PAGE_FETCH = "page_fetch"
+STAGE_PARSE = "parse"
+STAGE_PREDICTION = "prediction"
+STAGE_MARTIN_AMOUNT = "martin_amount"
+STAGE_BET_WINDOW = "bet_window"
+STAGE_CHIP_CLICK = "chip_click"
+STAGE_AREA_CLICK = "area_click"
+STAGE_BET_CLICKS = "bet_clicks"
+STAGE_BET_CONFIRM = "bet_confirm"
+STAGE_RESULT_TO_BET = "result_to_bet"
+
+STAGES = (
+    STAGE_IFRAME_SWITCH,
+    STAGE_PAGE_FETCH,
+    STAGE_PARSE,
+    STAGE_PREDICTION,
+    STAGE_MARTIN_AMOUNT,
+    STAGE_BET_WINDOW,
+    STAGE_CHIP_CLICK,
+    STAGE_AREA_CLICK,
+    STAGE_BET_CLICKS,
+    STAGE_BET_CONFIRM,
+    STAGE_RESULT_TO_BET,
+)
+
+# mark() 이름
+MARK_RESULT = "result"
+
+
+def _percentile(ordered, q):
+    """정렬된 샘플의 q 백분위수 (최근접 순위)"""
+    index = max(0, math.ceil(q / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+class LatencyTracker:
+    """단계별 소요 시간 히스토그램"""
+
+    MAX_SAMPLES = 500  # 단계별 보관할 최근 샘플 수
+
+    def __init__(self, max_samples=MAX_SAMPLES):
+        self.max_samples = max_samples
+        self._samples = {}  # 단계 -> deque(초)
+        self._counts = {}  # 단계 -> 전체 기록 수
+        self._marks = {}  # 이름 -> time.perf_counter()
+        self._lock = threading.Lock()
+
+    def record(self, stage, seconds):
+        """단계 소요 시간 기록 (초)"""
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.max_samples)
+            samples.append(seconds)
+            self._counts[stage] = self._counts.get(stage, 0) + 1
+
+    @contextmanager
+    def span(self, stage):
+        """with 블록 소요 시간 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def timed(self, stage):
+        """함수 호출 소요 시간을 기록하는 데코레이터"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(stage):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def mark(self, name, at=None):
+        """
+        기준 시각 기록 (예: 새 결과 감지)
+
+        Args:
+            at (float, optional): 기준 시각 (time.perf_counter() 값, 없으면 현재) - 결과를 처음 읽은 시각 등
+        """
+        with self._lock:
+            self._marks[name] = at if at is not None else time.perf_counter()
+
+    def measure_since(self, stage, name, clear=True):
+        """
+        mark(name) 이후 경과 시간을 stage로 기록
+
+        Returns:
+            float: 경과 시간 (초) 또는 None (기준 시각이 없는 경우)
+        """
+        with self._lock:
+            started = self._marks.pop(name, None) if clear else self._marks.get(name)
+        if started is None:
+            return None
+        elapsed = time.perf_counter() - started
+        self.record(stage, elapsed)
+        return elapsed
+
+    def summary(self):
+        """
+        단계별 통계 (STAGES 순서, 그 외 단계는 뒤에)
+
+        Returns:
+            dict: {단계: {'count', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'last_ms'}}
+        """
+        with self._lock:
+            snapshot = {stage: list(samples) for stage, samples in self._samples.items()}
+            counts = dict(self._counts)
+
+        ordered_stages = [stage for stage in STAGES if stage in snapshot]
+        ordered_stages += sorted(stage for stage in snapshot if stage not in STAGES)
+
+        result = {}
+        for stage in ordered_stages:
+            samples = snapshot[stage]
+            ordered = sorted(samples)
+            result[stage] = {
+                "count": counts[stage],
+                "p50_ms": round(_percentile(ordered, 50) * 1000, 1),
+                "p95_ms": round(_percentile(ordered, 95) * 1000, 1),
+                "p99_ms": round(_percentile(ordered, 99) * 1000, 1),
+                "max_ms": round(ordered[-1] * 1000, 1),
+                "last_ms": round(samples[-1] * 1000, 1),
+            }
+        return result
+
+    def export_json(self, path):
+        """통계를 JSON 파일로 저장"""
+        payload = {
+            "exported_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "window": self.max_samples,
+            "stages": self.summary(),
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(payload, file, ensure_ascii=False, indent=2)
+        return payload
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+            self._marks.clear()
+
+
+# 프로세스 전체에서 공유하는 지연 시간 기록
+latency_tracker = LatencyTracker()
@@ -0,0 +1,144 @@
+# utils/parse_cache.py
+"""
+폴링 주기(틱) 안에서 공유하는 단기 파싱 결과 캐시
+- 프레임 내용의 빠른 해시 (길이 + 문자열 해시)를 키로 파싱 결과를 저장
+- 같은 틱에서 다시 요청하면 가져오기/파싱 없이 최근 결과를 재사용 (latest)
+- TTL과 최대 개수로 오래된 항목 제거
+- 분석 스레드와 메인 스레드에서 함께 사용하므로 잠금으로 보호
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class ParseCache:
+    """내용 해시 + 시각 기반 단기 파싱 캐시"""
+
+    DEFAULT_TTL = 2.0  # 초 (기본 게임 분석 주기와 동일)
+    DEFAULT_MAX_ENTRIES = 32
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            ttl (float): 항목 유지 시간 (초)
+            max_entries (int): 최대 항목 수 (초과 시 가장 오래된 항목부터 제거)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._entries = OrderedDict()  # (종류, 내용 키) -> (저장 시각, 값)
+        self._latest = {}  # 종류 -> (저장 시각, 값)
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def content_key(content):
+        """프레임 내용의 빠른 해시 키 (문자열 해시는 객체에 캐시되어 재계산 비용이 없음)"""
+        if content is None:
+            return None
+        return len(content), hash(content)
+
+    def get(self, kind, content):
+        """
+        같은 내용으로 파싱한 결과 조회
+
+        Args:
+            kind (str): 결과 종류 (예: 'game_state', 'lobby_balance')
+            content (str): 프레임 내용 (HTML 또는 압축 보드 문자열)
+
+        Returns:
+            파싱 결과 또는 None (없거나 만료된 경우)
+        """
+        key = (kind, self.content_key(content))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry[0] > self.ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, kind, content, value):
+        """파싱 결과 저장 (같은 종류의 최근 결과로도 기록)"""
+        key = (kind, self.content_key(content))
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now, value)
+            self._entries.move_to_end(key)
+            self._latest[kind] = (now, value)
+            self._evict(now)
+        return value
+
+    def get_or_parse(self, kind, content, parse):
+        """
+        캐시에 있으면 재사용, 없으면 parse(content) 결과를 저장 후 반환
+
+        Args:
+            kind (str): 결과 종류
+            content (str): 프레임 내용
+            parse (callable): 내용을 받아 파싱 결과를 반환하는 함수
+        """
+        value = self.get(kind, content)
+        if value is not None:
+            return value
+        value = parse(content)
+        if value is not None:
+            self.put(kind, content, value)
+        return value
+
+    def latest(self, kind, max_age=None):
+        """
+        같은 틱에서 이미 얻은 최근 결과 조회 (프레임을 다시 가져오지 않음)
+
+        Args:
+            kind (str): 결과 종류
+            max_age (float, optional): 허용할 최대 경과 시간 (초, 없으면 TTL)
+
+        Returns:
+            최근 결과 또는 None
+        """
+        max_age = self.ttl if max_age is None else min(max_age, self.ttl)
+        with self._lock:
+            entry = self._latest.get(kind)
+            if entry is None or time.monotonic() - entry[0] > max_age:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def invalidate(self, kind=None):
+        """캐시 비우기 (방 이동, 슈 리셋 등) - kind를 지정하면 해당 종류만"""
+        with self._lock:
+            if kind is None:
+                self._entries.clear()
+                self._latest.clear()
+                return
+            for key in [key for key in self._entries if key[0] == kind]:
+                del self._entries[key]
+            self._latest.pop(kind, None)
+
+    def _evict(self, now):
+        """만료 항목과 초과 항목 제거 (잠금 안에서 호출)"""
+        while self._entries:
+            key, (stored_at, _) = next(iter(self._entries.items()))
+            if now - stored_at <= self.ttl and len(self._entries) <= self.max_entries:
+                break
+            del self._entries[key]
+
+        for kind in [kind for kind, (stored_at, _) in self._latest.items() if now - stored_at > self.ttl]:
+            del self._latest[kind]
+
+    def stats(self):
+        """캐시 적중 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
@@ -1,12 +1,115 @@
 from bs4 import BeautifulSoup
+from enum import IntFlag
+from html import unescape
+from html.parser import HTMLParser as _StdHTMLParser
 import re
 
+def _class_element_re(tag, class_name):
+    """class 속성에 class_name 토큰이 있는 첫 번째 tag 요소와 내용을 찾는 정규식"""
+    return re.compile(
+        r'<%s\b[^>]*?\bclass\s*=\s*(["\'])[^"\']*?(?<![\w-])%s(?![\w-])[^"\']*\1[^>]*>(.*?)</%s\s*>'
+        % (tag, re.escape(class_name), tag),
+        re.IGNORECASE | re.DOTALL,
+    )
+
+
+_BALANCE_SPAN_RE = _class_element_re("span", "balance")
+_USER_BALANCE_DIV_RE = _class_element_re("div", "user-balance")
+_USERNAME_SPAN_RE = _class_element_re("span", "username")
+_DEPOSIT_LINK_RE = re.compile(r'<a\b([^>]*)>(.*?)</a\s*>', re.IGNORECASE | re.DOTALL)
+_NAV_LINK_CLASS_RE = re.compile(r'\bclass\s*=\s*["\'][^"\']*?(?<![\w-])nav-link(?![\w-])', re.IGNORECASE)
+_DEPOSIT_HREF_RE = re.compile(r'\bhref\s*=\s*["\']#ModalDeposit["\']', re.IGNORECASE)
+_YELLOW_STRONG_RE = _class_element_re("strong", "fontcolor_yellow")
+_TAG_RE = re.compile(r'<[^>]+>')
+_CASH_RE = re.compile(r"캐쉬\s*:\s*([\d,]+)")
+_WELCOME_RE = re.compile(r"<strong>([^<]+)</strong>\s*회원님\s*환영합니다")
+
+# 정규식 빠른 경로로 판단할 수 없어 DOM 트리가 필요한 경우
+_NEEDS_SOUP = object()
+
+
+def _element_text(inner_html):
+    """요소 내부 HTML에서 태그를 제거한 텍스트"""
+    text = _TAG_RE.sub("", inner_html)
+    return unescape(text) if "&" in text else text
+
+
 class HTMLParser:
+    """
+    로비 페이지 HTML 파서
+    - 원본 HTML에 정규식을 먼저 적용하고, 판단할 수 없을 때만 BeautifulSoup 트리를 만듭니다.
+    """
+
     def __init__(self, html):
-        self.soup = BeautifulSoup(html, "html.parser")
+        self.html = html or ""
+        self._soup = None
+
+    @property
+    def soup(self):
+        """BeautifulSoup 트리 (처음 필요할 때 생성)"""
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, "html.parser")
+        return self._soup
 
     def get_balance(self):
         """잔액 정보 추출"""
+        balance = self._get_balance_fast()
+        if balance is not _NEEDS_SOUP:
+            return balance
+        return self._get_balance_from_soup()
+
+    def _get_balance_fast(self):
+        """
+        원본 HTML에서 정규식으로 잔액 추출 (_get_balance_from_soup와 같은 우선순위)
+
+        Returns:
+            int: 잔액, None (잔액 없음) 또는 _NEEDS_SOUP (중첩 태그 등으로 판단 불가)
+        """
+        html = self.html
+
+        # 1️⃣ 특정 클래스명을 가진 요소 (span.balance → div.user-balance)
+        match = _BALANCE_SPAN_RE.search(html)
+        if not match:
+            if "balance" in html and re.search(r'<span\b[^>]*(?<![\w-])balance(?![\w-])', html, re.IGNORECASE):
+                return _NEEDS_SOUP
+            match = _USER_BALANCE_DIV_RE.search(html)
+            if not match and "user-balance" in html:
+                return _NEEDS_SOUP
+
+        if match:
+            if "<span" in match.group(2).lower() or "<div" in match.group(2).lower():
+                return _NEEDS_SOUP
+            balance = re.sub(r"[^\d]", "", _element_text(match.group(2)))
+            if balance.isdigit():
+                return int(balance)
+
+        # 2️⃣ 1번 사이트의 "캐쉬 :" 링크 (a.nav-link[href=#ModalDeposit] 안의 strong.fontcolor_yellow)
+        if "ModalDeposit" in html:
+            for link in _DEPOSIT_LINK_RE.finditer(html):
+                attrs = link.group(1)
+                if not (_NAV_LINK_CLASS_RE.search(attrs) and _DEPOSIT_HREF_RE.search(attrs)):
+                    continue
+                if "<a" in link.group(2).lower():
+                    return _NEEDS_SOUP
+                strong = _YELLOW_STRONG_RE.search(link.group(2))
+                if strong:
+                    balance = re.sub(r"[^\d]", "", _element_text(strong.group(2)))
+                    if balance.isdigit():
+                        return int(balance)
+                break
+
+        # 3️⃣ "캐쉬 : 숫자" 텍스트 패턴
+        if "캐쉬" not in html:
+            return None
+        cash_pattern = _CASH_RE.search(_element_text(html))
+        if cash_pattern:
+            balance = re.sub(r"[^\d]", "", cash_pattern.group(1))
+            if balance.isdigit():
+                return int(balance)
+        return _NEEDS_SOUP
+
+    def _get_balance_from_soup(self):
+        """BeautifulSoup 트리에서 잔액 추출 (정규식으로 판단할 수 없는 경우)"""
 
         # 1️⃣ 기존 방식: 특정 클래스명을 가진 요소에서 잔액 찾기
         balance_element = self.soup.find("span", class_="balance")  
@@ -30,7 +133,7 @@ class HTMLParser:
                     return int(balance)
 
         # 3️⃣ 정규식 방식: "캐쉬 : 숫자" 패턴 찾기
-        cash_pattern = re.search(r"캐쉬\s*:\s*([\d,]+)", self.soup.text)
+        cash_pattern = _CASH_RE.search(self.soup.text)
         if cash_pattern:
             balance_text = cash_pattern.group(1)
             balance = re.sub(r"[^\d]", "", balance_text)  # 숫자만 추출
@@ -41,6 +144,14 @@ class HTMLParser:
         
     def get_username(self):
         """사용자 이름 추출"""
+        html = self.html
+
+        # 빠른 경로: span.username 요소 또는 환영 문구가 없는 페이지는 트리 없이 처리
+        match = _USERNAME_SPAN_RE.search(html)
+        if match and "<span" not in match.group(2).lower():
+            return _element_text(match.group(2)).strip()
+        if not match and "username" not in html and "회원님" not in html:
+            return None
         
         # 1️⃣ 기존 방식: 특정 클래스명을 가진 요소에서 사용자 이름 찾기
         username_element = self.soup.find("span", class_="username")
@@ -59,88 +170,258 @@ class HTMLParser:
             pass
             
         # 3️⃣ 정규식 방식: 사용자 이름 찾기 패턴
-        username_pattern = re.search(r"<strong>([^<]+)</strong>\s*회원님\s*환영합니다", str(self.soup))
+        username_pattern = _WELCOME_RE.search(str(self.soup))
         if username_pattern:
             return username_pattern.group(1).strip()
             
         return None  # 사용자 이름을 찾을 수 없는 경우
     
+class CasinoField(IntFlag):
+    """CasinoParser가 추출할 필드 마스크"""
+    ROOM_NAME = 1
+    GAME_STATUS = 2
+    BETTING_OPTIONS = 4
+    LAST_RESULTS = 8
+    BET_AMOUNTS = 16
+    ALL = ROOM_NAME | GAME_STATUS | BETTING_OPTIONS | LAST_RESULTS | BET_AMOUNTS
+
+
+# 필드별 대상 class 이름
+_FIELD_CLASSES = (
+    (CasinoField.ROOM_NAME, "room-name"),
+    (CasinoField.GAME_STATUS, "game-status"),
+    (CasinoField.BETTING_OPTIONS, "betting-option"),
+    (CasinoField.LAST_RESULTS, "game-result"),
+    (CasinoField.BET_AMOUNTS, "bet-amount"),
+)
+# 첫 번째 요소만 필요한 필드 (모두 찾으면 파싱을 일찍 끝낼 수 있음)
+_SINGLE_FIELDS = CasinoField.ROOM_NAME | CasinoField.GAME_STATUS
+_VOID_TAGS = frozenset((
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+))
+
+
+class _StopParsing(Exception):
+    """필요한 필드를 모두 찾아 파싱을 중단"""
+
+
+class _CasinoVisitor(_StdHTMLParser):
+    """
+    HTML을 한 번만 훑으며 마스크에 포함된 필드를 모두 채우는 방문자
+    - 열린 요소 스택을 유지하고, 대상 요소가 닫힐 때 모은 텍스트로 필드를 완성
+    """
+
+    def __init__(self, fields):
+        super().__init__(convert_charrefs=True)
+        self.fields = fields
+        self.stack = []  # [(태그, [(필드, 속성, 텍스트 조각 목록), ...]), ...]
+        self.open_captures = []  # 현재 텍스트를 모으는 중인 캡처 목록
+
+        self.room_name = None
+        self.title = None
+        self.game_status = None
+        self.betting_options = []
+        self.last_results = []
+        self.bet_amounts = {}
+
+        self.found_single = CasinoField(0)
+
+    def handle_starttag(self, tag, attrs):
+        captures = []
+        attr_map = None
+        class_names = None
+
+        for name, value in attrs:
+            if name == "class" and value:
+                class_names = value.split()
+                break
+
+        if class_names:
+            for field, class_name in _FIELD_CLASSES:
+                if not (self.fields & field) or class_name not in class_names:
+                    continue
+                if field & _SINGLE_FIELDS and self.found_single & field:
+                    continue
+                if attr_map is None:
+                    attr_map = dict(attrs)
+                captures.append((field, attr_map, []))
+
+        if tag == "title" and self.title is None and self.fields & CasinoField.ROOM_NAME:
+            captures.append((None, None, []))
+
+        if tag in _VOID_TAGS:
+            for capture in captures:
+                self._finish(capture)
+            return
+
+        self.stack.append((tag, captures))
+        self.open_captures.extend(captures)
+
+    def handle_startendtag(self, tag, attrs):
+        # <div class="..."/> 형태도 빈 요소로 처리
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        # 짝이 맞지 않는 태그는 해당 태그가 열린 곳까지 닫음 (없으면 무시)
+        for index in range(len(self.stack) - 1, -1, -1):
+            if self.stack[index][0] == tag:
+                break
+        else:
+            return
+
+        while len(self.stack) > index:
+            _, captures = self.stack.pop()
+            if not captures:
+                continue
+            # 캡처는 스택 순서대로 쌓이므로 닫히는 요소의 캡처는 항상 목록 끝에 있음
+            del self.open_captures[-len(captures):]
+            for capture in captures:
+                self._finish(capture)
+
+    def handle_data(self, data):
+        for capture in self.open_captures:
+            capture[2].append(data)
+
+    def close(self):
+        super().close()
+        # 닫히지 않은 요소도 문서 끝에서 완성
+        while self.stack:
+            _, captures = self.stack.pop()
+            for capture in captures:
+                self._finish(capture)
+        self.open_captures = []
+
+    def _finish(self, capture):
+        """캡처한 요소의 텍스트로 필드 완성"""
+        field, attrs, parts = capture
+        text = "".join(parts)
+
+        if field is None:
+            self.title = text.strip()
+        elif field == CasinoField.ROOM_NAME:
+            self.room_name = text.strip()
+        elif field == CasinoField.GAME_STATUS:
+            self.game_status = text.strip()
+        elif field == CasinoField.BETTING_OPTIONS:
+            self.betting_options.append(attrs.get("data-name", text.strip()))
+        elif field == CasinoField.LAST_RESULTS:
+            result_class = (attrs.get("class") or "").split()
+            # 클래스 이름으로 Player/Banker/Tie 구분 예시
+            if "player-win" in result_class:
+                result = "P"
+            elif "banker-win" in result_class:
+                result = "B"
+            elif "tie" in result_class:
+                result = "T"
+            else:
+                result = text.strip()
+            self.last_results.append(result)
+        elif field == CasinoField.BET_AMOUNTS:
+            amount = re.sub(r"[^\d]", "", text.strip())  # 숫자만 추출
+            if amount.isdigit():
+                self.bet_amounts[attrs.get("data-option", "unknown")] = int(amount)
+
+        if field is not None and field & _SINGLE_FIELDS:
+            self.found_single |= field
+            # 목록 필드를 요청하지 않았고 단일 필드를 모두 찾았으면 나머지 문서는 건너뜀
+            if not (self.fields & ~_SINGLE_FIELDS) and self.found_single == self.fields & _SINGLE_FIELDS:
+                raise _StopParsing()
+
+
 class CasinoParser:
-    """카지노 페이지 파싱을 위한 클래스"""
+    """
+    카지노 페이지 파싱을 위한 클래스
+    - 모든 필드를 한 번의 HTML 순회로 추출 (fields 마스크로 필요한 필드만 선택)
+    - 마스크에 없는 필드를 요청하면 그 필드만 추가로 파싱
+    """
     
-    def __init__(self, html):
-        self.soup = BeautifulSoup(html, "html.parser")
-        
-    def get_room_name(self):
-        """현재 방 이름 파싱"""
-        # 예: 클래스, ID 또는 특정 요소 구조를 기반으로 방 이름 찾기
-        room_element = self.soup.find(class_="room-name")
-        if room_element:
-            return room_element.text.strip()
-            
-        # 다른 방식으로 시도
-        title_element = self.soup.find("title")
-        if title_element:
-            title_text = title_element.text.strip()
-            # 제목에서 방 이름 추출 (예: "바카라 A - Live Casino")
-            match = re.search(r"(.+?)(?:\s*-\s*|$)", title_text)
+    def __init__(self, html, fields=CasinoField.ALL):
+        self.html = html or ""
+        self.fields = CasinoField(fields)
+        self._parsed = CasinoField(0)
+        self._values = {}
+
+    def _ensure(self, field):
+        """필드가 아직 파싱되지 않았으면 (마스크의 나머지 필드와 함께) 한 번에 파싱"""
+        if self._parsed & field:
+            return
+        self._parse(field | (self.fields & ~self._parsed))
+
+    def _parse(self, fields):
+        visitor = _CasinoVisitor(fields)
+        try:
+            visitor.feed(self.html)
+            visitor.close()
+        except _StopParsing:
+            pass
+
+        if fields & CasinoField.ROOM_NAME:
+            self._values[CasinoField.ROOM_NAME] = self._resolve_room_name(visitor)
+        if fields & CasinoField.GAME_STATUS:
+            self._values[CasinoField.GAME_STATUS] = visitor.game_status
+        if fields & CasinoField.BETTING_OPTIONS:
+            self._values[CasinoField.BETTING_OPTIONS] = visitor.betting_options
+        if fields & CasinoField.LAST_RESULTS:
+            self._values[CasinoField.LAST_RESULTS] = visitor.last_results
+        if fields & CasinoField.BET_AMOUNTS:
+            self._values[CasinoField.BET_AMOUNTS] = visitor.bet_amounts
+        self._parsed |= fields
+
+    @staticmethod
+    def _resolve_room_name(visitor):
+        """room-name 요소가 없으면 제목에서 방 이름 추출 (예: "바카라 A - Live Casino")"""
+        if visitor.room_name is not None:
+            return visitor.room_name
+        if visitor.title is not None:
+            match = re.search(r"(.+?)(?:\s*-\s*|$)", visitor.title)
             if match:
                 return match.group(1).strip()
-                
         return "알 수 없는 방"
+
+    def parse(self):
+        """
+        마스크에 포함된 필드를 한 번에 추출
+
+        Returns:
+            dict: {'room_name', 'game_status', 'betting_options', 'last_results', 'bet_amounts'} 중 요청한 필드
+        """
+        self._ensure(self.fields)
+        getters = (
+            (CasinoField.ROOM_NAME, "room_name"),
+            (CasinoField.GAME_STATUS, "game_status"),
+            (CasinoField.BETTING_OPTIONS, "betting_options"),
+            (CasinoField.LAST_RESULTS, "last_results"),
+            (CasinoField.BET_AMOUNTS, "bet_amounts"),
+        )
+        return {name: self._values[field] for field, name in getters if self.fields & field}
+        
+    def get_room_name(self):
+        """현재 방 이름 파싱"""
+        self._ensure(CasinoField.ROOM_NAME)
+        return self._values[CasinoField.ROOM_NAME]
         
     def get_game_status(self):
         """현재 게임 상태 파싱 (대기 중, 베팅 중, 결과 발표 등)"""
-        # 예시 - 실제 구현은 사이트 구조에 따라 조정 필요
-        status_element = self.soup.find(class_="game-status")
-        if status_element:
-            return status_element.text.strip()
-        return None
+        self._ensure(CasinoField.GAME_STATUS)
+        return self._values[CasinoField.GAME_STATUS]
         
     def get_betting_options(self):
         """사용 가능한 베팅 옵션 파싱 (예: Player, Banker, Tie)"""
-        options = []
-        # 베팅 옵션 요소 찾기 (실제 구현은 사이트 구조에 따라 조정 필요)
-        option_elements = self.soup.find_all(class_="betting-option")
-        for element in option_elements:
-            option_name = element.get("data-name", element.text.strip())
-            options.append(option_name)
-        return options
+        self._ensure(CasinoField.BETTING_OPTIONS)
+        return self._values[CasinoField.BETTING_OPTIONS]
         
     def get_last_results(self):
         """최근 게임 결과 파싱 (예: 최근 10판의 결과)"""
-        results = []
-        # 결과 요소 찾기 (실제 구현은 사이트 구조에 따라 조정 필요)
-        result_elements = self.soup.find_all(class_="game-result")
-        for element in result_elements:
-            result_text = element.text.strip()
-            result_class = element.get("class", [])
-            
-            # 클래스 이름으로 Player/Banker/Tie 구분 예시
-            if "player-win" in result_class:
-                result = "P"
-            elif "banker-win" in result_class:
-                result = "B"
-            elif "tie" in result_class:
-                result = "T"
-            else:
-                result = result_text
-                
-            results.append(result)
-        return results
+        self._ensure(CasinoField.LAST_RESULTS)
+        return self._values[CasinoField.LAST_RESULTS]
         
     def get_current_bet_amounts(self):
         """현재 베팅 금액 파싱 (각 옵션별)"""
-        bet_amounts = {}
-        # 베팅 금액 요소 찾기 (실제 구현은 사이트 구조에 따라 조정 필요)
-        amount_elements = self.soup.find_all(class_="bet-amount")
-        for element in amount_elements:
-            option_name = element.get("data-option", "unknown")
-            amount_text = element.text.strip()
-            amount = re.sub(r"[^\d]", "", amount_text)  # 숫자만 추출
-            if amount.isdigit():
-                bet_amounts[option_name] = int(amount)
-        return bet_amounts
+        self._ensure(CasinoField.BET_AMOUNTS)
+        return self._values[CasinoField.BET_AMOUNTS]
 
 # 메인 윈도우 클래스에 코드 추가 예시
 def parse_casino_page(self):
@@ -155,14 +436,13 @@ def parse_casino_page(self):
             print("[ERROR] 페이지 소스를 가져올 수 없음")
             return None
             
-        parser = CasinoParser(html)
-        
-        # 정보 추출
-        room_name = parser.get_room_name()
-        game_status = parser.get_game_status()
-        betting_options = parser.get_betting_options()
-        last_results = parser.get_last_results()
-        bet_amounts = parser.get_current_bet_amounts()
+        # 정보 추출 (한 번의 순회로 모든 필드 추출)
+        info = CasinoParser(html).parse()
+        room_name = info["room_name"]
+        game_status = info["game_status"]
+        betting_options = info["betting_options"]
+        last_results = info["last_results"]
+        bet_amounts = info["bet_amounts"]
         
         # 결과 출력
         print(f"[INFO] 방 이름: {room_name}")
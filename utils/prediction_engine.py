@@ -1,5 +1,7 @@
 # utils/prediction_engine.py
 import logging
+from utils.result_history import ResultHistory
+from utils.latency_tracker import latency_tracker, STAGE_PREDICTION
 
 class PredictionEngine:
     """
@@ -11,7 +13,7 @@ class PredictionEngine:
         """예측 엔진 초기화"""
         self.logger = logger or logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
-        self.recent_results = []  # 최근 결과 (P, B만 포함)
+        self.recent_results = ResultHistory(capacity=10, symbols=ResultHistory.PB_SYMBOLS)  # 최근 결과 (P, B만 포함)
         
     def add_result(self, result):
         """
@@ -24,10 +26,8 @@ class PredictionEngine:
         if result not in ['P', 'B']:
             return
             
-        # 결과 추가 및 최대 10개 유지
+        # 결과 추가 (링 버퍼가 최대 10개 유지)
         self.recent_results.append(result)
-        if len(self.recent_results) > 10:
-            self.recent_results.pop(0)
             
     def add_multiple_results(self, results):
         """
@@ -39,6 +39,7 @@ class PredictionEngine:
         for result in results:
             self.add_result(result)
     
+    @latency_tracker.timed(STAGE_PREDICTION)
     def predict_next_pick(self):
         """
         다음 픽 예측 (클라이언트 룰 기반)
@@ -96,4 +97,4 @@ class PredictionEngine:
 
     def clear(self):
         """결과 초기화"""
-        self.recent_results = []
\ No newline at end of file
+        self.recent_results.clear()
\ No newline at end of file
@@ -0,0 +1,163 @@
+# utils/result_history.py
+"""
+게임 결과 기록용 고정 크기 링 버퍼
+- 결과 1개를 1바이트 코드로 저장 (bytearray)하여 결과마다 객체를 만들지 않음
+- append는 O(1), 용량을 넘으면 가장 오래된 결과부터 덮어씀 (list.pop(0) 불필요)
+- P/B 전용 보기와 최근 N개 창(window) 지원
+- 덮어써서 삭제된 결과도 결과별 누적 개수(total_count)로 유지 (전체 기간 통계용)
+- GameDetector, PredictionEngine, MartinBettingService에서 공통 사용
+"""
+
+UNKNOWN = "unknown"
+
+
+class ResultHistory:
+    """바이트 코드 기반 결과 기록 링 버퍼"""
+    __slots__ = ("capacity", "symbols", "_codes", "_buffer", "_head", "_size", "_totals")
+
+    DEFAULT_SYMBOLS = ("P", "B", "T")
+    PB_SYMBOLS = ("P", "B")
+
+    def __init__(self, capacity=128, symbols=DEFAULT_SYMBOLS):
+        """
+        Args:
+            capacity (int): 최대 보관 개수 (초과 시 오래된 결과부터 삭제)
+            symbols (tuple): 기록할 결과 기호 목록 (목록에 없는 값은 'unknown'으로 기록)
+        """
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다.")
+
+        self.capacity = capacity
+        self.symbols = (UNKNOWN,) + tuple(symbols)  # 코드 0은 항상 'unknown'
+        self._codes = {symbol: code for code, symbol in enumerate(self.symbols)}
+        self._buffer = bytearray(capacity)
+        self._head = 0  # 가장 오래된 결과의 위치
+        self._size = 0
+        self._totals = [0] * len(self.symbols)  # 결과 코드별 누적 개수 (삭제된 결과 포함)
+
+    def append(self, result):
+        """결과 1개 추가 (O(1))"""
+        code = self._codes.get(result, 0)
+        self._totals[code] += 1
+        if self._size < self.capacity:
+            self._buffer[(self._head + self._size) % self.capacity] = code
+            self._size += 1
+        else:
+            self._buffer[self._head] = code
+            self._head = (self._head + 1) % self.capacity
+
+    def extend(self, results):
+        """여러 결과 추가"""
+        for result in results:
+            self.append(result)
+
+    def clear(self):
+        """모든 결과 삭제 (버퍼는 재사용)"""
+        self._head = 0
+        self._size = 0
+        self._totals = [0] * len(self.symbols)
+
+    def _code_at(self, index):
+        """오래된 순 index번째 결과 코드"""
+        return self._buffer[(self._head + index) % self.capacity]
+
+    def last(self, n):
+        """
+        최근 N개 결과 (오래된 순)
+
+        Args:
+            n (int): 가져올 개수
+
+        Returns:
+            list: 결과 목록
+        """
+        n = min(max(n, 0), self._size)
+        symbols = self.symbols
+        return [symbols[self._code_at(i)] for i in range(self._size - n, self._size)]
+
+    def last_pb(self, n):
+        """
+        TIE 등을 제외한 최근 N개 P/B 결과 (오래된 순)
+
+        Args:
+            n (int): 가져올 P/B 결과 개수
+
+        Returns:
+            list: P/B 결과 목록
+        """
+        picked = []
+        for result in reversed(self):
+            if len(picked) >= n:
+                break
+            if result in self.PB_SYMBOLS:
+                picked.append(result)
+        picked.reverse()
+        return picked
+
+    def pb_view(self):
+        """P/B 결과만 남긴 목록 (오래된 순)"""
+        return [result for result in self if result in self.PB_SYMBOLS]
+
+    def count(self, result):
+        """특정 결과의 개수"""
+        code = self._codes.get(result, 0)
+        return sum(1 for i in range(self._size) if self._code_at(i) == code)
+
+    def total_count(self, result):
+        """특정 결과의 누적 개수 (용량을 넘어 삭제된 결과 포함)"""
+        code = self._codes.get(result)
+        return self._totals[code] if code is not None else 0
+
+    @property
+    def total(self):
+        """clear() 이후 추가된 전체 결과 수 (용량을 넘어 삭제된 결과 포함)"""
+        return sum(self._totals)
+
+    def streak(self, result):
+        """최신 결과부터 특정 결과가 연속된 횟수"""
+        count = 0
+        for item in reversed(self):
+            if item != result:
+                break
+            count += 1
+        return count
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        symbols = self.symbols
+        for i in range(self._size):
+            yield symbols[self._code_at(i)]
+
+    def __reversed__(self):
+        symbols = self.symbols
+        for i in range(self._size - 1, -1, -1):
+            yield symbols[self._code_at(i)]
+
+    def __contains__(self, result):
+        code = self._codes.get(result)
+        if code is None:
+            return False
+        return any(self._code_at(i) == code for i in range(self._size))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # 최근 N개 창 ([-n:])은 전체 목록을 만들지 않고 바로 계산
+            if index.stop is None and index.step is None and index.start is not None and index.start < 0:
+                return self.last(-index.start)
+            return list(self)[index]
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ResultHistory index out of range")
+        return self.symbols[self._code_at(index)]
+
+    def __eq__(self, other):
+        if isinstance(other, (ResultHistory, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
@@ -0,0 +1,149 @@
+# utils/result_push_channel.py
+"""
+Bead-road MutationObserver 결과 푸시 채널
+- 게임 iframe에 MutationObserver를 설치하고 새 셀을 CDP Runtime.addBinding 콜백으로 받음
+- 이벤트는 DevToolsController의 CDP 웹소켓으로 바로 수신 (CDP 클라이언트가 없으면 푸시 없이 폴링)
+- 바인딩을 쓸 수 없으면 console 이벤트(Runtime.consoleAPICalled)로 대체 (CDP 클라이언트가 runtime_enable일 때만)
+- 수신한 결과는 Qt 신호로 메인 스레드에 전달 (폴링은 워치독으로만 유지)
+"""
+import logging
+import time
+from PyQt6.QtCore import QObject, pyqtSignal
+from modules.bead_road_extractor import BEAD_ROAD_OBSERVER_SCRIPT
+
+BINDING_NAME = "__beadRoadPush"
+
+
+class ResultPushChannel(QObject):
+    """MutationObserver → CDP 바인딩 → Qt 신호 결과 푸시 채널"""
+    # (셀 개수, 최신 결과 'P'/'B'/'T'/'U' 또는 None)
+    result_pushed = pyqtSignal(int, object)
+
+    def __init__(self, devtools, logger=None):
+        super().__init__()
+        self.logger = logger or logging.getLogger(__name__)
+        self.devtools = devtools
+
+        self.listeners_registered = False
+        self.listener_source = None  # 리스너를 등록한 CDP 클라이언트 (브라우저 재시작 감지용)
+        self.last_push_time = 0
+        self.last_push_perf = 0.0  # 마지막 푸시 수신 시각 (time.perf_counter(), 지연 측정용)
+        self.last_count = None
+
+    @property
+    def is_active(self):
+        """CDP 이벤트 리스너가 등록되어 푸시를 받을 수 있는 상태인지 여부"""
+        return self.listeners_registered
+
+    def register_listeners(self):
+        """
+        CDP 이벤트 리스너 등록 (브라우저당 한 번)
+        - CDP 웹소켓 클라이언트로만 이벤트를 받음 (없으면 등록하지 않고 폴링만 사용)
+
+        Returns:
+            bool: 성공 여부 (False면 폴링만 사용)
+        """
+        cdp = self.devtools.cdp if getattr(self.devtools, 'has_cdp', False) else None
+
+        # 같은 브라우저에 이미 등록했으면 재사용 (브라우저가 재시작되면 다시 등록)
+        if self.listeners_registered and self.listener_source is cdp:
+            return True
+        self.listeners_registered = False
+        self.listener_source = None
+
+        if cdp is None:
+            return False
+
+        cdp.add_listener("Runtime.bindingCalled", self._on_binding_called)
+        cdp.add_listener("Runtime.consoleAPICalled", self._on_console_called)
+        self.listeners_registered = True
+        self.listener_source = cdp
+        self.logger.info("결과 푸시 채널 리스너 등록 완료 (CDP 웹소켓)")
+        return True
+
+    def _enable_binding(self, session_id=None):
+        """
+        현재 창(타깃)에 바인딩 등록
+        - Runtime.bindingCalled는 Runtime.enable 없이도 전달됨
+        - 콘솔 대체 채널(Runtime.consoleAPICalled)은 CDP 클라이언트가 runtime_enable일 때만 활성화
+
+        Args:
+            session_id (str, optional): CDP 세션 (게임 프레임이 OOPIF면 iframe 타깃 세션, 없으면 현재 창)
+        """
+        cdp = self.listener_source
+        session_id = session_id or self.devtools.get_cdp_session()
+        if getattr(cdp, 'runtime_enable', False):
+            cdp.run(cdp.send("Runtime.enable", {}, session_id))
+        cdp.run(cdp.send("Runtime.addBinding", {"name": BINDING_NAME}, session_id))
+
+    def install_observer(self, frame=None):
+        """
+        게임 iframe에 MutationObserver 설치 (방 입장마다 한 번)
+        frame이 없으면 드라이버가 게임 iframe으로 전환되어 있어야 합니다.
+
+        Args:
+            frame (FrameContext, optional): 게임 프레임의 기본 world 컨텍스트 (있으면 CDP로 직접 설치)
+
+        Returns:
+            bool: 설치 성공 여부
+        """
+        if not self.register_listeners():
+            return False
+
+        # 격리 world에서는 페이지 바인딩이 보이지 않으므로 기본 world 컨텍스트만 사용
+        use_frame = frame is not None and not frame.isolated
+
+        driver = self.devtools.driver
+        try:
+            # 바인딩과 콘솔 이벤트는 현재 창(타깃)에 등록해야 하므로 방마다 다시 호출
+            self._enable_binding(frame.session_id if use_frame else None)
+        except Exception as e:
+            self.logger.warning(f"결과 푸시 바인딩 등록 실패 (콘솔 채널만 사용): {e}")
+
+        try:
+            if use_frame:
+                installed = bool(self.devtools.game_frame_execute(BEAD_ROAD_OBSERVER_SCRIPT, BINDING_NAME))
+            else:
+                installed = bool(driver.execute_script(BEAD_ROAD_OBSERVER_SCRIPT, BINDING_NAME))
+        except Exception as e:
+            self.logger.warning(f"MutationObserver 설치 실패: {e}")
+            return False
+
+        if installed:
+            self.last_count = None
+            self.logger.info("Bead-road MutationObserver 설치 완료")
+        return installed
+
+    def _on_binding_called(self, message):
+        """Runtime.bindingCalled 이벤트 처리 (CDP 이벤트 스레드에서 호출)"""
+        params = message.get("params", {})
+        if params.get("name") == BINDING_NAME:
+            self._publish(params.get("payload", ""))
+
+    def _on_console_called(self, message):
+        """Runtime.consoleAPICalled 이벤트 처리 (바인딩 대체 채널)"""
+        args = message.get("params", {}).get("args", [])
+        if not args:
+            return
+        value = args[0].get("value")
+        prefix = BINDING_NAME + ":"
+        if isinstance(value, str) and value.startswith(prefix):
+            self._publish(value[len(prefix):])
+
+    def _publish(self, payload):
+        """'셀 개수|x,y,R' payload를 해석하여 신호 발생"""
+        try:
+            count_text, _, cell = payload.partition("|")
+            count = int(count_text)
+            result = cell.split(",")[2] if cell else None
+        except (ValueError, IndexError) as e:
+            self.logger.warning(f"결과 푸시 payload 해석 실패 ({payload}): {e}")
+            return
+
+        if count == self.last_count:
+            return
+
+        self.last_count = count
+        self.last_push_time = time.time()
+        self.last_push_perf = time.perf_counter()
+        self.result_pushed.emit(count, result)
@@ -1,8 +1,8 @@
 from PyQt6.QtCore import QThread, pyqtSignal
 from PyQt6.QtWidgets import QMessageBox
 
-import time
 import re
+from utils.wait_engine import wait_until, document_ready
 
 def clean_text(text):
     """숨겨진 특수 문자 제거"""
@@ -41,7 +41,7 @@ class RoomLoaderThread(QThread):
         try:
             self.progress_signal.emit("방 목록을 불러오는 중...", 0)
             self.devtools.driver.switch_to.default_content()
-            time.sleep(1)
+            wait_until(document_ready(self.devtools.driver), timeout=3, label="room_list_ready")
 
             # iframe 존재 여부 확인 후 전환
             iframes = self.devtools.driver.find_elements("css selector", "iframe")
@@ -49,7 +49,7 @@ class RoomLoaderThread(QThread):
                 self.progress_signal.emit("iframe 전환 중...", 0)
                 try:
                     self.devtools.driver.switch_to.frame(iframes[0])
-                    time.sleep(1)
+                    wait_until(document_ready(self.devtools.driver), timeout=3, label="room_list_iframe_ready")
                 except:
                     self.devtools.driver.switch_to.default_content()
             
@@ -107,7 +107,11 @@ class RoomLoaderThread(QThread):
                 
                 # 스크롤 다운 - 여러 방법 시도
                 self._scroll_down_enhanced(scroll_container)
-                time.sleep(0.2)  # 로딩 대기 시간
+                # 추가 방이 로드되어 높이가 늘어나면 바로 진행 (끝에 도달했으면 짧게만 대기)
+                wait_until(
+                    lambda: self.devtools.driver.execute_script("return arguments[0].scrollHeight", scroll_container) > last_height,
+                    timeout=0.5, interval=0.05, label="room_list_scroll", log_timeout=False
+                )
                 
                 # 새 높이 확인
                 new_height = self.devtools.driver.execute_script("return arguments[0].scrollHeight", scroll_container)
@@ -160,6 +164,9 @@ class RoomLoaderThread(QThread):
         """스피드 필터 적용"""
         self.progress_signal.emit("스피드 필터 적용 중...", 0)
         
+        # 필터 적용 전 방 목록 상태 (적용되면 목록이 바뀜)
+        before = self._tile_signature()
+        
         try:
             # 방법 1: 제공된 정확한 선택자 사용
             try:
@@ -172,7 +179,7 @@ class RoomLoaderThread(QThread):
                     # 부모 요소인 label 찾아서 클릭
                     parent_label = self.devtools.driver.find_element("css selector", "label[for='speed']")
                     parent_label.click()
-                    time.sleep(1)  # 필터 적용 대기
+                    self._wait_filter_applied(before)  # 필터 적용 대기
                     self.progress_signal.emit("스피드 필터 적용 완료", 0)
                     return
             except Exception as e:
@@ -200,7 +207,7 @@ class RoomLoaderThread(QThread):
                                 # 직접 클릭
                                 element.click()
                         
-                        time.sleep(1)  # 필터 적용 대기
+                        self._wait_filter_applied(before)  # 필터 적용 대기
                         self.progress_signal.emit("스피드 필터 적용 완료", 0)
                         return
             except Exception as e:
@@ -224,7 +231,7 @@ class RoomLoaderThread(QThread):
                                 # 직접 클릭
                                 elem.click()
                             
-                            time.sleep(1)  # 필터 적용 대기
+                            self._wait_filter_applied(before)  # 필터 적용 대기
                             self.progress_signal.emit("스피드 필터 적용 완료", 0)
                             return
                         except:
@@ -240,7 +247,7 @@ class RoomLoaderThread(QThread):
                     if "스피드" in text and "슈퍼 스피드" not in text:
                         self.progress_signal.emit(f"일반 요소에서 스피드 필터 발견: '{item.text}'", 0)
                         item.click()
-                        time.sleep(1)  # 필터 적용 대기
+                        self._wait_filter_applied(before)  # 필터 적용 대기
                         return
                 except:
                     continue
@@ -251,6 +258,27 @@ class RoomLoaderThread(QThread):
         # 모든 방법 실패 시
         self.progress_signal.emit("스피드 필터를 찾지 못했습니다. 전체 방 목록을 가져옵니다.", 0)
         
+    # 방 목록 타일 선택자 (필터 적용 감지용)
+    TILE_SELECTORS = ".tile--5d2e6, .game-tile, [data-role='game-tile'], div.lobby-table__game, div[data-game-id]"
+
+    def _tile_signature(self):
+        """방 목록 상태 (타일 개수와 첫 타일 텍스트) - 필터 적용 여부 확인용"""
+        try:
+            return self.devtools.driver.execute_script(
+                "var tiles = document.querySelectorAll(arguments[0]);"
+                "return tiles.length + '|' + (tiles.length ? tiles[0].textContent.trim().slice(0, 50) : '');",
+                self.TILE_SELECTORS
+            )
+        except Exception:
+            return None
+
+    def _wait_filter_applied(self, before, timeout=2.0):
+        """방 목록이 바뀔 때까지 대기 (필터 적용 완료)"""
+        wait_until(
+            lambda: self._tile_signature() not in (None, before),
+            timeout=timeout, label="room_filter"
+        )
+
     def _find_scroll_container(self):
         """스크롤 컨테이너 찾기 최적화"""
         # 여러 가능한 스크롤 컨테이너 선택자
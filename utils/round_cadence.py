@@ -0,0 +1,209 @@
+# utils/round_cadence.py
+"""
+게임 결과 주기 추정 및 적응형 폴링 간격
+- 새 결과가 나온 시각 간격을 지수 이동 평균(평균, 분산)으로 추정
+- 다음 결과가 나올 것으로 예상되는 구간에서는 짧은 간격(~0.25초)으로 폴링하고,
+  베팅/딜링 중처럼 결과가 나오지 않을 구간에서는 구간 시작 직전까지 길게 대기
+- 주기를 아직 모르거나 예상보다 오래 결과가 없으면(셔플, 대기) 기본 간격 사용
+- 방(기본 이름)별 주기와 마지막 결과 시각(위상)을 round_cadence.json에 저장하여
+  다시 입장했을 때 첫 결과부터 예상 구간에 맞춰 폴링 (RoundCadenceStore)
+"""
+import json
+import math
+import os
+import sys
+import threading
+import time
+
+
+def get_round_cadence_file_path():
+    """실행 환경에 따라 적절한 round_cadence.json 파일 경로 반환"""
+    if getattr(sys, 'frozen', False):
+        # PyInstaller로 빌드된 실행 파일인 경우
+        base_dir = os.path.dirname(sys.executable)
+        return os.path.join(base_dir, 'round_cadence.json')
+    else:
+        # 일반 Python 스크립트로 실행되는 경우
+        return 'round_cadence.json'
+
+
+class RoundCadence:
+    """결과 간격 추정기"""
+
+    ALPHA = 0.2  # 이동 평균 가중치
+    MIN_INTERVAL = 3.0  # 초 (이보다 짧은 간격은 중복 감지로 보고 무시)
+    MAX_INTERVAL = 120.0  # 초 (이보다 긴 간격은 셔플/대기로 보고 무시)
+    MIN_MARGIN = 1.0  # 초 (예상 구간 최소 반폭)
+    MAX_PHASE_PERIODS = 8  # 저장된 위상으로 예상 구간을 이어서 계산할 최대 주기 수
+
+    def __init__(self, mean=None, variance=0.0, samples=0, last_result_time=None):
+        """
+        Args:
+            mean (float, optional): 이전에 추정한 평균 간격 (초)
+            variance (float): 이전에 추정한 분산
+            samples (int): 이전 추정에 사용한 간격 수
+            last_result_time (float, optional): 이전에 본 마지막 결과 시각 (time.time(), 위상)
+        """
+        self.mean = mean
+        self.variance = variance
+        self.samples = samples
+        self.last_result_time = last_result_time
+        # 저장된 위상으로 시작 (입장 후 아직 결과를 보지 못함 - 놓친 결과가 있다고 보고 주기를 이어서 계산)
+        self.warm = last_result_time is not None
+
+    def record_result(self, timestamp=None):
+        """새 결과 감지 시각 기록"""
+        now = time.time() if timestamp is None else timestamp
+        if self.warm:
+            # 방 밖에 있던 동안의 간격은 주기 추정에 사용하지 않음
+            self.warm = False
+            self.last_result_time = now
+            return
+        if self.last_result_time is not None:
+            interval = now - self.last_result_time
+            if interval < self.MIN_INTERVAL:
+                return
+            if interval <= self.MAX_INTERVAL:
+                self._add_interval(interval)
+        self.last_result_time = now
+
+    def _add_interval(self, interval):
+        if self.mean is None:
+            self.mean = interval
+            self.variance = 0.0
+        else:
+            delta = interval - self.mean
+            self.mean += self.ALPHA * delta
+            self.variance = (1 - self.ALPHA) * (self.variance + self.ALPHA * delta * delta)
+        self.samples += 1
+
+    def reset_timing(self):
+        """마지막 결과 시각만 초기화 (추정한 주기는 유지)"""
+        self.last_result_time = None
+        self.warm = False
+
+    def expected_window(self):
+        """
+        다음 결과가 나올 것으로 예상되는 구간 (마지막 결과 기준 경과 초)
+
+        Returns:
+            tuple: (시작, 끝) 또는 None (주기를 모르는 경우)
+        """
+        if self.mean is None or self.last_result_time is None:
+            return None
+        margin = max(self.MIN_MARGIN, 1.5 * math.sqrt(self.variance))
+        return self.mean - margin, self.mean + margin
+
+    def poll_interval(self, fast, slow, default, now=None):
+        """
+        다음 폴링까지의 대기 시간 (초)
+
+        Args:
+            fast (float): 결과 예상 구간 안에서의 간격
+            slow (float): 예상 구간 전 최대 대기 간격
+            default (float): 주기를 모르거나 예상 구간을 지난 경우의 간격
+        """
+        window = self.expected_window()
+        if window is None:
+            return default
+
+        elapsed = (time.time() if now is None else now) - self.last_result_time
+        start, end = window
+        if self.warm and elapsed > end:
+            # 재입장 직후: 저장된 위상에서 주기만큼 이동한 다음 예상 구간 사용
+            if elapsed > self.MAX_PHASE_PERIODS * self.mean:
+                return default
+            elapsed -= math.floor((elapsed - start) / self.mean) * self.mean
+            if elapsed > end:
+                return max(fast, min(slow, start + self.mean - elapsed))
+        if elapsed < start:
+            # 구간 시작 직전에 깨어나도록 대기 (너무 짧게 쪼개지지 않도록 fast 이상)
+            return max(fast, min(slow, start - elapsed))
+        if elapsed <= end:
+            return fast
+        return default
+
+    def to_dict(self):
+        return {
+            "mean": self.mean,
+            "variance": self.variance,
+            "samples": self.samples,
+            "last_result_time": self.last_result_time,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            mean=data.get("mean"),
+            variance=data.get("variance", 0.0),
+            samples=data.get("samples", 0),
+            last_result_time=data.get("last_result_time"),
+        )
+
+
+class RoundCadenceStore:
+    """방 기본 이름별 결과 주기 저장소"""
+
+    SAVE_INTERVAL = 30.0  # 초 (변경 후 디스크 저장 최소 간격)
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str, optional): 저장 파일 경로 (없으면 get_round_cadence_file_path())
+        """
+        self.path = path or get_round_cadence_file_path()
+        self._rooms = {}  # 방 기본 이름 -> RoundCadence
+        self._lock = threading.Lock()
+        self._last_save = 0.0
+        self.load()
+
+    @staticmethod
+    def room_key(room_name):
+        from utils.room_loader import extract_room_base_name
+        return extract_room_base_name(room_name or "")
+
+    def for_room(self, room_name):
+        """방의 주기 추정기 (없으면 새로 만듦 - 같은 객체에 계속 기록)"""
+        key = self.room_key(room_name)
+        with self._lock:
+            cadence = self._rooms.get(key)
+            if cadence is None:
+                cadence = self._rooms[key] = RoundCadence()
+            elif cadence.last_result_time is not None:
+                # 다시 입장: 저장된 위상으로 시작
+                cadence.warm = True
+            return cadence
+
+    def load(self):
+        """디스크에서 읽기 (없거나 손상되었으면 빈 저장소)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            self._rooms = {key: RoundCadence.from_dict(value) for key, value in data.items()}
+        except FileNotFoundError:
+            self._rooms = {}
+        except Exception as e:
+            print(f"[WARNING] 결과 주기 기록 '{self.path}' 읽기 오류: {e}")
+            self._rooms = {}
+
+    def save(self, force=False):
+        """저장 (force가 아니면 SAVE_INTERVAL마다)"""
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_save < self.SAVE_INTERVAL:
+                return False
+            payload = json.dumps(
+                {key: cadence.to_dict() for key, cadence in self._rooms.items() if cadence.mean is not None},
+                ensure_ascii=False, indent=2,
+            )
+            self._last_save = now
+
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                file.write(payload)
+            os.replace(temp_path, self.path)
+            return True
+        except Exception as e:
+            print(f"[WARNING] 결과 주기 기록 '{self.path}' 저장 오류: {e}")
+            return False
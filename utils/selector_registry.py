@@ -0,0 +1,220 @@
+# utils/selector_registry.py
+"""
+사이트별 선택자(요소 찾기 방법) 성공 기록
+- 베팅 영역, 칩, 베팅 금액, 잔액, 검색 입력창처럼 후보 목록을 순서대로 시도하는 곳에서 사용
+- 사이트(settings.json의 site1/site2/site3)와 페이지 종류별로 후보마다 성공/실패 횟수를 기록
+- 마지막으로 성공한 후보를 먼저, 그 다음은 성공률 순으로 시도 (기록이 없으면 원래 순서)
+- 기록은 selector_registry.json에 저장하여 재시작 후에도 검증된 순서로 시작
+"""
+import json
+import os
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+
+def get_selector_registry_file_path():
+    """실행 환경에 따라 적절한 selector_registry.json 파일 경로 반환"""
+    if getattr(sys, 'frozen', False):
+        # PyInstaller로 빌드된 실행 파일인 경우
+        base_dir = os.path.dirname(sys.executable)
+        return os.path.join(base_dir, 'selector_registry.json')
+    else:
+        # 일반 Python 스크립트로 실행되는 경우
+        return 'selector_registry.json'
+
+
+def _host(url):
+    """URL의 호스트 (스킴이 없어도 처리)"""
+    if not url:
+        return ""
+    if "://" not in url:
+        url = "https://" + url
+    return urlparse(url).netloc.lower()
+
+
+class SelectorRegistry:
+    """사이트/페이지 종류별 선택자 성공 기록"""
+
+    DEFAULT_SITE = "default"
+    SAVE_INTERVAL = 30.0  # 초 (기록 변경 후 디스크 저장 최소 간격)
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str, optional): 기록 파일 경로 (없으면 get_selector_registry_file_path())
+        """
+        self.path = path or get_selector_registry_file_path()
+        self.site = self.DEFAULT_SITE
+
+        # 사이트 -> 페이지 종류 -> {'last': 후보, 'stats': {후보: [성공, 실패]}}
+        self._data = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = 0.0
+
+        self.load()
+
+    # ------------------------------------------------------------------
+    # 사이트
+    # ------------------------------------------------------------------
+    def set_site(self, url):
+        """
+        현재 사이트 설정 (사이트 열기 시 호출)
+        settings.json의 site1/site2/site3 중 호스트가 같은 항목 이름을 사용하고, 없으면 호스트 이름 사용
+        """
+        self.site = self.site_key(url)
+        return self.site
+
+    @classmethod
+    def site_key(cls, url):
+        host = _host(url)
+        if not host:
+            return cls.DEFAULT_SITE
+        try:
+            from utils.settings_manager import SettingsManager
+            for index, site_url in enumerate(SettingsManager().get_sites(), start=1):
+                if site_url and _host(site_url) == host:
+                    return f"site{index}"
+        except Exception:
+            pass
+        return host
+
+    # ------------------------------------------------------------------
+    # 순서 / 기록
+    # ------------------------------------------------------------------
+    def _entry(self, page_type, site=None, create=False):
+        site_entries = self._data.get(site or self.site)
+        if site_entries is None:
+            if not create:
+                return None
+            site_entries = self._data.setdefault(site or self.site, {})
+        entry = site_entries.get(page_type)
+        if entry is None and create:
+            entry = site_entries.setdefault(page_type, {"last": None, "stats": {}})
+        return entry
+
+    def order(self, page_type, candidates, key=None, site=None):
+        """
+        후보를 시도할 순서로 정렬
+
+        Args:
+            page_type (str): 페이지/요소 종류 (예: 'bet_area_P', 'chip', 'lobby_balance')
+            candidates (list): 후보 목록 (원래 우선순위 순)
+            key (callable, optional): 후보를 기록용 문자열로 바꾸는 함수 (기본: 후보 자체)
+            site (str, optional): 사이트 (기본: 현재 사이트)
+
+        Returns:
+            list: 정렬된 후보 목록 (마지막 성공 → 성공률 → 원래 순서)
+        """
+        key = key or (lambda candidate: candidate)
+        with self._lock:
+            entry = self._entry(page_type, site)
+            if not entry:
+                return list(candidates)
+            last = entry["last"]
+            stats = entry["stats"]
+
+            def rank(item):
+                index, candidate = item
+                name = key(candidate)
+                hits, misses = stats.get(name, (0, 0))
+                return (name != last, -(hits / (hits + misses + 1)), index)
+
+            return [candidate for _, candidate in sorted(enumerate(candidates), key=rank)]
+
+    def record(self, page_type, candidate, success, site=None):
+        """후보 1개의 성공/실패 기록"""
+        with self._lock:
+            entry = self._entry(page_type, site, create=True)
+            counts = entry["stats"].setdefault(candidate, [0, 0])
+            counts[0 if success else 1] += 1
+            if success:
+                entry["last"] = candidate
+            elif entry["last"] == candidate:
+                entry["last"] = None
+            self._dirty = True
+        self.save()
+
+    def record_hit(self, page_type, candidate, site=None):
+        self.record(page_type, candidate, True, site)
+
+    def record_miss(self, page_type, candidate, site=None):
+        self.record(page_type, candidate, False, site)
+
+    def find(self, page_type, candidates, attempt, key=None, site=None):
+        """
+        기록된 순서로 후보를 시도하여 처음 성공한 결과 반환
+
+        Args:
+            page_type (str): 페이지/요소 종류
+            candidates (list): 후보 목록
+            attempt (callable): 후보를 받아 결과(실패 시 None/False)를 반환하는 함수 (예외는 실패로 간주)
+            key (callable, optional): 후보를 기록용 문자열로 바꾸는 함수
+
+        Returns:
+            tuple: (성공한 후보, 결과) 또는 (None, None)
+        """
+        key = key or (lambda candidate: candidate)
+        for candidate in self.order(page_type, candidates, key, site):
+            try:
+                result = attempt(candidate)
+            except Exception:
+                result = None
+            if result:
+                self.record_hit(page_type, key(candidate), site)
+                return candidate, result
+            self.record_miss(page_type, key(candidate), site)
+        return None, None
+
+    # ------------------------------------------------------------------
+    # 저장 / 통계
+    # ------------------------------------------------------------------
+    def load(self):
+        """디스크에서 기록 읽기 (없거나 손상되었으면 빈 기록)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            self._data = data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            self._data = {}
+        except Exception as e:
+            print(f"[WARNING] 선택자 기록 '{self.path}' 읽기 오류: {e}")
+            self._data = {}
+
+    def save(self, force=False):
+        """기록 저장 (변경이 있을 때만, force가 아니면 SAVE_INTERVAL마다)"""
+        now = time.monotonic()
+        with self._lock:
+            if not self._dirty or (not force and now - self._last_save < self.SAVE_INTERVAL):
+                return False
+            payload = json.dumps(self._data, ensure_ascii=False, indent=2)
+            self._dirty = False
+            self._last_save = now
+
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                file.write(payload)
+            os.replace(temp_path, self.path)
+            return True
+        except Exception as e:
+            print(f"[WARNING] 선택자 기록 '{self.path}' 저장 오류: {e}")
+            with self._lock:
+                self._dirty = True
+            return False
+
+    def stats(self, site=None):
+        """
+        현재 사이트의 페이지 종류별 기록
+
+        Returns:
+            dict: {페이지 종류: {'last': 후보, 'stats': {후보: [성공, 실패]}}}
+        """
+        with self._lock:
+            return json.loads(json.dumps(self._data.get(site or self.site, {})))
+
+
+# 서비스 간 공유하는 선택자 기록 (사이트 열기 시 set_site로 사이트 지정)
+selector_registry = SelectorRegistry()
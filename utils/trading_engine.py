@@ -0,0 +1,141 @@
+# utils/trading_engine.py
+"""
+asyncio 기반 자동 매매 엔진
+- GUI 스레드의 asyncio 루프(utils/async_bridge)에서 코루틴으로 실행
+- 모니터링: 게임 분석 → 결과 처리 → 결과 주기에 맞춘 대기 (푸시/WebSocket 결과는 wake()로 대기 즉시 종료)
+- 베팅/방 이동: 브라우저 명령(BrowserExecutor)을 await하는 코루틴 - 진행 중에는 모니터링이 다음 분석을 기다림
+- stop(): 모든 코루틴을 취소 (대기 중인 브라우저 명령도 취소, 실행 중인 명령의 결과는 버림)
+"""
+import asyncio
+import logging
+
+from utils.async_bridge import get_event_loop
+
+# 진행 중인 작업 종류
+ACTION_BET = "bet"
+ACTION_ROOM_CHANGE = "room_change"
+
+
+class TradingEngine:
+    """모니터링/베팅/방 이동 코루틴 실행 및 취소"""
+
+    def __init__(self, trading_manager, logger=None):
+        self.tm = trading_manager
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._monitor_task = None
+        self._action_task = None
+        self._action = None
+        self._wake = asyncio.Event()
+        self._scheduled = None  # schedule_analysis()로 예약한 깨우기 (loop.call_later 핸들)
+
+    @property
+    def is_running(self):
+        return self._monitor_task is not None and not self._monitor_task.done()
+
+    @property
+    def pending_action(self):
+        """진행 중인 베팅/방 이동 (ACTION_*) 또는 None"""
+        if self._action_task is None or self._action_task.done():
+            return None
+        return self._action
+
+    def start(self):
+        """모니터링 시작 (바로 첫 분석)"""
+        if self.is_running:
+            return
+        self._wake.clear()
+        self._monitor_task = get_event_loop().create_task(self._monitor())
+
+    def stop(self):
+        """
+        모니터링과 진행 중인 베팅/방 이동 취소
+
+        Returns:
+            int: 취소한 코루틴 수
+        """
+        tasks = [task for task in (self._monitor_task, self._action_task) if task is not None and not task.done()]
+        for task in tasks:
+            task.cancel()
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+            self._scheduled = None
+        self._monitor_task = None
+        self._action_task = None
+        self._action = None
+        return len(tasks)
+
+    def wake(self):
+        """대기 중인 모니터링을 깨워 바로 분석 (분석 중이면 끝난 직후 다시 분석)"""
+        self._wake.set()
+
+    def schedule_analysis(self, seconds):
+        """seconds 후 분석 (현재 대기가 더 길면 앞당김)"""
+        if seconds <= 0:
+            self.wake()
+            return
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+        self._scheduled = get_event_loop().call_later(seconds, self.wake)
+
+    def run_action(self, action, coro):
+        """
+        베팅/방 이동 코루틴 실행
+
+        Args:
+            action (str): ACTION_*
+            coro: 실행할 코루틴
+
+        Returns:
+            bool: 실행 여부 (다른 작업이 진행 중이면 실행하지 않음)
+        """
+        if self.pending_action:
+            coro.close()
+            return False
+        self._action = action
+        self._action_task = get_event_loop().create_task(coro)
+        self._action_task.add_done_callback(self._action_finished)
+        return True
+
+    def _action_finished(self, task):
+        if task is self._action_task:
+            self._action_task = None
+            self._action = None
+        if not task.cancelled() and task.exception() is not None:
+            error = task.exception()
+            self.logger.error(f"매매 작업 오류: {error}", exc_info=(type(error), error, error.__traceback__))
+
+    async def browser(self, kind, func, *args, **kwargs):
+        """브라우저 스레드에서 func 실행 후 결과 반환 (취소되면 대기 중인 명령도 취소)"""
+        future = self.tm.browser_executor.submit(kind, func, *args, **kwargs)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+    async def _monitor(self):
+        """게임 분석 루프"""
+        while True:
+            # 베팅/방 이동이 끝난 뒤에 분석
+            if self._action_task is not None and not self._action_task.done():
+                await asyncio.wait([self._action_task])
+                continue
+
+            try:
+                await self.tm.analyze_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"게임 분석 오류: {e}", exc_info=True)
+
+            await self._sleep(self.tm.get_poll_interval())
+
+    async def _sleep(self, seconds):
+        """seconds 동안 대기 (wake()로 바로 깨어남)"""
+        if not self._wake.is_set():
+            try:
+                await asyncio.wait_for(self._wake.wait(), seconds)
+            except asyncio.TimeoutError:
+                pass
+        self._wake.clear()
@@ -1,7 +1,7 @@
 # utils/trading_manager.py
-import time
 import logging
 import os
+import time
 from PyQt6.QtWidgets import QMessageBox
 from services.room_entry_service import RoomEntryService
 from services.excel_trading_service import ExcelTradingService
@@ -12,9 +12,24 @@ from services.martin_service import MartinBettingService
 from utils.settings_manager import SettingsManager
 from utils.trading_manager_helpers import TradingManagerHelpers
 from utils.analysis_thread import GameAnalysisThread
+from utils.browser_executor import CMD_ANALYZE, CMD_CHANGE_ROOM
+from utils.trading_engine import TradingEngine, ACTION_BET, ACTION_ROOM_CHANGE
+from utils.async_bridge import defer_dialog
+from utils.result_push_channel import ResultPushChannel
+from utils.ws_frame_ingest import WebSocketFrameIngest, ROUND_RESULT, BALANCE, BETTING_OPEN, BETTING_CLOSED
+from utils.parse_cache import ParseCache
+from utils.element_cache import ElementCache
+from utils.round_cadence import RoundCadence, RoundCadenceStore
 from PyQt6.QtWidgets import QApplication  # 추가된 import
 
 class TradingManager:
+    POLL_INTERVAL = 2  # 기본 게임 분석 주기 (초)
+    FAST_POLL_INTERVAL = 0.25  # 결과가 나올 것으로 예상되는 구간의 분석 주기 (초)
+    SLOW_POLL_INTERVAL = 5  # 베팅/딜링 중 예상 구간 전까지 최대 대기 (초)
+    PUSH_WATCHDOG_INTERVAL = 5  # 결과 푸시 채널 동작 중 워치독 폴링 주기 (초)
+    DEFAULT_ROUND_PERIOD = 60  # 결과 주기를 아직 모를 때 푸시를 기다리는 최대 시간 (초)
+    USE_WS_INGEST = False  # 게임 WebSocket 프레임 수신 (사이트 프로토콜에 맞는 디코더가 있을 때 켬)
+
     # utils/trading_manager.py의 __init__ 메서드 수정 부분
     def __init__(self, main_window, logger=None):
         """TradingManager 초기화"""
@@ -36,11 +51,32 @@ class TradingManager:
         self.current_pick = None
         self.processed_rounds = set()
 
+        # 서비스 간 공유하는 틱 단위 파싱 캐시 (같은 프레임을 여러 번 가져오고 파싱하지 않도록)
+        self.parse_cache = ParseCache()
+        # 방 단위 요소 핸들 캐시 (베팅 영역, 칩, 종료 버튼 - 방 입장 시 찾고 방 이동 시 비움)
+        self.element_cache = ElementCache()
+
         # 서비스 클래스 초기화
         self._init_services()
         
-        self.recent_game_results = []  # 최근 게임 결과 (P, B, T 포함)
-        self.filtered_game_results = []  # 최근 게임 결과 (P, B만 포함)
+        # 결과 푸시 채널 (MutationObserver) - 새 결과 즉시 분석, 폴링은 워치독으로만 사용
+        self.result_push_channel = ResultPushChannel(self.devtools, self.logger)
+        self.result_push_channel.result_pushed.connect(self._handle_result_pushed)
+        if hasattr(self, 'game_monitoring_service'):
+            self.game_monitoring_service.push_channel = self.result_push_channel
+        
+        # 상주 게임 분석 스레드 (브라우저 명령 큐)
+        self._analysis_thread = self._create_analysis_thread()
+        # 모니터링/베팅/방 이동 코루틴 (GUI 스레드의 asyncio 루프)
+        self.engine = TradingEngine(self, self.logger)
+        # 결과 간격 추정 (적응형 분석 주기) - 방 입장 시 방별 저장소의 추정기로 교체
+        self.cadence_store = RoundCadenceStore()
+        self.round_cadence = RoundCadence()
+        self.last_push_time = 0  # 현재 방에서 마지막으로 결과 푸시(MutationObserver/WebSocket)를 받은 시각
+        
+        # 게임 WebSocket 프레임 수신 (USE_WS_INGEST일 때 방 입장마다 연결)
+        self.ws_ingest = WebSocketFrameIngest(logger=self.logger)
+        self.ws_ingest.event_received.connect(self._handle_ws_event)
     
         # 헬퍼 클래스들 초기화 - 모듈 임포트
         from utils.trading_manager_helpers import TradingManagerHelpers
@@ -57,19 +93,23 @@ class TradingManager:
             self.betting_service = BettingService(
                 devtools=self.devtools,
                 main_window=self.main_window,
-                logger=self.logger
+                logger=self.logger,
+                element_cache=self.element_cache
             )
             
             self.game_monitoring_service = GameMonitoringService(
                 devtools=self.devtools,
                 main_window=self.main_window,
-                logger=self.logger
+                logger=self.logger,
+                parse_cache=self.parse_cache,
+                element_cache=self.element_cache
             )
             
             self.balance_service = BalanceService(
                 devtools=self.devtools,
                 main_window=self.main_window,
-                logger=self.logger
+                logger=self.logger,
+                parse_cache=self.parse_cache
             )
             
             self.room_entry_service = RoomEntryService(
@@ -168,7 +208,7 @@ class TradingManager:
             
     # 2. 클래스 내에 새로운 analyze_current_game 메서드 추가 (기존 메서드 대체)
     def analyze_current_game(self):
-        """현재 게임 상태를 분석하여 게임 수와 결과를 확인 (멀티스레드 구현 - 동기화 문제 수정)"""
+        """현재 게임 상태 즉시 분석 요청 (모니터링 코루틴이 분석 - 분석 중이면 끝난 직후 다시 분석)"""
         try:
                     # 중지 플래그 확인 (가장 먼저 확인)
             if hasattr(self, 'stop_all_processes') and self.stop_all_processes:
@@ -185,30 +225,36 @@ class TradingManager:
                 self.logger.info("자동 매매가 비활성화되어 게임 분석을 시작하지 않습니다.")
                 return
 
-            # 이미 실행 중인 분석 스레드가 있는지 확인
-            if hasattr(self, '_analysis_thread') and self._analysis_thread.isRunning():
-                self.logger.info("이전 분석 스레드가 아직 실행 중입니다.")
-                return
-                
-            # 분석 스레드 생성
-            self._analysis_thread = GameAnalysisThread(self)
-            
-            # 신호 연결
-            self._analysis_thread.analysis_complete.connect(self._handle_analysis_result)
-            self._analysis_thread.analysis_error.connect(self._handle_analysis_error)
-            self._analysis_thread.room_change_needed.connect(self._handle_room_change)
-            
-            # 스레드 시작
-            # self.logger.info("게임 분석 스레드 시작")
-            self._analysis_thread.start()
-            # 중지 버튼 활성화 (스레드 시작 후)
-            # self.main_window.stop_button.setEnabled(True)
+            # 모니터링 코루틴을 깨워 바로 분석 (베팅/방 이동 중이면 끝난 뒤 분석)
+            self.engine.wake()
             self.main_window.update_button_styles()
-            # self.logger.info("게임 분석 스레드 시작 후 중지 버튼 활성화")
         
         except Exception as e:
-            self.logger.error(f"게임 분석 스레드 시작 오류: {e}", exc_info=True)
-            self.main_window.set_remaining_time(0, 0, 2)
+            self.logger.error(f"게임 분석 요청 오류: {e}", exc_info=True)
+
+    async def analyze_once(self):
+        """게임 상태 분석 1회 (모니터링 코루틴에서 호출)"""
+        result = await self.engine.browser(CMD_ANALYZE, self._analysis_thread._analyze)
+        if not result:
+            return
+        if result.get('room_change_needed'):
+            self._handle_room_change()
+            return
+        self._handle_analysis_result(result)
+
+    @property
+    def pending_action(self):
+        """진행 중인 베팅/방 이동 (ACTION_*) 또는 None"""
+        return self.engine.pending_action
+
+    @property
+    def browser_executor(self):
+        """브라우저 명령 스레드 (분석 스레드가 겸함 - WebDriver/CDP 작업은 모두 이 스레드에서 순서대로 실행)"""
+        return self._analysis_thread
+
+    def _create_analysis_thread(self):
+        """상주 분석 스레드 생성"""
+        return GameAnalysisThread(self)
 
     def _handle_analysis_result(self, result):
         """분석 결과 처리 핸들러"""
@@ -279,20 +325,57 @@ class TradingManager:
 
         except Exception as e:
             self.logger.error(f"분석 결과 처리 오류: {e}", exc_info=True)
-        finally:
-            if self.is_trading_active:
-                if hasattr(self.balance_service, '_target_amount_reached') and self.balance_service._target_amount_reached:
-                    self.logger.info("목표 금액 도달 확인됨: 다음 분석을 예약하지 않습니다.")
-                    return
-                        
-                self.main_window.set_remaining_time(0, 0, 2)
-            else:
-                self.logger.info("자동 매매 비활성화됨: 다음 분석을 예약하지 않습니다.")
-                
-    def _handle_analysis_error(self, error_msg):
-        """분석 오류 처리 핸들러"""
-        self.logger.error(f"분석 스레드 오류: {error_msg}")
-        self.main_window.set_remaining_time(0, 0, 2)  # 다음 시도 스케줄링
+
+    def get_poll_interval(self):
+        """
+        다음 게임 분석까지의 대기 시간 (초)
+        - 현재 방에서 푸시를 실제로 받고 있으면 워치독 주기
+        - 아니면 결과 주기에 맞춰 결과 예상 구간에서는 짧게, 베팅/딜링 중에는 길게
+        """
+        if self.is_push_alive():
+            return self.PUSH_WATCHDOG_INTERVAL
+        return self.round_cadence.poll_interval(self.FAST_POLL_INTERVAL, self.SLOW_POLL_INTERVAL, self.POLL_INTERVAL)
+
+    def is_push_alive(self):
+        """
+        결과 푸시가 동작 중인지 여부
+        - 채널이 설치되어 있어도 현재 방에서 푸시를 받은 적이 없으면 False (바인딩 실패/리스너 미수신)
+        - 결과 한 주기 안에 다음 푸시가 오지 않으면 False (폴링 주기로 복귀)
+        """
+        if not self.last_push_time:
+            return False
+        push_installed = self.result_push_channel.is_active and self.game_monitoring_service.push_observer_installed
+        if not push_installed and not self.ws_ingest.is_attached:
+            return False
+        period = self.round_cadence.mean or self.DEFAULT_ROUND_PERIOD
+        return time.time() - self.last_push_time <= period
+
+    def _handle_result_pushed(self, cell_count, latest_result):
+        """MutationObserver 푸시 수신 핸들러 - 폴링을 기다리지 않고 즉시 분석"""
+        if getattr(self, 'stop_all_processes', False) or not self.is_trading_active:
+            return
+            
+        self.last_push_time = time.time()
+        self.logger.info(f"[푸시] 새 결과 감지: {cell_count}번째 게임, 결과: {latest_result}")
+        self._request_analysis()
+
+    def _request_analysis(self):
+        """즉시 분석 요청 (분석 중이면 끝난 직후 다시 분석)"""
+        self.engine.wake()
+
+    def _handle_ws_event(self, event):
+        """WebSocket 게임 이벤트 수신 핸들러 - DOM 조회 없이 상태 반영"""
+        if getattr(self, 'stop_all_processes', False) or not self.is_trading_active:
+            return
+        
+        if event.kind == BALANCE:
+            self.balance_service.apply_stream_balance(event.data["balance"])
+        elif event.kind in (BETTING_OPEN, BETTING_CLOSED):
+            self.betting_service.apply_stream_betting_state(event.kind == BETTING_OPEN, event.data.get("remaining"))
+        elif event.kind == ROUND_RESULT:
+            self.last_push_time = time.time()
+            self.logger.info(f"[WebSocket] 새 결과 수신: {event.data.get('result')} (라운드 {event.data.get('round')})")
+            self._request_analysis()
 
     def _handle_room_change(self):
         """방 이동 요청 처리 핸들러 - 중지 상태 확인 추가"""
@@ -319,26 +402,27 @@ class TradingManager:
                 
             self.logger.info("자동 매매 진행 중...")
             
-            # 초기 게임 분석
-            self.analyze_current_game()
-            
-            # 게임 모니터링 루프 설정
-            monitoring_interval = 2  # 2초마다 체크
-            self.main_window.set_remaining_time(0, 0, monitoring_interval)
+            # 게임 모니터링 코루틴 시작 (바로 첫 분석, 이후 결과 주기/푸시에 맞춰 분석)
+            self._analysis_thread.should_stop = False
+            self.engine.start()
 
         except Exception as e:
             self.logger.error(f"자동 매매 실행 중 오류 발생: {e}", exc_info=True)
             self.stop_trading()
             
-            QMessageBox.critical(
+            defer_dialog(
+                QMessageBox.critical,
                 self.main_window, 
                 "자동 매매 오류", 
                 f"자동 매매 중 심각한 오류가 발생했습니다.\n자동 매매가 중지됩니다.\n오류: {str(e)}"
             )
  
     def stop_trading(self):
-        """자동 매매 중지 - 스레드 안전하게 종료"""
-        from PyQt6.QtWidgets import QApplication
+        """자동 매매 중지 - 진행 중인 코루틴 취소"""
+        # 브라우저 스레드에서 호출되면 GUI 스레드에서 중지 (자기 자신을 기다리지 않도록)
+        if self._analysis_thread.is_executor_thread():
+            self.main_window.run_on_gui_thread(self.stop_trading)
+            return
         try:
             if not self.is_trading_active:
                 self.logger.info("자동 매매가 이미 중지된 상태입니다.")
@@ -346,39 +430,17 @@ class TradingManager:
                 
             self.logger.info("자동 매매 중지 중...")
             
-            # 중요: 먼저 중지 플래그 설정 - 모든 진행 중인 작업이 이를 확인해야 함
+            # 중지 플래그는 브라우저 스레드에서 실행 중인 명령(방 입장 대기 등)이 확인
             self.stop_all_processes = True
-            
-            # 실행 중인 모든 타이머 이벤트 취소
-            if hasattr(self.main_window, 'timer') and self.main_window.timer.isActive():
-                self.main_window.timer.stop()
-                # QApplication의 이벤트 큐 처리 강제
-                QApplication.processEvents()
-                self.logger.info("타이머 중지 및 이벤트 큐 처리 완료")
-            
-            # 1초 대기하여 진행 중인 작업들이 중지 플래그를 확인할 시간 제공
-            time.sleep(1)
-            
-            # 그 다음 trading_active 플래그 비활성화
             self.is_trading_active = False
             
-            # 방 이동 플래그 초기화
-            # self.should_move_to_next_room = False
-            
-            # 타이머 중지 - 분석 스레드 예약 중단
-            if hasattr(self.main_window, 'timer') and self.main_window.timer.isActive():
-                self.main_window.timer.stop()
-                self.logger.info("타이머 중지 완료")
-            
-            # 진행 중인 분석 스레드 중지
-            if hasattr(self, '_analysis_thread') and hasattr(self._analysis_thread, 'isRunning'):
-                if self._analysis_thread.isRunning():
-                    try:
-                        self.logger.info("진행 중인 분석 스레드 강제 종료")
-                        self._analysis_thread.terminate()  # 강제 종료
-                        self._analysis_thread.wait(1000)  # 최대 1초 대기
-                    except Exception as e:
-                        self.logger.warning(f"분석 스레드 종료 중 오류: {e}")
+            # 모니터링/베팅/방 이동 코루틴 즉시 취소 (대기 중인 브라우저 명령도 취소, 실행 중인 명령의 결과는 버림)
+            cancelled = self.engine.stop()
+            self._analysis_thread.cancel()
+            self.logger.info(f"진행 중인 매매 작업 {cancelled}개 취소")
+
+            # 방별 결과 주기 저장
+            self.cadence_store.save(force=True)
                         
             # 진행 중인 방 입장 스레드 중지
             if hasattr(self.room_entry_service, 'entry_thread') and self.room_entry_service.entry_thread:
@@ -393,6 +455,7 @@ class TradingManager:
             # 베팅 상태 초기화
             if hasattr(self, 'betting_service'):
                 self.betting_service.reset_betting_state()
+                self.betting_service.stream_betting_state = None
             
             # 마틴 서비스 초기화
             if hasattr(self, 'martin_service'):
@@ -408,17 +471,12 @@ class TradingManager:
             if hasattr(self, 'game_monitoring_service'):
                 if hasattr(self.game_monitoring_service, 'last_detected_count'):
                     self.game_monitoring_service.last_detected_count = 0
+                self.game_monitoring_service.reset_room_state()
+                self.parse_cache.invalidate()
                 if hasattr(self.game_monitoring_service, 'game_detector'):
                     from modules.game_detector import GameDetector
                     self.game_monitoring_service.game_detector = GameDetector()  # 새로운 인스턴스로 교체
             
-            # 중요: 이전에 예약된 타이머 이벤트를 모두 취소 (추가)
-            if hasattr(self.main_window, 'timer'):
-                if self.main_window.timer.isActive():
-                    self.main_window.timer.stop()
-                # 이벤트 큐 처리
-                QApplication.processEvents()
-            
             # 버튼 상태 업데이트
             self.main_window.start_button.setEnabled(True)
             self.main_window.stop_button.setEnabled(False)  # 중지 버튼 항상 비활성화
@@ -430,17 +488,16 @@ class TradingManager:
             # 목표 금액에 도달했는지 확인하여 메시지 표시 결정
             target_reached = hasattr(self.balance_service, '_target_amount_reached') and self.balance_service._target_amount_reached
             
-            # 목표 금액 도달로 인한 중지가 아닌 경우에만 메시지 표시
+            # 목표 금액 도달로 인한 중지가 아닌 경우에만 메시지 표시 (베팅/방 이동 코루틴에서 호출될 수 있으므로 미룸)
             if not target_reached:
-                QMessageBox.information(self.main_window, "알림", "자동 매매가 중지되었습니다.")
+                defer_dialog(QMessageBox.information, self.main_window, "알림", "자동 매매가 중지되었습니다.")
 
         except Exception as e:
             self.logger.error(f"자동 매매 중지 중 오류 발생: {e}", exc_info=True)
             
             # 강제 중지 시도
             self.is_trading_active = False
-            if hasattr(self.main_window, 'timer'):
-                self.main_window.timer.stop()
+            self.engine.stop()
                 
             # 게임 카운트 강제 초기화
             self.game_count = 0
@@ -452,7 +509,8 @@ class TradingManager:
             except:
                 pass
 
-            QMessageBox.warning(
+            defer_dialog(
+                QMessageBox.warning,
                 self.main_window, 
                 "중지 오류", 
                 f"자동 매매 중지 중 문제가 발생했습니다.\n수동으로 중지되었습니다."
@@ -477,6 +535,15 @@ class TradingManager:
                 self.logger.info("자동 매매 비활성화 상태로 방 이동 중단")
                 return False
 
+            # 베팅 중이면 베팅 확인 후 이동, 이미 이동 중이면 무시
+            if self.pending_action == ACTION_BET:
+                self.logger.info("베팅 진행 중 - 베팅 후 방 이동하도록 예약")
+                self._need_to_move_room = True
+                return False
+            if self.pending_action == ACTION_ROOM_CHANGE:
+                self.logger.info("이미 방 이동 중입니다.")
+                return False
+
             self.logger.info("방 이동 준비 중...")
             
             # 방 이동 시 중지 버튼 비활성화 (추가된 부분 - 방 이동 중에는 비활성화)
@@ -495,49 +562,55 @@ class TradingManager:
             # 방 이동 플래그 초기화
             # self.should_move_to_next_room = False
             
-            # 현재 방 닫기 시도
-            room_closed = self.game_monitoring_service.close_current_room()
-            if not room_closed:
-                self.logger.warning("현재 방을 닫는데 실패했습니다. 계속 진행합니다.")
-            
-            # Excel 파일 초기화
-            # try:
-            #     self.logger.info("Excel 파일 초기화 중...")
-            #     self.excel_trading_service.excel_manager.initialize_excel()
-            # except Exception as e:
-            #     self.logger.error(f"Excel 파일 초기화 오류: {e}")
-            
             try:
                 self.logger.info("예측 엔진 초기화 중...")
                 self.excel_trading_service.prediction_engine.clear()
-                # 게임 결과 초기화
-                self.recent_game_results = []
-                self.filtered_game_results = []
             except Exception as e:
                 self.logger.error(f"예측 엔진 초기화 오류: {e}")
             
             # 상태 초기화
             self.game_helper.reset_room_state()
             
-            # 새 방 입장
-            new_room_name = self.room_entry_service.enter_room()
-            
-            # 방 입장 실패 시 처리
-            if not new_room_name:
-                return self.game_helper.handle_room_entry_failure()
-            
-            self.just_changed_room = True  # 방 이동 직후 플래그 설정
-            return self.game_helper.handle_successful_room_entry(new_room_name)
+            # 현재 방 닫기와 새 방 입장은 방 이동 코루틴에서
+            return self.engine.run_action(ACTION_ROOM_CHANGE, self._change_room())
 
         except Exception as e:
             self.logger.error(f"방 이동 중 오류 발생: {e}", exc_info=True)
-            # 실패 시 중지 버튼 비활성화 (추가된 부분)
-            self.main_window.stop_button.setEnabled(False)
-            # 스타일 강제 업데이트 추가
-            self.main_window.update_button_styles()
-            self.logger.info("방 이동 실패: 중지 버튼 비활성화 상태 유지")
-            QMessageBox.warning(self.main_window, "경고", f"방 이동 실패")
+            self._handle_room_change_error()
             return False
+
+    def _change_room_in_browser(self):
+        """현재 방 닫기 및 새 방 입장 (브라우저 스레드) - 입장한 방 이름 또는 None 반환"""
+        room_closed = self.game_monitoring_service.close_current_room()
+        if not room_closed:
+            self.logger.warning("현재 방을 닫는데 실패했습니다. 계속 진행합니다.")
+        return self.room_entry_service.enter_room()
+
+    async def _change_room(self):
+        """방 이동 코루틴 - 현재 방 닫기, 새 방 입장 (실패 시 방문 큐를 리셋하고 다시 입장), 입장 후 처리"""
+        try:
+            new_room_name = await self.engine.browser(CMD_CHANGE_ROOM, self._change_room_in_browser)
+            
+            # 방 입장 실패 시 방문 큐 리셋 후 재시도
+            while not new_room_name:
+                if not self.room_manager.reset_visit_queue():
+                    return self.game_helper.handle_room_entry_failure()
+                new_room_name = await self.engine.browser(CMD_CHANGE_ROOM, self.room_entry_service.enter_room)
+        except Exception as e:
+            self.logger.error(f"방 이동 중 오류 발생: {e}", exc_info=True)
+            self._handle_room_change_error()
+            return False
+        
+        self.just_changed_room = True  # 방 이동 직후 플래그 설정
+        return await self.game_helper.handle_successful_room_entry(new_room_name)
+
+    def _handle_room_change_error(self):
+        # 실패 시 중지 버튼 비활성화 (추가된 부분)
+        self.main_window.stop_button.setEnabled(False)
+        # 스타일 강제 업데이트 추가
+        self.main_window.update_button_styles()
+        self.logger.info("방 이동 실패: 중지 버튼 비활성화 상태 유지")
+        defer_dialog(QMessageBox.warning, self.main_window, "경고", f"방 이동 실패")
         
     # utils/trading_manager.py에 설정 업데이트 메서드 추가
     def update_settings(self):
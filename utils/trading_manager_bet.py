@@ -1,8 +1,8 @@
 # utils/trading_manager_bet.py - 역배팅 및 Double/Half 동적 모드 개선
-import time
 import logging
-from PyQt6.QtWidgets import QApplication
 from utils.settings_manager import SettingsManager
+from utils.browser_executor import CMD_READ_BALANCE, CMD_PLACE_BET
+from utils.trading_engine import ACTION_BET
 
 class TradingManagerBet:
     """TradingManager의 베팅 관련 기능 클래스"""
@@ -13,10 +13,24 @@ class TradingManagerBet:
         self.logger = trading_manager.logger or logging.getLogger(__name__)
         
     def place_bet(self, pick_value, game_count):
+        """
+        베팅 요청 - 베팅 코루틴 실행 (결과는 코루틴에서 처리)
+
+        Returns:
+            bool: 베팅 시작 여부 (다른 베팅/방 이동이 진행 중이면 False)
+        """
+        if not self.tm.engine.run_action(ACTION_BET, self.bet(pick_value, game_count)):
+            self.logger.info(f"매매 작업 진행 중 ({self.tm.pending_action}) - 베팅 요청 무시")
+            return False
+        return True
+
+    async def bet(self, pick_value, game_count):
+        """베팅 코루틴 - 잔액 확인, 베팅 금액 결정, 베팅 (잔액 확인과 클릭은 브라우저 스레드에서)"""
         try:
             self.tm.refresh_settings()
 
-            balance = self.tm.balance_service.get_iframe_balance()
+            # 장부의 예상 잔액 사용 (N개 결과마다 / 차이 발생 / 목표 금액 근처에서만 iframe에서 읽음)
+            balance = await self.tm.engine.browser(CMD_READ_BALANCE, self.tm.balance_service.get_balance_for_bet)
             if balance:
                 self.tm.main_window.update_user_data(current_amount=balance)
                 if not self.tm.helpers.check_martin_balance(balance):
@@ -91,11 +105,11 @@ class TradingManagerBet:
             self.tm.main_window.update_betting_status(pick=original_pick, bet_amount=final_bet_amount)
             self.tm.main_window.stop_button.setEnabled(True)
             self.tm.main_window.update_button_styles()
-            QApplication.processEvents()
             self.logger.info("베팅 전: 중지 버튼 활성화")
 
-            # 실제 베팅 시도
-            bet_success = self.tm.betting_service.place_bet(
+            # 실제 베팅 시도 (브라우저 스레드)
+            bet_success = await self.tm.engine.browser(
+                CMD_PLACE_BET, self.tm.betting_service.place_bet,
                 pick_value,
                 self.tm.current_room_name,
                 game_count,
@@ -112,7 +126,6 @@ class TradingManagerBet:
                 self.tm.main_window.update_betting_status(pick=original_pick)
                 self.tm.main_window.stop_button.setEnabled(True)
                 self.tm.main_window.update_button_styles()
-                QApplication.processEvents()
                 self.logger.info("베팅 실패: 중지 버튼 다시 활성화")
 
             return bet_success
@@ -130,6 +143,9 @@ class TradingManagerBet:
             # self.tm.martin_service.has_bet_in_current_room = True
             # self.logger.info("베팅 성공: 한 방에서 한 번 배팅 완료 표시")
             
+            # 잔액 장부에 베팅 기록 (결과 시 정산)
+            self.tm.balance_service.record_bet(self.tm.betting_service.last_bet_type, bet_amount)
+            
             # 누적 배팅 금액 업데이트
             self.tm.martin_service.total_bet_amount += bet_amount
             if hasattr(self.tm.main_window, 'total_bet_amount'):
@@ -198,6 +214,7 @@ class TradingManagerBet:
 
             # 결과 마커 로그 및 처리 유지
             self.tm.result_count += 1
+            self.tm.balance_service.record_bet_result(result_status)
             self.tm.martin_service.process_bet_result(result_status, game_count=self.tm.game_count)
             self.tm.martin_service.update_bet_direction_by_diff(self.tm.game_count)
             
@@ -1,7 +1,10 @@
 # utils/trading_manager_game.py
 import time
 import logging
-from PyQt6.QtWidgets import QMessageBox,QApplication
+from PyQt6.QtWidgets import QMessageBox
+from utils.browser_executor import CMD_CHANGE_ROOM, CMD_PREPARE_ROOM, CMD_CLOSE_ROOM
+from utils.trading_engine import ACTION_BET, ACTION_ROOM_CHANGE
+from utils.async_bridge import defer_dialog
 
 class TradingManagerGame:
     """TradingManager의 게임 처리 관련 기능 클래스"""
@@ -26,12 +29,24 @@ class TradingManagerGame:
                 self.tm.game_monitoring_service.game_detector = GameDetector()
                 if hasattr(self.tm.game_monitoring_service, 'last_detected_count'):
                     self.tm.game_monitoring_service.last_detected_count = 0
+                self.tm.game_monitoring_service.reset_room_state()
+            if hasattr(self.tm, 'parse_cache'):
+                self.tm.parse_cache.invalidate()
             
             # 방문 순서 초기화
             self.tm.room_manager.generate_visit_order()
             
-            # 방 선택 및 입장
-            self.tm.current_room_name = self.tm.room_entry_service.enter_room()
+            # 방 선택 및 입장 (방 이동 코루틴)
+            return self.tm.engine.run_action(ACTION_ROOM_CHANGE, self._enter_first_room())
+        except Exception as e:
+            self.logger.error(f"첫 방 입장 오류: {e}")
+            self.tm.stop_trading()
+            return False
+
+    async def _enter_first_room(self):
+        """첫 방 입장 코루틴 - 입장 후 모니터링 시작"""
+        try:
+            self.tm.current_room_name = await self.tm.engine.browser(CMD_CHANGE_ROOM, self.tm.room_entry_service.enter_room)
             
             # 방 입장에 실패한 경우
             if not self.tm.current_room_name:
@@ -40,14 +55,15 @@ class TradingManagerGame:
                 
             # 방 입장 성공 시 중지 버튼 활성화 (추가된 부분)
             self.tm.main_window.stop_button.setEnabled(True)
-            
-            # 모니터링 타이머 설정
-            self.tm.main_window.set_remaining_time(0, 0, 2)
 
-            # 게임 정보 초기 분석
-            self.tm.analyze_current_game()
+            # 방 이동 때와 같이 요소 캐시와 WebSocket 수신 준비
+            await self.tm.engine.browser(CMD_PREPARE_ROOM, self._attach_room_in_browser)
+
+            # 이 방에서 학습한 결과 주기/위상으로 폴링
+            self.tm.round_cadence = self.tm.cadence_store.for_room(self.tm.current_room_name)
+            self.tm.last_push_time = 0
 
-            # 자동 매매 루프 시작
+            # 자동 매매 루프 시작 (이 코루틴이 끝나면 바로 첫 분석)
             self.tm.run_auto_trading()
             
             return True
@@ -57,30 +73,43 @@ class TradingManagerGame:
             return False
 
     def handle_room_entry_failure(self):
-        """방 입장 실패 처리"""
-        # 방문 큐 리셋
-        if self.tm.room_manager.reset_visit_queue():
-            # self.logger.info("방 입장 실패. 방문 큐를 리셋하고 다시 시도합니다.")
-            return self.tm.change_room()  # 재귀적으로 다시 시도
-        else:
-            # 방 입장 실패 시 중지 버튼 비활성화 (추가된 부분)
-            self.tm.main_window.stop_button.setEnabled(False)
-            self.tm.main_window.update_button_styles()
+        """방 입장 실패 처리 (방문 큐를 리셋해도 입장할 방이 없는 경우)"""
+        # 방 입장 실패 시 중지 버튼 비활성화 (추가된 부분)
+        self.tm.main_window.stop_button.setEnabled(False)
+        self.tm.main_window.update_button_styles()
 
-            self.tm.stop_trading()
-            QMessageBox.warning(self.tm.main_window, "오류", "체크된 방이 없거나 모든 방 입장에 실패했습니다.")
-            return False
+        self.tm.stop_trading()
+        defer_dialog(QMessageBox.warning, self.tm.main_window, "오류", "체크된 방이 없거나 모든 방 입장에 실패했습니다.")
+        return False
 
-    def handle_successful_room_entry(self, new_room_name):
-        """방 입장 성공 처리"""
+    async def handle_successful_room_entry(self, new_room_name):
+        """방 입장 성공 처리 (방 이동 코루틴에서 await)"""
         # 방 입장 성공 시 중지 버튼 활성화 (여기서 명시적으로 활성화)
         self.tm.main_window.stop_button.setEnabled(True)
         # 스타일 강제 업데이트 추가
         self.tm.main_window.update_button_styles()
-        QApplication.processEvents()  # 이벤트 처리 강제
 
         # 방 이동 후 로비에서 잔액 확인 (목표 금액 도달 먼저 체크)
-        if hasattr(self.tm, 'check_balance_after_room_change') and self.tm.check_balance_after_room_change:
+        check_balance = bool(getattr(self.tm, 'check_balance_after_room_change', False))
+        # 플래그 초기화
+        self.tm.check_balance_after_room_change = False
+
+        # 잔액 확인, 요소 캐시, 게임 상태 읽기는 브라우저 스레드에서
+        try:
+            prepared = await self.tm.engine.browser(CMD_PREPARE_ROOM, self._prepare_room_in_browser, check_balance)
+        except Exception as e:
+            self.logger.error(f"새 방 준비 오류: {e}")
+            return False
+        return self._apply_prepared_room(prepared, new_room_name)
+
+    def _prepare_room_in_browser(self, check_balance):
+        """
+        새 방 입장 직후 브라우저 작업 (브라우저 스레드)
+
+        Returns:
+            dict: {'target_reached': bool, 'game_state': dict 또는 None}
+        """
+        if check_balance:
             try:
                 balance = self.tm.balance_service.get_lobby_balance()
                 
@@ -91,18 +120,38 @@ class TradingManagerGame:
                     # 목표 금액 확인 - 도달했으면 즉시 종료
                     if self.tm.balance_service.check_target_amount(balance, source="방 이동 후 확인"):
                         # 방금 입장한 방에서도 나가기
-                        self.exit_current_game_room()
-                        self.tm.stop_trading()
-                        # 중요: 즉시 False 반환하여 추가 처리 방지
-                        self.tm.check_balance_after_room_change = False
-                        return False
-                
-                # 플래그 초기화
-                self.tm.check_balance_after_room_change = False
-                
+                        self._exit_room_in_browser()
+                        return {'target_reached': True, 'game_state': None}
             except Exception as e:
                 self.logger.error(f"방 이동 후 잔액 확인 오류: {e}")
-                self.tm.check_balance_after_room_change = False
+
+        self._attach_room_in_browser()
+
+        game_state = None
+        try:
+            # 목표 금액 도달 확인이 필요 없는 경우에만 게임 상태 확인
+            if not hasattr(self.tm.balance_service, '_target_amount_reached') or not self.tm.balance_service._target_amount_reached:
+                game_state = self.tm.game_monitoring_service.get_current_game_state(log_always=True)
+        except Exception as e:
+            self.logger.error(f"새 방 게임 상태 확인 오류: {e}")
+        return {'target_reached': False, 'game_state': game_state}
+
+    def _attach_room_in_browser(self):
+        """입장한 방의 요소 캐시와 WebSocket 수신 준비 (브라우저 스레드 - 첫 방 입장과 방 이동 공통)"""
+        # 방에 있는 동안 바뀌지 않는 요소(베팅 영역, 칩, 종료 버튼)를 한 번 찾아 캐시
+        self.tm.betting_service.resolve_room_elements()
+        self.tm.game_monitoring_service.resolve_room_elements()
+
+        # 게임 WebSocket 프레임 수신 (새 방 창/게임 iframe 세션으로 다시 연결)
+        if self.tm.USE_WS_INGEST:
+            self.tm.devtools.start_ws_ingest(self.tm.ws_ingest)
+
+    def _apply_prepared_room(self, prepared, new_room_name):
+        """새 방 준비 결과 반영 (GUI 스레드)"""
+        if prepared['target_reached']:
+            self.tm.stop_trading()
+            # 중요: 즉시 False 반환하여 추가 처리 방지
+            return False
 
         # 성공 여부 확인 - martin_service의 win_count로 판단
         was_successful = False
@@ -137,37 +186,38 @@ class TradingManagerGame:
             pick=""
         )
 
+        # 이 방에서 학습한 결과 주기/위상으로 폴링
+        self.tm.round_cadence = self.tm.cadence_store.for_room(new_room_name)
+        self.tm.last_push_time = 0
+
         # 게임 상태 확인 및 최근 결과 기록 (이하 코드 유지)
         try:
-            # 목표 금액 도달 확인이 필요 없는 경우에만 게임 상태 확인
-            if not hasattr(self.tm.balance_service, '_target_amount_reached') or not self.tm.balance_service._target_amount_reached:
-                game_state = self.tm.game_monitoring_service.get_current_game_state(log_always=True)
+            game_state = prepared['game_state']
+            if game_state:
+                # 중요: 실제 게임 카운트 저장
+                actual_game_count = game_state.get('round', 0)
+                self.tm.game_count = actual_game_count
                 
-                if game_state:
-                    # 중요: 실제 게임 카운트 저장
-                    actual_game_count = game_state.get('round', 0)
-                    self.tm.game_count = actual_game_count
-                    
-                    # Excel에 기록
-                    result = self.tm.excel_trading_service.process_game_results(
-                        game_state, 
-                        0,
-                        self.tm.current_room_name,
-                        log_on_change=True
-                    )
-                    
-                    if result[0] is not None:
-                        if result[3] in ['P', 'B']:  # next_pick
-                            self.tm.current_pick = result[3]
-                            
-                            # 즉시 배팅 유도
-                            self.tm._first_entry_time = time.time() - 5
-                            
-                            # UI에 PICK 값 표시
-                            self.tm.main_window.update_betting_status(
-                                pick=result[3],
-                                bet_amount=self.tm.martin_service.get_current_bet_amount()
-                            )
+                # Excel에 기록
+                result = self.tm.excel_trading_service.process_game_results(
+                    game_state, 
+                    0,
+                    self.tm.current_room_name,
+                    log_on_change=True
+                )
+                
+                if result[0] is not None:
+                    if result[3] in ['P', 'B']:  # next_pick
+                        self.tm.current_pick = result[3]
+                        
+                        # 즉시 배팅 유도
+                        self.tm._first_entry_time = time.time() - 5
+                        
+                        # UI에 PICK 값 표시
+                        self.tm.main_window.update_betting_status(
+                            pick=result[3],
+                            bet_amount=self.tm.martin_service.get_current_bet_amount()
+                        )
         except Exception as e:
             self.logger.error(f"새 방 최근 결과 기록 오류: {e}")
 
@@ -280,7 +330,7 @@ class TradingManagerGame:
                 self.tm.betting_service.has_bet_current_round = False
                 
                 # self.logger.info(f"무승부(T) 감지, 이전 PICK 값({self.tm.current_pick})으로 베팅 시도")
-                time.sleep(1.5)  # 대기 시간 단축
+                # 다음 라운드 베팅 가능 상태는 place_bet 안에서 칩 활성화를 확인하며 대기
                 
                 # 중요: TIE 결과 시에는 방 이동이 아닌 것을 표시 (is_new_visit=False)
                 if hasattr(self.tm.main_window, 'room_log_widget'):
@@ -290,16 +340,20 @@ class TradingManagerGame:
                         is_new_visit=False
                     )
 
-                bet_success = self.tm.bet_helper.place_bet(self.tm.current_pick, self.tm.game_count)
-                
-                if bet_success:
-                    # self.logger.info(f"TIE 이후 베팅 성공: {self.tm.current_pick}")
-                    pass
-                else:
-                    self.logger.warning(f"TIE 이후 베팅 실패. 다음 시도 예정")
-                    self.tm.main_window.set_remaining_time(0, 0, 1)
+                self.tm.engine.run_action(ACTION_BET, self._bet_after_tie(self.tm.current_pick, self.tm.game_count))
         except Exception as e:
             self.logger.error(f"TIE 결과 처리 오류: {e}")
+
+    async def _bet_after_tie(self, pick_value, game_count):
+        """TIE 이후 베팅 코루틴 - 실패하면 1초 뒤 다시 분석"""
+        bet_success = await self.tm.bet_helper.bet(pick_value, game_count)
+        
+        if bet_success:
+            # self.logger.info(f"TIE 이후 베팅 성공: {pick_value}")
+            pass
+        else:
+            self.logger.warning(f"TIE 이후 베팅 실패. 다음 시도 예정")
+            self.tm.engine.schedule_analysis(1)
                 
     def process_previous_game_result(self, game_state, new_game_count):
         try:
@@ -342,6 +396,16 @@ class TradingManagerGame:
             self.tm.main_window.update_button_styles()
             # self.logger.info("게임방 나가기: 중지 버튼 비활성화됨")
             
+            # 브라우저 작업은 브라우저 스레드에서
+            self.tm.browser_executor.submit(CMD_CLOSE_ROOM, self._exit_room_in_browser)
+            return True
+        except Exception as e:
+            self.logger.warning(f"방 나가기 중 오류 발생: {e}")
+            return False
+
+    def _exit_room_in_browser(self):
+        """게임방에 있으면 닫고 로비로 이동 (브라우저 스레드)"""
+        try:
             # 현재 URL 확인
             current_url = self.tm.devtools.driver.current_url
             
@@ -369,14 +433,24 @@ class TradingManagerGame:
         self.tm.result_count = 0
         self.tm.current_pick = None
         self.tm.betting_service.reset_betting_state()
+        # 이전 방 WebSocket으로 받은 베팅 시작/마감 상태는 새 방에 맞지 않음
+        self.tm.betting_service.stream_betting_state = None
         
         # 중요: 처리된 게임 결과 기록 초기화
         self.tm.processed_rounds = set()
         
+        # 이전 방의 결과 주기 저장 (새 방 추정기는 입장 시 교체)
+        if hasattr(self.tm, 'cadence_store'):
+            self.tm.cadence_store.save(force=True)
+        
         # 게임 모니터링 서비스 카운트 초기화 - 추가된 부분
         if hasattr(self.tm, 'game_monitoring_service'):
             if hasattr(self.tm.game_monitoring_service, 'last_detected_count'):
                 self.tm.game_monitoring_service.last_detected_count = 0
+            # 새 방에는 MutationObserver를 다시 설치해야 함
+            self.tm.game_monitoring_service.reset_room_state()
+            if hasattr(self.tm, 'parse_cache'):
+                self.tm.parse_cache.invalidate()
             if hasattr(self.tm.game_monitoring_service, 'game_detector'):
                 # 게임 감지기도 새로 초기화
                 from modules.game_detector import GameDetector
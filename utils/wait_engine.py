@@ -0,0 +1,167 @@
+# utils/wait_engine.py
+"""
+조건 기반 대기 엔진
+- 고정 time.sleep 대신 조건(DOM 상태, 창 개수, CDP로 조회한 요소 상태 등)을 짧은 간격으로 확인하다가
+  만족하는 즉시 반환하고, 마감 시간이 지나면 시간 초과로 반환
+- 대기마다 실제 소요 시간을 이름(label)별로 기록하여 어느 대기가 느린지 확인 가능 (wait_stats)
+- 중지 조건(stop)을 넘기면 자동 매매 중지 시 대기를 바로 끝냄
+"""
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class WaitResult:
+    """wait_until() 결과 (조건을 만족했으면 참)"""
+    __slots__ = ("label", "value", "elapsed", "timed_out", "stopped")
+
+    def __init__(self, label, value, elapsed, timed_out=False, stopped=False):
+        self.label = label
+        self.value = value  # 마지막으로 확인한 조건 값
+        self.elapsed = elapsed  # 실제 대기 시간 (초)
+        self.timed_out = timed_out
+        self.stopped = stopped
+
+    def __bool__(self):
+        return not self.timed_out and not self.stopped and bool(self.value)
+
+    def __repr__(self):
+        state = "timeout" if self.timed_out else "stopped" if self.stopped else "ok"
+        return f"WaitResult({self.label}, {state}, {self.elapsed * 1000:.0f}ms)"
+
+
+class WaitStats:
+    """대기 이름별 소요 시간 통계"""
+
+    def __init__(self):
+        self._stats = {}  # 이름 -> {'count', 'timeouts', 'total', 'max', 'last'}
+        self._lock = threading.Lock()
+
+    def record(self, result):
+        """대기 결과 기록"""
+        with self._lock:
+            stat = self._stats.setdefault(
+                result.label, {"count": 0, "timeouts": 0, "total": 0.0, "max": 0.0, "last": 0.0}
+            )
+            stat["count"] += 1
+            stat["total"] += result.elapsed
+            stat["max"] = max(stat["max"], result.elapsed)
+            stat["last"] = result.elapsed
+            if result.timed_out:
+                stat["timeouts"] += 1
+
+    def summary(self):
+        """
+        이름별 통계
+
+        Returns:
+            dict: {이름: {'count', 'timeouts', 'avg_ms', 'max_ms', 'last_ms'}}
+        """
+        with self._lock:
+            return {
+                label: {
+                    "count": stat["count"],
+                    "timeouts": stat["timeouts"],
+                    "avg_ms": round(stat["total"] / stat["count"] * 1000, 1),
+                    "max_ms": round(stat["max"] * 1000, 1),
+                    "last_ms": round(stat["last"] * 1000, 1),
+                }
+                for label, stat in self._stats.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+# 프로세스 전체에서 공유하는 대기 통계
+wait_stats = WaitStats()
+
+
+def wait_until(predicate, timeout=5.0, interval=0.1, label="wait", stop=None, log_timeout=True):
+    """
+    조건이 참이 될 때까지 대기
+
+    Args:
+        predicate (callable): 인자 없이 호출하는 조건 함수 (예외는 False로 간주)
+        timeout (float): 최대 대기 시간 (초)
+        interval (float): 확인 간격 (초)
+        label (str): 통계/로그용 대기 이름
+        stop (callable, optional): 참을 반환하면 대기 중단 (자동 매매 중지 등)
+        log_timeout (bool): 시간 초과 시 디버그 로그 출력 여부
+
+    Returns:
+        WaitResult: 조건을 만족하면 참 (value에 조건 함수의 마지막 반환값)
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    value = None
+
+    while True:
+        try:
+            value = predicate()
+        except Exception:
+            value = None
+
+        now = time.monotonic()
+        if value:
+            result = WaitResult(label, value, now - started)
+            break
+        if stop is not None and stop():
+            result = WaitResult(label, value, now - started, stopped=True)
+            break
+        if now >= deadline:
+            result = WaitResult(label, value, now - started, timed_out=True)
+            if log_timeout:
+                logger.debug(f"대기 시간 초과: {label} ({timeout}초)")
+            break
+        time.sleep(min(interval, max(deadline - now, 0)))
+
+    wait_stats.record(result)
+    return result
+
+
+# ----------------------------------------------------------------------
+# 자주 쓰는 조건
+# ----------------------------------------------------------------------
+def document_ready(driver):
+    """현재 문서(프레임) 로드 완료 조건"""
+    return lambda: driver.execute_script("return document.readyState") == "complete"
+
+
+def new_window_opened(driver, known_handles):
+    """known_handles에 없는 새 창이 열렸는지 확인하는 조건 (새 창 핸들 반환)"""
+    known = set(known_handles)
+
+    def check():
+        for handle in driver.window_handles:
+            if handle not in known:
+                return handle
+        return None
+    return check
+
+
+def element_present(driver, selectors, displayed=False):
+    """선택자 중 하나로 요소를 찾을 수 있는지 확인하는 조건 (찾은 요소 반환)"""
+    if isinstance(selectors, str):
+        selectors = [selectors]
+
+    def check():
+        for selector in selectors:
+            for element in driver.find_elements("css selector", selector):
+                if not displayed or element.is_displayed():
+                    return element
+        return None
+    return check
+
+
+def page_left(driver, url, frame_selector="iframe"):
+    """
+    url을 떠났거나 frame_selector iframe이 사라졌는지 확인하는 조건 (방 종료 후 게임 화면이 닫혔는지 등)
+    드라이버가 기본 프레임(default_content)에 있어야 합니다.
+    """
+    def check():
+        return driver.current_url != url or not driver.find_elements("css selector", frame_selector)
+    return check
@@ -0,0 +1,394 @@
+# utils/ws_frame_ingest.py
+"""
+게임 WebSocket 프레임 수신 (DOM 조회 없는 상태 수집)
+- 게임 탭(또는 게임 iframe 타깃)에서 CDP Network.webSocketFrameReceived 이벤트를 받아
+  디코더로 게임 이벤트(라운드 결과, 잔액, 베팅 시작/마감)로 변환 후 Qt 신호로 전달
+- 디코더는 교체 가능: decode(payload, url) -> [GameEvent, ...] 형태의 호출 가능 객체
+  (기본 JsonFrameDecoder는 JSON/socket.io 메시지의 종류 이름과 필드 이름으로 추정)
+- 수신 프레임을 JSONL로 기록하고 replay()로 브라우저 없이 다시 흘려보내거나,
+  serve_frames()로 로컬 WebSocket 서버에서 재생하여 디코더를 확인할 수 있음
+
+사용법 (기록한 프레임 확인):
+    python utils/ws_frame_ingest.py decode frames.jsonl
+    python utils/ws_frame_ingest.py serve frames.jsonl --port 8765
+"""
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import re
+import sys
+import threading
+import time
+from PyQt6.QtCore import QObject, pyqtSignal
+
+try:
+    import websockets
+except ImportError:  # 로컬 재생 서버(serve_frames)에서만 필요
+    websockets = None
+
+# 게임 이벤트 종류
+ROUND_RESULT = "round_result"  # data: {'result': 'P'/'B'/'T', 'round': 번호 또는 None}
+BALANCE = "balance"  # data: {'balance': int}
+BETTING_OPEN = "betting_open"  # data: {'remaining': 초 또는 None}
+BETTING_CLOSED = "betting_closed"  # data: {}
+
+
+class GameEvent:
+    """WebSocket 메시지에서 얻은 게임 이벤트"""
+    __slots__ = ("kind", "data", "url", "timestamp")
+
+    def __init__(self, kind, data=None, url=None, timestamp=None):
+        self.kind = kind
+        self.data = data or {}
+        self.url = url
+        self.timestamp = timestamp if timestamp is not None else time.time()
+
+    def __repr__(self):
+        return f"GameEvent({self.kind}, {self.data})"
+
+
+class JsonFrameDecoder:
+    """
+    JSON 메시지 기본 디코더
+    - 메시지 종류(type/event 등 필드, socket.io는 배열 첫 요소)를 소문자로 바꾸어 키워드로 이벤트 판단
+    - 값은 메시지 안(중첩 포함)에서 필드 이름으로 찾음
+    사이트마다 프로토콜이 다르므로 키워드를 넘기거나 다른 디코더로 교체하여 사용
+    """
+
+    TYPE_KEYS = ("type", "event", "method", "action", "t")
+    KIND_KEYWORDS = (
+        (BETTING_CLOSED, ("bettingclosed", "betsclosed", "bets.closed", "nomorebets", "betting_closed")),
+        (BETTING_OPEN, ("bettingstarted", "betsopen", "bets.open", "bettingopen", "betting_open")),
+        (ROUND_RESULT, ("gameresult", "roundresult", "game_result", "resolved", "winner")),
+        (BALANCE, ("balance",)),
+    )
+    RESULT_KEYS = ("winner", "result", "outcome")
+    RESULT_VALUES = {"player": "P", "p": "P", "banker": "B", "b": "B", "tie": "T", "t": "T"}
+    ROUND_KEYS = ("round", "gameNumber", "roundNumber", "gameId")
+    BALANCE_KEYS = ("balance", "amount", "value")
+    REMAINING_KEYS = ("remaining", "timeLeft", "countdown", "seconds")
+    MAX_DEPTH = 4
+
+    def __init__(self, kind_keywords=None):
+        """
+        Args:
+            kind_keywords (tuple, optional): ((이벤트 종류, (키워드, ...)), ...) - 앞의 항목 우선
+        """
+        self.kind_keywords = kind_keywords or self.KIND_KEYWORDS
+
+    def __call__(self, payload, url=None):
+        message = self._parse(payload)
+        if message is None:
+            return []
+
+        type_name, body = self._split(message)
+        if not type_name:
+            return []
+        type_name = type_name.lower()
+
+        for kind, keywords in self.kind_keywords:
+            if any(keyword in type_name for keyword in keywords):
+                data = self._extract(kind, body)
+                return [GameEvent(kind, data, url)] if data is not None else []
+        return []
+
+    @staticmethod
+    def _parse(payload):
+        """JSON 또는 socket.io('42[...]') 메시지 해석"""
+        if isinstance(payload, bytes):
+            try:
+                payload = payload.decode("utf-8")
+            except UnicodeDecodeError:
+                return None
+        text = re.sub(r"^\d+", "", payload.strip()) if payload else ""
+        if not text or text[0] not in "[{":
+            return None
+        try:
+            return json.loads(text)
+        except ValueError:
+            return None
+
+    def _split(self, message):
+        """(메시지 종류, 본문)"""
+        if isinstance(message, list):
+            if message and isinstance(message[0], str):
+                return message[0], message[1] if len(message) > 1 else {}
+            return None, None
+        if isinstance(message, dict):
+            for key in self.TYPE_KEYS:
+                if isinstance(message.get(key), str):
+                    return message[key], message
+        return None, None
+
+    def _find(self, value, keys, depth=0):
+        """중첩된 dict/list에서 keys 중 하나의 값 찾기"""
+        if depth > self.MAX_DEPTH:
+            return None
+        if isinstance(value, dict):
+            for key in keys:
+                if key in value and not isinstance(value[key], (dict, list)):
+                    return value[key]
+            children = value.values()
+        elif isinstance(value, list):
+            children = value
+        else:
+            return None
+        for child in children:
+            found = self._find(child, keys, depth + 1)
+            if found is not None:
+                return found
+        return None
+
+    def _extract(self, kind, body):
+        """이벤트 종류별 데이터 추출 (필요한 값이 없으면 None)"""
+        if kind == ROUND_RESULT:
+            winner = self._find(body, self.RESULT_KEYS)
+            result = self.RESULT_VALUES.get(str(winner).lower()) if winner is not None else None
+            if result is None:
+                return None
+            return {"result": result, "round": self._find(body, self.ROUND_KEYS)}
+        if kind == BALANCE:
+            balance = self._find(body, self.BALANCE_KEYS)
+            try:
+                return {"balance": int(float(balance))}
+            except (TypeError, ValueError):
+                return None
+        if kind == BETTING_OPEN:
+            remaining = self._find(body, self.REMAINING_KEYS)
+            return {"remaining": remaining if isinstance(remaining, (int, float)) else None}
+        return {}
+
+
+class WebSocketFrameIngest(QObject):
+    """CDP WebSocket 프레임 → 디코더 → Qt 신호"""
+    # GameEvent (CDP 이벤트 스레드에서 발생, 메인 스레드 슬롯으로 전달)
+    event_received = pyqtSignal(object)
+
+    def __init__(self, decoder=None, logger=None, url_filter=None):
+        """
+        Args:
+            decoder (callable, optional): decode(payload, url) -> [GameEvent, ...] (기본 JsonFrameDecoder)
+                                          binary 속성이 참이면 바이너리 프레임도 bytes로 전달
+            logger (logging.Logger, optional): 로거
+            url_filter (str, optional): 이 문자열이 URL에 포함된 WebSocket만 처리 (URL을 모르면 처리)
+        """
+        super().__init__()
+        self.logger = logger or logging.getLogger(__name__)
+        self.decoder = decoder or JsonFrameDecoder()
+        self.url_filter = url_filter
+
+        self._cdp = None
+        self._session_id = None
+        self._urls = {}  # requestId -> WebSocket URL
+        self._record_file = None
+        self._record_lock = threading.Lock()
+
+        self.frames = 0
+        self.events = 0
+        self.errors = 0
+        self.last_event_time = 0
+
+    @property
+    def is_attached(self):
+        return self._cdp is not None
+
+    def attach(self, cdp, session_id):
+        """
+        CDP 세션(게임 탭 또는 게임 iframe 타깃)의 WebSocket 프레임 수신 시작
+
+        Returns:
+            bool: 성공 여부
+        """
+        if self._cdp is cdp and self._session_id == session_id:
+            return True
+        self.detach()
+        try:
+            cdp.run(cdp.send("Network.enable", {}, session_id))
+        except Exception as e:
+            self.logger.warning(f"WebSocket 프레임 수신 시작 실패: {e}")
+            return False
+
+        self._cdp = cdp
+        self._session_id = session_id
+        self._urls = {}
+        cdp.add_listener("Network.webSocketCreated", self._on_created)
+        cdp.add_listener("Network.webSocketFrameReceived", self._on_frame)
+        self.logger.info("WebSocket 프레임 수신 시작")
+        return True
+
+    def detach(self):
+        """프레임 수신 중지"""
+        cdp, self._cdp = self._cdp, None
+        if cdp is None:
+            return
+        cdp.remove_listener("Network.webSocketCreated", self._on_created)
+        cdp.remove_listener("Network.webSocketFrameReceived", self._on_frame)
+        try:
+            if cdp.is_connected:
+                cdp.run(cdp.send("Network.disable", {}, self._session_id), timeout=2)
+        except Exception:
+            pass
+        self._session_id = None
+
+    def _on_created(self, message):
+        """Network.webSocketCreated 처리 (URL 기록)"""
+        if message.get("sessionId") != self._session_id:
+            return
+        params = message.get("params", {})
+        self._urls[params.get("requestId")] = params.get("url", "")
+
+    def _on_frame(self, message):
+        """Network.webSocketFrameReceived 처리 (CDP 이벤트 스레드에서 호출)"""
+        if message.get("sessionId") != self._session_id:
+            return
+        params = message.get("params", {})
+        url = self._urls.get(params.get("requestId"))
+        if self.url_filter and url is not None and self.url_filter not in url:
+            return
+
+        response = params.get("response", {})
+        opcode = response.get("opcode", 1)
+        payload = response.get("payloadData", "")
+        self._record(url, opcode, payload)
+
+        if opcode == 2:
+            if not getattr(self.decoder, "binary", False):
+                return
+            try:
+                payload = base64.b64decode(payload)
+            except ValueError:
+                return
+        elif opcode != 1:
+            return
+        self.feed(payload, url)
+
+    def feed(self, payload, url=None):
+        """
+        메시지 1개를 디코딩하여 이벤트 발생 (CDP 수신, 기록 재생 공용)
+
+        Returns:
+            list: 발생한 GameEvent 목록
+        """
+        self.frames += 1
+        try:
+            events = list(self.decoder(payload, url) or ())
+        except Exception as e:
+            self.errors += 1
+            self.logger.debug(f"WebSocket 메시지 디코딩 오류: {e}")
+            return []
+
+        for event in events:
+            self.events += 1
+            self.last_event_time = event.timestamp
+            self.event_received.emit(event)
+        return events
+
+    # ------------------------------------------------------------------
+    # 기록 / 재생
+    # ------------------------------------------------------------------
+    def start_recording(self, path):
+        """수신 프레임을 JSONL로 기록 (replay/serve_frames 입력)"""
+        self.stop_recording()
+        with self._record_lock:
+            self._record_file = open(path, "a", encoding="utf-8")
+        self.logger.info(f"WebSocket 프레임 기록 시작: {path}")
+
+    def stop_recording(self):
+        with self._record_lock:
+            if self._record_file is not None:
+                self._record_file.close()
+                self._record_file = None
+
+    def _record(self, url, opcode, payload):
+        with self._record_lock:
+            if self._record_file is None:
+                return
+            record = {"t": time.time(), "url": url, "opcode": opcode, "payload": payload}
+            self._record_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._record_file.flush()
+
+    def stats(self):
+        return {
+            "attached": self.is_attached,
+            "frames": self.frames,
+            "events": self.events,
+            "errors": self.errors,
+            "last_event_time": self.last_event_time,
+        }
+
+
+def load_frames(path):
+    """기록한 프레임 JSONL 읽기 (텍스트 프레임만)"""
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if record.get("opcode", 1) == 1:
+                yield record
+
+
+def replay(path, target):
+    """
+    기록한 프레임을 브라우저 없이 다시 처리
+
+    Args:
+        path (str): 프레임 JSONL 경로
+        target: WebSocketFrameIngest (신호 발생) 또는 디코더 (이벤트만 반환)
+
+    Returns:
+        list: 발생한 GameEvent 목록
+    """
+    events = []
+    for record in load_frames(path):
+        if isinstance(target, WebSocketFrameIngest):
+            events.extend(target.feed(record["payload"], record.get("url")))
+        else:
+            events.extend(target(record["payload"], record.get("url")) or ())
+    return events
+
+
+async def serve_frames(path, host="127.0.0.1", port=8765, speed=1.0):
+    """
+    기록한 프레임을 보내는 로컬 WebSocket 서버 (게임 서버 대용)
+    테스트 페이지가 ws://host:port 에 연결하면 기록 시각 간격(speed 배속)대로 프레임을 전송
+    """
+    if websockets is None:
+        raise RuntimeError("websockets 패키지가 필요합니다.")
+    records = list(load_frames(path))
+
+    async def handler(websocket, *_):
+        previous = None
+        for record in records:
+            if previous is not None and speed > 0:
+                await asyncio.sleep(max(record.get("t", previous) - previous, 0) / speed)
+            previous = record.get("t", previous)
+            await websocket.send(record["payload"])
+
+    async with websockets.serve(handler, host, port):
+        print(f"[INFO] 프레임 재생 서버 시작: ws://{host}:{port} ({len(records)}개)")
+        await asyncio.Future()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="기록한 게임 WebSocket 프레임 확인")
+    arg_parser.add_argument("command", choices=("decode", "serve"), help="decode: 이벤트 출력, serve: 로컬 재생 서버")
+    arg_parser.add_argument("frames", help="프레임 JSONL 경로")
+    arg_parser.add_argument("--port", type=int, default=8765)
+    arg_parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (0이면 대기 없이 전송)")
+    args = arg_parser.parse_args(argv)
+
+    if args.command == "decode":
+        for event in replay(args.frames, JsonFrameDecoder()):
+            print(json.dumps({"kind": event.kind, "data": event.data, "url": event.url}, ensure_ascii=False))
+        return 0
+
+    asyncio.run(serve_frames(args.frames, port=args.port, speed=args.speed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())